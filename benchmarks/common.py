@@ -0,0 +1,138 @@
+from __future__ import annotations
+from datetime import datetime as dt
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Callable
+
+
+NUM_ALLOCATION_COUNTS: int = 3
+
+
+def count_allocations(func: Callable[[], Any]) -> tuple[int, int]:
+    """Count the memory blocks allocated while running a function.
+
+    Args:
+        func (Callable[[], Any]): function to run.
+
+    Returns:
+        tuple[int, int]: the cumulative number of allocated blocks, including the ones freed before `func` returns,
+        and the number of blocks retained by the return value of `func`.
+
+    NOTE:
+        `sys.getallocatedblocks()` is sampled at every call and return of Python and C functions,
+        and its increases are summed up. So blocks which are allocated and freed between two calls are not counted,
+        i.e. the cumulative number is a lower bound.
+    """  # noqa
+    total: int = 0
+    start = last = sys.getallocatedblocks()
+
+    def profile(frame, event, arg):
+        nonlocal total, last
+        blocks = sys.getallocatedblocks()
+        if blocks > last:
+            total += blocks - last
+        last = blocks
+
+    sys.setprofile(profile)
+    try:
+        ret = func()
+    finally:
+        sys.setprofile(None)
+    blocks = sys.getallocatedblocks()
+    total += max(blocks - last, 0)
+    retained = blocks - start
+    del ret
+    return total, retained
+
+
+def measure(
+    func: Callable[[], Any],
+    num_operations: int,
+    repeat: int = 20,
+    setup: Callable[[], None] | None = None,
+) -> dict[str, float]:
+    """Measure the time and the number of allocated memory blocks per operation.
+
+    Args:
+        func (Callable[[], Any]): function which executes `num_operations` operations.
+        num_operations (int): the number of operations executed by one call of `func`.
+        repeat (int, optional): the number of calls of `func` for timing. Defaults to 20.
+        setup (Callable[[], None] | None, optional): function called before each call of `func`. It is not measured. Defaults to None.
+
+    Returns:
+        dict[str, float]: `ns_per_op` (median), `min_ns_per_op`, `allocations_per_op` and `retained_blocks_per_op`.
+
+    NOTE:
+        `allocations_per_op` counts every memory block allocated by the operations, including transient ones
+        such as a copy made and discarded per keystroke. See `count_allocations`.
+        `retained_blocks_per_op` only counts the blocks still alive with the return value of `func`.
+        The allocations are counted in separate calls from timing because the profiling slows down `func`.
+    """  # noqa
+    elapsed_times: list[int] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start_time = time.perf_counter_ns()
+        ret = func()
+        elapsed_times.append(time.perf_counter_ns() - start_time)
+        del ret
+
+    allocations: list[int] = []
+    retained_blocks: list[int] = []
+    for _ in range(min(repeat, NUM_ALLOCATION_COUNTS)):
+        if setup is not None:
+            setup()
+        allocation, retained = count_allocations(func)
+        allocations.append(allocation)
+        retained_blocks.append(retained)
+
+    return {
+        "ns_per_op": statistics.median(elapsed_times) / num_operations,
+        "min_ns_per_op": min(elapsed_times) / num_operations,
+        "allocations_per_op": statistics.median(allocations) / num_operations,
+        "retained_blocks_per_op": max(statistics.median(retained_blocks), 0) / num_operations,
+    }
+
+
+def build_result(name: str, cases: list[dict[str, Any]]) -> dict[str, Any]:
+    from simple_typing_application import __version__
+
+    return {
+        "benchmark": name,
+        "version": __version__,
+        "python": sys.version,
+        "platform": platform.platform(),
+        "timestamp": dt.now().isoformat(),
+        "cases": cases,
+    }
+
+
+def print_result(result: dict[str, Any], baseline: dict[str, Any] | None = None) -> None:
+    """Print a benchmark result. If baseline is given, also print the ratio to it."""
+    baseline_cases = {(c["case"], c["target"]): c for c in (baseline or {}).get("cases", [])}
+    print(
+        "allocs/op: memory blocks allocated per operation, including the ones freed before it finishes. "
+        "retained/op: memory blocks still alive with the result."
+    )
+    for case in result["cases"]:
+        line = (
+            f"{case['case']:<24} {case['target']:<16} {case['ns_per_op']:>12.1f} ns/op "
+            f"{case['allocations_per_op']:>8.2f} allocs/op {case.get('retained_blocks_per_op', 0.0):>8.2f} retained/op"
+        )
+        base = baseline_cases.get((case["case"], case["target"]))
+        if base is not None and base["ns_per_op"] > 0:
+            line += f"  (x{case['ns_per_op'] / base['ns_per_op']:.2f} vs {baseline['version']})"  # type: ignore
+        print(line)
+
+
+def save_result(result: dict[str, Any], path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=4, ensure_ascii=False)
+
+
+def load_result(path: str) -> dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)  # type: ignore
@@ -0,0 +1,114 @@
+"""Microbenchmark of the normalization of kana texts before the romaji expansion.
+
+Compares the normalization of each chunk with tables built per chunk, which was done before,
+with the normalization of the whole sentence with the tables built at import.
+Also compares the pipelines which build typing targets via intermediate lists and in a single pass.
+
+Usage:
+    python -m benchmarks.kana_normalization [--output result.json] [--baseline previous_result.json]
+"""
+
+from __future__ import annotations
+import logging
+from typing import Any
+
+import click
+
+from simple_typing_application.sentence_generator.utils import (
+    clear_expansion_cache,
+    iter_typing_target,
+    normalize_kana_text,
+    split_hiraganas_alphabets_symbols,
+    splitted_hiraganas_alphabets_symbols_to_typing_target,
+)
+
+from .common import build_result, load_result, measure, print_result, save_result
+
+
+TARGETS: dict[str, str] = {
+    "realistic": "きょうははれています。あしたはあめがふるかもしれません。",
+    "symbol_heavy": "「ちょっとまって」、「いっしょにいこう！」・・・ー。",
+    "zenkaku_ascii": "ＨＥＬＬＯ、ＷＯＲＬＤ！ １２３４５ ｄｉｇｉｔｓ。",
+    "long_passage": "きょうははれています。あしたはあめがふるかもしれません。" * 100,
+}
+NUM_SENTENCES: int = 100
+
+
+def _normalize_per_chunk(splitted: list[str]) -> list[str]:
+    # NOTE: the previous implementation, which built the translation tables for each chunk.
+    return [
+        pattern.translate(
+            str.maketrans(
+                "#　！＂＃＄％＆＇（）＊＋，－．／０１２３４５６７８９：；＜＝＞？＠ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺ［＼］＾＿｀ａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ｛｜｝～￥",  # noqa
+                "# !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¥",  # noqa
+            )
+        ).translate(str.maketrans("、。・「」ー", ",./[]-"))
+        for pattern in splitted
+    ]
+
+
+def _benchmark_target(name: str, text: str, repeat: int) -> list[dict[str, Any]]:
+    sentences = [text] * NUM_SENTENCES
+
+    def run_normalize_per_chunk():
+        return [_normalize_per_chunk(split_hiraganas_alphabets_symbols(s)) for s in sentences]
+
+    def run_normalize_per_sentence():
+        return [split_hiraganas_alphabets_symbols(normalize_kana_text(s)) for s in sentences]
+
+    def run_typing_target_per_chunk():
+        return [
+            splitted_hiraganas_alphabets_symbols_to_typing_target(split_hiraganas_alphabets_symbols(s))
+            for s in sentences
+        ]
+
+    def run_typing_target_per_sentence():
+        return [
+            splitted_hiraganas_alphabets_symbols_to_typing_target(
+                split_hiraganas_alphabets_symbols(normalize_kana_text(s)),
+                normalized=True,
+            )
+            for s in sentences
+        ]
+
+    def run_pipeline_streaming():
+        return [
+            [list(alternatives) for _, alternatives in iter_typing_target(normalize_kana_text(s), normalized=True)]
+            for s in sentences
+        ]
+
+    # NOTE: the expansion cache is warmed up so that only the normalization differs.
+    clear_expansion_cache()
+    run_typing_target_per_chunk()
+
+    return [
+        {"case": case, "target": name, "num_sentences": NUM_SENTENCES, **measure(func, NUM_SENTENCES, repeat=repeat)}
+        for case, func in [
+            ("normalize_per_chunk", run_normalize_per_chunk),
+            ("normalize_per_sentence", run_normalize_per_sentence),
+            ("pipeline_per_chunk", run_typing_target_per_chunk),
+            ("pipeline_per_sentence", run_typing_target_per_sentence),
+            ("pipeline_streaming", run_pipeline_streaming),
+        ]
+    ]
+
+
+@click.command()
+@click.option("--output", "-o", default=None, help="path to save the result as JSON.")
+@click.option("--baseline", "-b", default=None, help="path to a previous result to compare with.")
+@click.option("--repeat", "-r", default=20, type=int, help="the number of repetitions. Defaults to 20.")
+def main(output: str | None, baseline: str | None, repeat: int):
+    logging.basicConfig(level=logging.ERROR)
+
+    cases: list[dict[str, Any]] = []
+    for name, text in TARGETS.items():
+        cases.extend(_benchmark_target(name, text, repeat))
+
+    result = build_result("kana_normalization", cases)
+    print_result(result, load_result(baseline) if baseline else None)
+    if output:
+        save_result(result, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Benchmark of the kana readers, i.e. kanji-to-kana conversion backends.
+
+Compares the offline dictionary backend with the excelapi backend, which requests a local stand-in server
+so that the benchmark runs offline and measures the overhead of HTTP without the latency of the internet.
+Set `--latency-ms` to emulate the latency of the real service.
+
+Usage:
+    python -m benchmarks.kana_reader [--output result.json] [--baseline previous_result.json] [--latency-ms 0]
+"""  # noqa
+
+from __future__ import annotations
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import logging
+from threading import Thread
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import click
+
+from simple_typing_application.kana_reader.dictionary_kana_reader import DictionaryKanaReader
+from simple_typing_application.kana_reader.excelapi_kana_reader import ExcelapiKanaReader
+from simple_typing_application.utils.http_client import aclose_async_client, close_http_clients
+
+from .common import build_result, load_result, measure, print_result, save_result
+
+
+SENTENCES: list[str] = [
+    "これはサンプルの文章です。",
+    "今日は天気が良いので、友達と公園に行きました。",
+    "明日は雨が降るかもしれません。",
+    "日本語の文章を速く正確に入力する練習をしましょう。",
+    "彼は東京の大学で科学を研究している。",
+    "毎朝コーヒーを飲みながら新聞を読みます。",
+    "週末は家族と一緒に映画を見に行く予定です。",
+    "この問題は簡単ではないので、先生に質問してください。",
+]
+NUM_SENTENCES: int = 100
+
+
+def _start_stand_in_server(reader: DictionaryKanaReader, latency_sec: float) -> ThreadingHTTPServer:
+    # NOTE: a stand-in of excelapi.org which answers the readings by the dictionary backend.
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # NOTE: keep-alive
+        disable_nagle_algorithm = True  # NOTE: otherwise the body waits for the delayed ACK of the headers.
+
+        def do_GET(self):
+            text = parse_qs(urlparse(self.path).query).get("text", [""])[0]
+            if latency_sec > 0:
+                time.sleep(latency_sec)
+            body = reader.read(text).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@click.command()
+@click.option("--output", "-o", default=None, help="path to save the result as JSON.")
+@click.option("--baseline", "-b", default=None, help="path to a previous result to compare with.")
+@click.option("--repeat", "-r", default=5, type=int, help="the number of repetitions. Defaults to 5.")
+@click.option(
+    "--latency-ms", "-l", default=0.0, type=float, help="latency of the stand-in server in milliseconds. Defaults to 0."
+)  # noqa
+def main(output: str | None, baseline: str | None, repeat: int, latency_ms: float):
+    logging.basicConfig(level=logging.ERROR)
+
+    texts = (SENTENCES * (NUM_SENTENCES // len(SENTENCES) + 1))[:NUM_SENTENCES]
+    dictionary_reader = DictionaryKanaReader()
+    server = _start_stand_in_server(DictionaryKanaReader(), latency_ms / 1000)
+    # NOTE: the stand-in server is local, so that the requests are not rate-limited.
+    excelapi_reader = ExcelapiKanaReader(
+        rate_limiter=None,
+        url=f"http://127.0.0.1:{server.server_address[1]}/kanji2kana",
+    )
+
+    # NOTE: the backends must agree, otherwise the comparison is meaningless.
+    expected = [dictionary_reader.read(text) for text in texts]
+    assert [excelapi_reader.read(text) for text in texts] == expected
+
+    async def read_async_all() -> list[str]:
+        readings = [await excelapi_reader.read_async(text) for text in texts]
+        await aclose_async_client()
+        return readings
+
+    cases: list[dict[str, Any]] = []
+    for case, func, num_operations in [
+        ("dictionary_load", lambda: DictionaryKanaReader(), 1),
+        ("dictionary_read", lambda: [dictionary_reader.read(text) for text in texts], len(texts)),
+        ("excelapi_read", lambda: [excelapi_reader.read(text) for text in texts], len(texts)),
+        ("excelapi_read_async", lambda: asyncio.run(read_async_all()), len(texts)),
+    ]:
+        cases.append(
+            {
+                "case": case,
+                "target": f"latency_{latency_ms:g}ms",
+                "num_sentences": num_operations,
+                **measure(func, num_operations, repeat=repeat),
+            }
+        )
+
+    server.shutdown()
+    close_http_clients()
+
+    result = build_result("kana_reader", cases)
+    print_result(result, load_result(baseline) if baseline else None)
+    if output:
+        save_result(result, output)
+
+
+if __name__ == "__main__":
+    main()
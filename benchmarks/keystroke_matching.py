@@ -0,0 +1,154 @@
+"""Microbenchmark of the keystroke matching hot path.
+
+Usage:
+    python -m benchmarks.keystroke_matching [--output result.json] [--baseline previous_result.json]
+"""
+
+from __future__ import annotations
+import logging
+import tempfile
+from typing import Any, Callable
+
+import click
+
+from simple_typing_application.const.color import EColor
+from simple_typing_application.key_monitor.base import BaseKeyMonitor
+from simple_typing_application.models.typing_target_model import TypingTargetModel
+from simple_typing_application.sentence_generator.base import BaseSentenceGenerator
+from simple_typing_application.sentence_generator.utils import (
+    split_hiraganas_alphabets_symbols,
+    splitted_hiraganas_alphabets_symbols_to_typing_target,
+)
+from simple_typing_application.typing_automaton import TypingProgress, compile_typing_target
+from simple_typing_application.typing_game import TypingGame, _input_char_is_correct, _typing_is_done
+from simple_typing_application.ui.base import BaseUserInterface
+
+from .common import build_result, load_result, measure, print_result, save_result
+
+
+TARGETS: dict[str, str] = {
+    "realistic": "きょうははれています。あしたはあめがふるかもしれません。",
+    "long": "きょうははれています。あしたはあめがふるかもしれません。" * 20,
+    "sokuon_chain": "ちょっとまって、いっしょにいこう。っっっと" * 5,
+    "n_chain": "んなんなこんにちはせんせいあんないしんぶん" * 5,
+    "ascii_heavy": "Hello, World! This is an ASCII-heavy sentence with 12345 digits." * 5,
+}
+MISTYPE_INTERVAL: int = 10
+
+
+class _NullUserInterface(BaseUserInterface):
+    def show_typing_target(
+        self, text: str, *, title: str = "", color: EColor = EColor.DEFAULT, title_color: EColor = EColor.DEFAULT
+    ) -> None:  # noqa
+        pass
+
+    def show_user_input(self, text: str, *, color: EColor = EColor.DEFAULT) -> None:
+        pass
+
+    def erase_user_input(self) -> None:
+        pass
+
+    def system_anounce(self, text: str, *, color: EColor = EColor.DEFAULT) -> None:
+        pass
+
+
+class _NullKeyMonitor(BaseKeyMonitor):
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+class _NullSentenceGenerator(BaseSentenceGenerator):
+    async def generate(
+        self, callback: Callable[[TypingTargetModel], TypingTargetModel] = lambda x: x
+    ) -> TypingTargetModel:  # noqa
+        raise NotImplementedError()
+
+
+def _build_typing_target(text: str) -> TypingTargetModel:
+    return TypingTargetModel(
+        text=text,
+        text_hiragana_alphabet_symbol=text,
+        typing_target=splitted_hiraganas_alphabets_symbols_to_typing_target(split_hiraganas_alphabets_symbols(text)),  # noqa
+    )
+
+
+def _build_keys(progress: TypingProgress) -> list[str]:
+    # NOTE: one of the correct key sequences with a mistyped key in every MISTYPE_INTERVAL keys.
+    keys: list[str] = []
+    for i, key in enumerate(progress.romaji):
+        if i % MISTYPE_INTERVAL == MISTYPE_INTERVAL - 1:
+            keys.append("#" if key != "#" else "$")
+        keys.append(key)
+    return keys
+
+
+def _benchmark_target(name: str, typing_target: TypingTargetModel, repeat: int) -> list[dict[str, Any]]:
+    automaton = compile_typing_target(typing_target.typing_target)
+    keys = _build_keys(TypingProgress(typing_target, automaton=automaton))
+    num_keys = len(keys)
+    progress = TypingProgress(typing_target, automaton=automaton)
+
+    def reset_progress():
+        nonlocal progress
+        progress = TypingProgress(typing_target, automaton=automaton)
+
+    def run_input_char_is_correct():
+        return [_input_char_is_correct(key, progress) for key in keys]
+
+    def run_typing_is_done():
+        return [_typing_is_done(progress) for _ in keys]
+
+    # NOTE: the whole key press callback of TypingGame, i.e. RecordModel construction, matching and echo.
+    game = TypingGame(_NullSentenceGenerator(), _NullKeyMonitor(), _NullUserInterface(), tempfile.gettempdir())
+    on_press_callback = game._TypingGame__on_press_callback  # type: ignore
+
+    def reset_game():
+        game._TypingGame__initialize_typing_step(TypingProgress(typing_target, automaton=automaton))  # type: ignore
+
+    def run_on_press_callback():
+        for key in keys:
+            on_press_callback(key)
+        return game._TypingGame__current_records  # type: ignore
+
+    cases: list[dict[str, Any]] = []
+    for case, func, setup in [
+        ("input_char_is_correct", run_input_char_is_correct, reset_progress),
+        ("typing_is_done", run_typing_is_done, reset_progress),
+        ("on_press_callback", run_on_press_callback, reset_game),
+    ]:
+        cases.append(
+            {"case": case, "target": name, "num_keys": num_keys, **measure(func, num_keys, repeat=repeat, setup=setup)}
+        )  # noqa
+    cases.append(
+        {
+            "case": "compile_typing_target",
+            "target": name,
+            "num_keys": num_keys,
+            **measure(lambda: compile_typing_target(typing_target.typing_target), num_keys, repeat=repeat),
+        }
+    )
+    return cases
+
+
+@click.command()
+@click.option("--output", "-o", default=None, help="path to save the result as JSON.")
+@click.option("--baseline", "-b", default=None, help="path to a previous result to compare with.")
+@click.option("--repeat", "-r", default=20, type=int, help="the number of repetitions. Defaults to 20.")
+def main(output: str | None, baseline: str | None, repeat: int):
+    logging.basicConfig(level=logging.ERROR)
+
+    cases: list[dict[str, Any]] = []
+    for name, text in TARGETS.items():
+        cases.extend(_benchmark_target(name, _build_typing_target(text), repeat))
+
+    result = build_result("keystroke_matching", cases)
+    print_result(result, load_result(baseline) if baseline else None)
+    if output:
+        save_result(result, output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark of the romaji expansion of pathological chunks.
+
+Each family generates a single chunk whose number of romaji alternatives grows exponentially with its length,
+like the ones which a language model sometimes outputs, e.g. 'っっっっっと' or 'あぁぁぁぁ'.
+Records the time to expand a chunk and to compile the typing target of it,
+the number of accepted alternatives and whether the expansion fell back to the preferred romajis.
+
+Usage:
+    python -m benchmarks.romaji_expansion [--output result.json] [--baseline previous_result.json]
+"""  # noqa
+
+from __future__ import annotations
+import logging
+from typing import Any, Callable
+
+import click
+
+from simple_typing_application.sentence_generator.utils import (
+    _expand_lattice,
+    clear_expansion_cache,
+    expand_chunk,
+    get_kana_transducer,
+    normalize_kana_text,
+    TooManyAlternativesError,
+)
+from simple_typing_application.typing_automaton import compile_typing_target
+
+from .common import build_result, load_result, measure, print_result, save_result
+
+
+FAMILIES: dict[str, Callable[[int], str]] = {
+    "sokuon_run": lambda n: "っ" * n + "と",
+    "small_kana_run": lambda n: "あ" + "ぁ" * n,
+    "n_run": lambda n: "ん" * n + "な",
+    "llm_cluster": lambda n: "っ" * n + "きゃぁぃ",
+}
+LENGTHS: list[int] = [1, 2, 4, 8, 16, 32, 64]
+
+
+def _is_degraded(chunk: str) -> bool:
+    try:
+        _expand_lattice(get_kana_transducer().tokenize(normalize_kana_text(chunk)))
+    except TooManyAlternativesError:
+        return True
+    return False
+
+
+def _benchmark_chunk(family: str, length: int, chunk: str, repeat: int) -> list[dict[str, Any]]:
+    alternatives = expand_chunk(chunk)
+    stats: dict[str, Any] = {
+        "num_chars": len(chunk),
+        "num_alternatives": len(alternatives),
+        "num_states": compile_typing_target([alternatives]).num_states,
+        "degraded": _is_degraded(chunk),
+    }
+    target = f"{family}_{length}"
+    return [
+        {
+            "case": "expand_chunk",
+            "target": target,
+            **stats,
+            **measure(lambda: expand_chunk(chunk), 1, repeat=repeat, setup=clear_expansion_cache),
+        },
+        {
+            "case": "compile_typing_target",
+            "target": target,
+            **stats,
+            **measure(lambda: compile_typing_target([alternatives]), 1, repeat=repeat),
+        },
+    ]
+
+
+@click.command()
+@click.option("--output", "-o", default=None, help="path to save the result as JSON.")
+@click.option("--baseline", "-b", default=None, help="path to a previous result to compare with.")
+@click.option("--repeat", "-r", default=5, type=int, help="the number of repetitions. Defaults to 5.")
+def main(output: str | None, baseline: str | None, repeat: int):
+    logging.basicConfig(level=logging.ERROR)
+
+    cases: list[dict[str, Any]] = []
+    for family, generate in FAMILIES.items():
+        for length in LENGTHS:
+            cases.extend(_benchmark_chunk(family, length, generate(length), repeat))
+
+    result = build_result("romaji_expansion", cases)
+    print_result(result, load_result(baseline) if baseline else None)
+    print()
+    print(f"{'target':<24}{'chars':>8}{'alternatives':>14}{'states':>10}{'degraded':>10}")
+    for case in result["cases"]:
+        if case["case"] == "expand_chunk":
+            print(
+                f"{case['target']:<24}{case['num_chars']:>8}{case['num_alternatives']:>14}{case['num_states']:>10}{case['degraded']!s:>10}"  # noqa
+            )
+    if output:
+        save_result(result, output)
+
+
+if __name__ == "__main__":
+    main()
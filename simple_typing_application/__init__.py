@@ -7,6 +7,7 @@ from . import (
     utils,
     config,
     main,
+    typing_automaton,
     typing_game,
 )
 
@@ -21,5 +22,6 @@ __all__ = [
     utils.__name__,
     config.__name__,
     main.__name__,
+    typing_automaton.__name__,
     typing_game.__name__,
 ]
@@ -2,6 +2,7 @@ from . import (
     color,
     hiragana_katakana_map,
     hiragana_romaji_map,
+    kana_reader,
     key_monitor,
     keys,
     sentence_generator,
@@ -21,6 +22,7 @@ __all__ = [
     color.__name__,
     hiragana_katakana_map.__name__,
     hiragana_romaji_map.__name__,
+    kana_reader.__name__,
     key_monitor.__name__,
     keys.__name__,
     sentence_generator.__name__,
@@ -1,10 +1,12 @@
 from __future__ import annotations
 from itertools import product
+import os
+from types import MappingProxyType
+from typing import Mapping
 
 
-# TODO: make the maps immutable
-
-HIRA2ROMA_MAP: dict[str, list[str | None]] = {
+# NOTE: the source tables. Use HIRA2ROMA_MAP and SMALL_HIRA2ROMA_MAP, which are compiled from them.
+_BASE_HIRA2ROMA_MAP: dict[str, list[str | None]] = {
     # 50-on 50音
     "あ": ["a"],
     "い": ["i", "yi"],
@@ -225,7 +227,7 @@ HIRA2ROMA_MAP: dict[str, list[str | None]] = {
 }
 
 
-SMALL_HIRA2ROMA_MAP: dict[str, list[str]] = {
+_BASE_SMALL_HIRA2ROMA_MAP: dict[str, list[str]] = {
     "ぁ": ["xa", "la"],
     "ぃ": ["xi", "li", "xyi", "lyi"],
     "ぅ": ["xu", "le"],
@@ -238,10 +240,54 @@ SMALL_HIRA2ROMA_MAP: dict[str, list[str]] = {
 }
 
 
-for s_hira, s_romas in SMALL_HIRA2ROMA_MAP.items():
-    for k in HIRA2ROMA_MAP.keys():
-        if s_hira in k:
-            # NOTE: Assume that k is a combination of a single capital hinagana and a single small hiragana  # noqa
-            HIRA2ROMA_MAP[k].extend(
-                [v1 + v2 for v1, v2 in product(HIRA2ROMA_MAP[k[0]], s_romas) if v1 is not None and v2 is not None]
-            )
+CACHE_DIREC_ENV: str = "SIMPLE_TYPING_APPLICATION_CACHE_DIR"
+
+
+def compile_romaji_maps(
+    base_hira2roma_map: Mapping[str, list[str | None]],
+    base_small_hira2roma_map: Mapping[str, list[str]],
+) -> tuple[Mapping[str, tuple[str | None, ...]], Mapping[str, tuple[str, ...]]]:
+    """Compile the romaji tables into immutable mappings.
+
+    Args:
+        base_hira2roma_map (Mapping[str, list[str | None]]): hiraganas to romajis.
+        base_small_hira2roma_map (Mapping[str, list[str]]): small hiraganas to romajis.
+
+    Returns:
+        Mapping[str, tuple[str | None, ...]]: hiraganas to romajis, where the combinations of a hiragana and a small hiragana, e.g. 'きゃ' -> 'kilya', are added.
+        Mapping[str, tuple[str, ...]]: small hiraganas to romajis.
+
+    Examples:
+    >>> hira2roma, small_hira2roma = compile_romaji_maps({'き': ['ki'], 'きゃ': ['kya']}, {'ゃ': ['xya']})
+    >>> hira2roma['きゃ']
+    ('kya', 'kixya')
+    >>> hira2roma['き'] = ('ki',)
+    Traceback (most recent call last):
+        ...
+    TypeError: 'mappingproxy' object does not support item assignment
+    """  # noqa
+    hira2roma: dict[str, tuple[str | None, ...]] = {k: tuple(v) for k, v in base_hira2roma_map.items()}
+    for s_hira, s_romas in base_small_hira2roma_map.items():
+        for k in hira2roma.keys():
+            if s_hira in k:
+                # NOTE: Assume that k is a combination of a single capital hinagana and a single small hiragana  # noqa
+                hira2roma[k] += tuple(
+                    v1 + v2 for v1, v2 in product(hira2roma[k[0]], s_romas) if v1 is not None and v2 is not None
+                )
+    return (
+        MappingProxyType(hira2roma),
+        MappingProxyType({k: tuple(v) for k, v in base_small_hira2roma_map.items()}),
+    )
+
+
+def get_cache_direc() -> str:
+    """Get the cache directory. `$SIMPLE_TYPING_APPLICATION_CACHE_DIR` if set, otherwise `$XDG_CACHE_HOME/simple_typing_application` (default: `~/.cache/simple_typing_application`)."""  # noqa
+    return os.environ.get(CACHE_DIREC_ENV) or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "simple_typing_application",
+    )
+
+
+HIRA2ROMA_MAP: Mapping[str, tuple[str | None, ...]]
+SMALL_HIRA2ROMA_MAP: Mapping[str, tuple[str, ...]]
+HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP = compile_romaji_maps(_BASE_HIRA2ROMA_MAP, _BASE_SMALL_HIRA2ROMA_MAP)
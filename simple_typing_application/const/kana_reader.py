@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class EKanaReaderType(Enum):
+    EXCELAPI = "EXCELAPI"
+    DICTIONARY = "DICTIONARY"
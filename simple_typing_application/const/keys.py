@@ -4,3 +4,4 @@ from enum import Enum
 class EMetaKey(Enum):
     ESC = "ESC"
     TAB = "TAB"
+    BACKSPACE = "BACKSPACE"
@@ -0,0 +1,208 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+import json
+import logging
+import os
+import time
+from typing import Iterable, Iterator, TextIO
+
+import click
+
+from .const.hiragana_romaji_map import get_cache_direc, HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP
+from .kana_transducer import save_kana_transducer
+from .models.corpus_compile_result_model import CorpusCompileResultModel
+from .models.typing_target_model import TypingTargetModel
+from .sentence_generator.utils import build_typing_target
+
+
+INPUT_FORMATS: tuple[str, ...] = ("tsv", "jsonl")
+
+
+def _parse_line(line: str, input_format: str) -> tuple[str, str]:
+    if input_format == "tsv":
+        fields = line.rstrip("\r\n").split("\t")
+        if len(fields) != 2:
+            raise ValueError(f"expected 2 tab-separated fields (text and kana), but got {len(fields)}")
+        return fields[0], fields[1]
+    elif input_format == "jsonl":
+        data = json.loads(line)
+        if not isinstance(data, dict) or not isinstance(data.get("text"), str) or not isinstance(data.get("kana"), str):  # noqa
+            raise ValueError('expected a JSON object with "text" and "kana" strings')
+        return data["text"], data["kana"]
+    else:
+        raise ValueError(f"Unsupported input format: {input_format}")
+
+
+def compile_line(line: str, input_format: str) -> TypingTargetModel:
+    """Compile a line of a corpus into a typing target.
+
+    Args:
+        line (str): a line of a corpus. See `compile_corpus` for the formats.
+        input_format (str): "tsv" or "jsonl".
+
+    Returns:
+        TypingTargetModel: the typing target.
+
+    Raises:
+        ValueError: if the line is invalid or the kana cannot be converted into romaji.
+
+    NOTE:
+        The kana is normalized in the same way as `StaticSentenceGenerator`, e.g. katakanas into hiraganas.
+
+    Examples:
+    >>> compile_line('ちあ\\tちあ', 'tsv').typing_target
+    [['chi', 'ti'], ['a']]
+    """
+    text, kana = _parse_line(line, input_format)
+    return build_typing_target(text, kana)
+
+
+def _compile_batch(
+    batch: list[tuple[int, str]],
+    input_format: str,
+) -> list[tuple[int, str | None, str | None]]:
+    # NOTE: returns tuples of line number, compiled JSON, and error message,
+    #       so that only plain strings are sent back from the worker processes.
+    results: list[tuple[int, str | None, str | None]] = []
+    for line_number, line in batch:
+        try:
+            typing_target = compile_line(line, input_format)
+            results.append((line_number, typing_target.model_dump_json(), None))
+        except ValueError as e:
+            results.append((line_number, None, f"{e.__class__.__name__}({e})"))
+    return results
+
+
+def _iter_batches(lines: Iterable[str], batch_size: int) -> Iterator[list[tuple[int, str]]]:
+    numbered_lines = ((i, line) for i, line in enumerate(lines, start=1) if line.strip())
+    while batch := list(islice(numbered_lines, batch_size)):
+        yield batch
+
+
+def _write_compiled_batches(
+    compiled_batches: Iterable[list[tuple[int, str | None, str | None]]],
+    fout: TextIO,
+    result: CorpusCompileResultModel,
+) -> None:
+    # NOTE: the compiled batches are written in the order of the input lines.
+    for compiled_batch in compiled_batches:
+        for line_number, compiled, error in compiled_batch:
+            result.num_lines += 1
+            if compiled is None:
+                result.failed_lines[line_number] = error or ""
+                continue
+            fout.write(compiled + "\n")
+            result.num_sentences += 1
+
+
+def compile_corpus(
+    input_path: str,
+    output_path: str,
+    input_format: str | None = None,
+    max_workers: int | None = None,
+    batch_size: int = 256,
+) -> CorpusCompileResultModel:
+    """Compile a corpus of texts and kana readings into typing targets in parallel.
+
+    Args:
+        input_path (str): path to a corpus. Each line is "text<TAB>kana" in TSV or {"text": ..., "kana": ...} in JSONL. Empty lines are skipped.
+        output_path (str): path to the compiled corpus, which is JSON Lines of `TypingTargetModel`. `StaticSentenceGenerator` can load it with `compiled_corpus_path`.
+        input_format (str | None, optional): "tsv" or "jsonl". Defaults to None (inferred from the extension of `input_path`).
+        max_workers (int | None, optional): the number of worker processes. If 1, lines are compiled in this process. Defaults to None (the number of CPUs).
+        batch_size (int, optional): the number of lines sent to a worker process at once. Defaults to 256.
+
+    Returns:
+        CorpusCompileResultModel: the result. Failed lines are reported instead of raising an exception.
+
+    Raises:
+        ValueError: if the input format is not supported.
+    """  # noqa
+    input_format = input_format or os.path.splitext(input_path)[1].lstrip(".").lower()
+    if input_format not in INPUT_FORMATS:
+        raise ValueError(f"Unsupported input format: {input_format}. Choose one of {INPUT_FORMATS}.")
+
+    result = CorpusCompileResultModel()
+    start_time = time.perf_counter()
+    with open(input_path, "r", encoding="utf-8") as fin, open(output_path, "w", encoding="utf-8") as fout:
+        batches = _iter_batches(fin, batch_size)
+        if max_workers == 1:
+            _write_compiled_batches(map(_compile_batch, batches, repeat(input_format)), fout, result)
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                _write_compiled_batches(executor.map(_compile_batch, batches, repeat(input_format)), fout, result)  # noqa
+    result.elapsed_time = time.perf_counter() - start_time
+    return result
+
+
+@click.command()
+@click.option(
+    "--input-path",
+    "-i",
+    required=True,
+    help='path to a corpus in TSV (text<TAB>kana) or JSONL ({"text": ..., "kana": ...}).',
+)  # noqa
+@click.option("--output-path", "-o", required=True, help="path to the compiled corpus (JSON Lines).")
+@click.option(
+    "--input-format",
+    "-f",
+    default=None,
+    type=click.Choice(INPUT_FORMATS),
+    help="the format of the corpus. Defaults to the extension of the input path.",
+)  # noqa
+@click.option(
+    "--max-workers",
+    "-w",
+    default=None,
+    type=int,
+    help="the number of worker processes. Defaults to the number of CPUs.",
+)  # noqa
+@click.option(
+    "--batch-size",
+    "-b",
+    default=256,
+    type=int,
+    help="the number of lines sent to a worker process at once. Defaults to 256.",
+)  # noqa
+@click.option(
+    "--save-kana-transducer",
+    "save_transducer",
+    is_flag=True,
+    help="also save the kana transducer of the romaji table into the cache directory, so that the application loads it with mmap instead of compiling it on first use.",  # noqa
+)  # noqa
+@click.option("--debug", "-d", is_flag=True, help="debug mode.")
+def main(
+    input_path: str,
+    output_path: str,
+    input_format: str | None,
+    max_workers: int | None,
+    batch_size: int,
+    save_transducer: bool,
+    debug: bool,
+    logger: logging.Logger = logging.getLogger(__name__),
+):
+    logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
+
+    # compile
+    result = compile_corpus(
+        input_path,
+        output_path,
+        input_format=input_format,
+        max_workers=max_workers,
+        batch_size=batch_size,
+    )
+
+    # report
+    for line_number, error in result.failed_lines.items():
+        logger.error(f"failed to compile line {line_number}: {error}")
+    click.echo(f"lines: {result.num_lines} (failed: {len(result.failed_lines)})")
+    click.echo(f"sentences: {result.num_sentences}")
+    click.echo(f"elapsed time: {result.elapsed_time:.3f} seconds ({result.sentences_per_sec:.0f} sentences/sec)")  # noqa
+
+    # kana transducer
+    if save_transducer:
+        click.echo(f"kana transducer: {save_kana_transducer(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, get_cache_direc())}")
+
+
+if __name__ == "__main__":
+    main()
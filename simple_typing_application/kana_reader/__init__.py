@@ -0,0 +1,24 @@
+from . import (
+    base,
+    dictionary_kana_reader,
+    excelapi_kana_reader,
+    factory,
+)
+
+from .base import BaseKanaReader, KanaReaderClosedError
+from .dictionary_kana_reader import DictionaryKanaReader
+from .excelapi_kana_reader import ExcelapiKanaReader
+from .factory import create_kana_reader
+
+
+__all__ = [
+    base.__name__,
+    dictionary_kana_reader.__name__,
+    excelapi_kana_reader.__name__,
+    factory.__name__,
+    BaseKanaReader.__name__,
+    KanaReaderClosedError.__name__,
+    DictionaryKanaReader.__name__,
+    ExcelapiKanaReader.__name__,
+    create_kana_reader.__name__,
+]
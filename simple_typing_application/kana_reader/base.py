@@ -0,0 +1,20 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+
+class KanaReaderClosedError(RuntimeError):
+    """Raised when a kana reader is used after it has been closed."""
+
+
+class BaseKanaReader(ABC):
+    @abstractmethod
+    def read(self, text: str) -> str:
+        """Convert a text including kanjis into its reading in hiraganas. Characters other than kanjis and katakanas are kept."""  # noqa
+        raise NotImplementedError()
+
+    async def read_async(self, text: str) -> str:
+        # NOTE: runs `read` in a thread by default so as not to block the event loop.
+        return await asyncio.to_thread(self.read, text)
+
+    def close(self) -> None:
+        """Stop the reads in progress as soon as possible, e.g. the ones waiting for a rate limiter. Does nothing by default."""  # noqa
@@ -0,0 +1,223 @@
+from __future__ import annotations
+from array import array
+from collections import deque
+from logging import getLogger, Logger
+import os
+from typing import Iterable
+
+from .base import BaseKanaReader
+from ..utils.japanese_string_utils import contains_kanji, katakana_to_hiragana
+
+
+BUNDLED_DICTIONARY_PATH: str = os.path.join(os.path.dirname(__file__), "data", "reading_dictionary.tsv")
+
+
+class ReadingTrie:
+    """Compact trie from surfaces to readings.
+
+    The nodes are numbered in the level order, so that the children of a node are consecutive.
+    The labels of the edges to the children of node i are `labels[child_starts[i]:child_starts[i + 1]]` in sorted order,
+    and the child at `labels[j]` is node j + 1.
+    The readings are concatenated into a pool, and the reading of node i is `pool[reading_starts[i]:reading_starts[i + 1]]` if not empty.
+    Thus, the trie takes a few bytes per node without any dict nor object per node.
+
+    Examples:
+    >>> trie = ReadingTrie.from_items([('日本', 'にほん'), ('日本語', 'にほんご'), ('日', 'ひ')])
+    >>> len(trie), trie.num_nodes
+    (3, 4)
+    >>> trie.get('日本'), trie.get('本')
+    ('にほん', None)
+    >>> trie.longest_match('日本人', 0), trie.longest_match('日本人', 2)
+    ((2, 'にほん'), None)
+    """  # noqa
+
+    __slots__ = ("_labels", "_child_starts", "_reading_pool", "_reading_starts", "_num_readings")
+
+    def __init__(
+        self,
+        labels: str,
+        child_starts: array,
+        reading_pool: str,
+        reading_starts: array,
+    ) -> None:
+        self._labels = labels
+        self._child_starts = child_starts
+        self._reading_pool = reading_pool
+        self._reading_starts = reading_starts
+        self._num_readings: int = sum(start < end for start, end in zip(reading_starts[:-1], reading_starts[1:]))  # noqa
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._child_starts) - 1
+
+    def __len__(self) -> int:
+        return self._num_readings
+
+    @classmethod
+    def from_items(cls, items: Iterable[tuple[str, str]]) -> ReadingTrie:
+        """Build a trie.
+
+        Args:
+            items (Iterable[tuple[str, str]]): pairs of a surface and its reading. The last one wins for duplicated surfaces.
+
+        Returns:
+            ReadingTrie: the trie.
+
+        Raises:
+            ValueError: if a surface or a reading is empty.
+        """  # noqa
+        # build a temporary trie of dicts
+        children: list[dict[str, int]] = [{}]
+        readings: list[str] = [""]
+        for surface, reading in items:
+            if not surface or not reading:
+                raise ValueError(f"surface and reading must not be empty, but {surface!r} and {reading!r} were given.")  # noqa
+            node = 0
+            for c in surface:
+                if c not in children[node]:
+                    children[node][c] = len(children)
+                    children.append({})
+                    readings.append("")
+                node = children[node][c]
+            readings[node] = reading
+
+        # flatten it in the level order
+        labels: list[str] = []
+        child_starts = array("I")
+        reading_pool: list[str] = []
+        reading_starts = array("I", [0])
+        queue: deque[int] = deque([0])
+        while queue:
+            node = queue.popleft()
+            child_starts.append(len(labels))
+            reading_pool.append(readings[node])
+            reading_starts.append(reading_starts[-1] + len(readings[node]))
+            for c in sorted(children[node]):
+                labels.append(c)
+                queue.append(children[node][c])
+        child_starts.append(len(labels))
+        return cls("".join(labels), child_starts, "".join(reading_pool), reading_starts)
+
+    def _reading(self, node: int) -> str | None:
+        start, end = self._reading_starts[node], self._reading_starts[node + 1]
+        return self._reading_pool[start:end] if start < end else None
+
+    def get(self, surface: str) -> str | None:
+        """Get the reading of a surface. None if the surface is not in the trie."""
+        node = 0
+        for c in surface:
+            j = self._labels.find(c, self._child_starts[node], self._child_starts[node + 1])
+            if j < 0:
+                return None
+            node = j + 1
+        return self._reading(node)
+
+    def longest_match(self, text: str, start: int = 0) -> tuple[int, str] | None:
+        """Find the longest surface in the trie which `text[start:]` starts with.
+
+        Args:
+            text (str): a text.
+            start (int, optional): the start position. Defaults to 0.
+
+        Returns:
+            tuple[int, str] | None: the end position of the surface and its reading. None if no surface matches.
+        """
+        labels, child_starts, reading_starts = self._labels, self._child_starts, self._reading_starts
+        node = 0
+        match: tuple[int, int] | None = None
+        for i in range(start, len(text)):
+            j = labels.find(text[i], child_starts[node], child_starts[node + 1])
+            if j < 0:
+                break
+            node = j + 1
+            if reading_starts[node] < reading_starts[node + 1]:
+                match = (i + 1, node)
+        if match is None:
+            return None
+        end, node = match
+        return end, self._reading_pool[reading_starts[node] : reading_starts[node + 1]]
+
+
+def load_reading_dictionary(path: str) -> list[tuple[str, str]]:
+    """Load a reading dictionary.
+
+    Args:
+        path (str): path to a dictionary, i.e. a UTF-8 text file whose lines are `surface<TAB>reading`. Empty lines and lines starting with '#' are ignored.
+
+    Returns:
+        list[tuple[str, str]]: pairs of a surface and its reading. Katakanas in readings are converted into hiraganas.
+
+    Raises:
+        ValueError: if a line is invalid.
+    """  # noqa
+    items: list[tuple[str, str]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            line = line.rstrip("\r\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            if len(fields) != 2 or not fields[0] or not fields[1]:
+                raise ValueError(f"{path}:{lineno}: a line must be `surface<TAB>reading`, but {line!r} was given.")  # noqa
+            items.append((fields[0], katakana_to_hiragana(fields[1])))
+    return items
+
+
+class DictionaryKanaReader(BaseKanaReader):
+    """Offline kana reader which segments a text by the longest match in a reading dictionary.
+
+    Args:
+        dictionary_path (str | None, optional): path to a user dictionary. See `load_reading_dictionary`. Its entries take precedence over the bundled dictionary. Defaults to None.
+        use_bundled_dictionary (bool, optional): whether to load the bundled dictionary. Defaults to True.
+        logger (Logger, optional): a logger. Defaults to getLogger(__name__).
+
+    NOTE:
+        Characters which do not match any surface are kept, and katakanas are converted into hiraganas.
+        Kanjis which remain in the reading are logged as a warning, since they cannot be typed.
+        The bundled dictionary only covers common words. Add a user dictionary for the words of your corpus.
+
+    Examples:
+    >>> reader = DictionaryKanaReader()
+    >>> reader.read('これはサンプルの文章です。')
+    'これはさんぷるのぶんしょうです。'
+    >>> reader.read('明日は雨が降ります。')
+    'あしたはあめがふります。'
+    """  # noqa
+
+    def __init__(
+        self,
+        dictionary_path: str | None = None,
+        use_bundled_dictionary: bool = True,
+        logger: Logger = getLogger(__name__),
+    ) -> None:
+        items: list[tuple[str, str]] = []
+        if use_bundled_dictionary:
+            items.extend(load_reading_dictionary(BUNDLED_DICTIONARY_PATH))
+        if dictionary_path is not None:
+            items.extend(load_reading_dictionary(dictionary_path))
+        self._trie = ReadingTrie.from_items(items)
+        self._logger = logger
+
+    @property
+    def trie(self) -> ReadingTrie:
+        return self._trie
+
+    def read(self, text: str) -> str:
+        pieces: list[str] = []
+        i: int = 0
+        while i < len(text):
+            match = self._trie.longest_match(text, i)
+            if match is None:
+                pieces.append(text[i])
+                i += 1
+            else:
+                i, reading = match
+                pieces.append(reading)
+        reading = katakana_to_hiragana("".join(pieces))
+        if contains_kanji(reading):
+            self._logger.warning(f"Unknown kanjis remain in the reading of {text}: {reading}")
+        return reading
+
+    async def read_async(self, text: str) -> str:
+        # NOTE: reading is local and fast enough not to be run in a thread.
+        return self.read(text)
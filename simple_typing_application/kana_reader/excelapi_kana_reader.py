@@ -0,0 +1,90 @@
+from __future__ import annotations
+from logging import getLogger, Logger
+from threading import Event
+
+from .base import BaseKanaReader, KanaReaderClosedError
+from ..utils.japanese_string_utils import (
+    EXCELAPI_KANJI2KANA_URL,
+    excelapi_kanji2kana,
+    excelapi_kanji2kana_async,
+)
+from ..utils.kana_cache import KanaCache
+from ..utils.rate_limiter import RateLimiter
+
+
+EXCELAPI_MIN_INTERVAL_SEC: float = 1.0
+# NOTE: shared by all the readers so as not to request excelapi.org more than once a second even with multiple generators.  # noqa
+EXCELAPI_RATE_LIMITER: RateLimiter = RateLimiter(EXCELAPI_MIN_INTERVAL_SEC)
+
+
+class ExcelapiKanaReader(BaseKanaReader):
+    """Kana reader backed by excelapi.org. See `excelapi_kanji2kana`.
+
+    Args:
+        cache (KanaCache | None, optional): a persistent cache of the readings. Defaults to None.
+        rate_limiter (RateLimiter | None, optional): a rate limiter of the requests, i.e. not for the cached readings. It can be shared among readers. If None, requests are not limited, e.g. for a local endpoint. Defaults to EXCELAPI_RATE_LIMITER.
+        url (str, optional): the endpoint. Defaults to EXCELAPI_KANJI2KANA_URL.
+        logger (Logger, optional): a logger. Defaults to getLogger(__name__).
+
+    NOTE:
+        After `close`, the reads waiting for the rate limiter stop waiting and raise KanaReaderClosedError,
+        and no more requests are sent. Requests already sent are not interrupted.
+    """  # noqa
+
+    def __init__(
+        self,
+        cache: KanaCache | None = None,
+        rate_limiter: RateLimiter | None = EXCELAPI_RATE_LIMITER,
+        url: str = EXCELAPI_KANJI2KANA_URL,
+        logger: Logger = getLogger(__name__),
+    ) -> None:
+        self._cache = cache
+        self._rate_limiter = rate_limiter
+        self._url = url
+        self._logger = logger
+        self._closed = Event()
+
+    @property
+    def cache(self) -> KanaCache | None:
+        return self._cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter | None:
+        return self._rate_limiter
+
+    def read(self, text: str) -> str:
+        return excelapi_kanji2kana(
+            text,
+            cache=self._cache,
+            before_request=self._before_request,
+            url=self._url,
+        )
+
+    async def read_async(self, text: str) -> str:
+        return await excelapi_kanji2kana_async(
+            text,
+            cache=self._cache,
+            before_request=self._before_request_async,
+            url=self._url,
+        )
+
+    def close(self) -> None:
+        self._closed.set()
+
+    def _raise_if_closed(self) -> None:
+        if self._closed.is_set():
+            raise KanaReaderClosedError(f"{self.__class__.__name__} has been closed.")
+
+    def _before_request(self) -> None:
+        # NOTE: check before and after waiting, which may take seconds when the rate limiter is shared.
+        self._raise_if_closed()
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(self._closed)
+        self._raise_if_closed()
+
+    async def _before_request_async(self) -> None:
+        # NOTE: waiting is cancelled with the task, so the event is checked only before and after it.
+        self._raise_if_closed()
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async()
+        self._raise_if_closed()
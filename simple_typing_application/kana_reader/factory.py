@@ -0,0 +1,40 @@
+from __future__ import annotations
+from logging import getLogger, Logger
+
+from .base import BaseKanaReader
+from .dictionary_kana_reader import DictionaryKanaReader
+from .excelapi_kana_reader import EXCELAPI_RATE_LIMITER, ExcelapiKanaReader
+from ..const.kana_reader import EKanaReaderType
+from ..utils.kana_cache import KanaCache
+from ..utils.rate_limiter import RateLimiter
+
+
+def create_kana_reader(
+    kana_reader_type: EKanaReaderType,
+    dictionary_path: str | None = None,
+    cache: KanaCache | None = None,
+    rate_limiter: RateLimiter | None = EXCELAPI_RATE_LIMITER,
+    logger: Logger = getLogger(__name__),
+) -> BaseKanaReader:
+    """Create a kana reader.
+
+    Args:
+        kana_reader_type (EKanaReaderType): the backend.
+        dictionary_path (str | None, optional): path to a user dictionary for `EKanaReaderType.DICTIONARY`. Defaults to None.
+        cache (KanaCache | None, optional): a persistent cache for `EKanaReaderType.EXCELAPI`. Defaults to None.
+        rate_limiter (RateLimiter | None, optional): a rate limiter of the requests for `EKanaReaderType.EXCELAPI`. See `ExcelapiKanaReader`. Defaults to EXCELAPI_RATE_LIMITER.
+        logger (Logger, optional): a logger. Defaults to getLogger(__name__).
+
+    Returns:
+        BaseKanaReader: the kana reader.
+
+    Raises:
+        ValueError: if `kana_reader_type` is not supported.
+    """  # noqa
+    logger.debug(f"create a kana reader of {kana_reader_type}")
+    if kana_reader_type == EKanaReaderType.EXCELAPI:
+        return ExcelapiKanaReader(cache=cache, rate_limiter=rate_limiter, logger=logger)
+    elif kana_reader_type == EKanaReaderType.DICTIONARY:
+        return DictionaryKanaReader(dictionary_path=dictionary_path, logger=logger)
+    else:
+        raise ValueError(f"Unsupported kana reader type: {kana_reader_type}")
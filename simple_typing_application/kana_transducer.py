@@ -0,0 +1,349 @@
+from __future__ import annotations
+import hashlib
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, Mapping
+
+
+_MAGIC: bytes = b"KANAFST\0"
+FORMAT_VERSION: int = 1
+_HEADER = struct.Struct("<8sH32sIIII")  # magic, version, checksum, #states, #transitions, #strings, pool size
+_STATE = struct.Struct("<IHiHB")  # first transition, #transitions, first string (-1: no output), #strings, flags
+_TRANSITION = struct.Struct("<II")  # code point, next state
+_STRING = struct.Struct("<IH")  # offset in the pool, length (_NONE_LENGTH: None)
+_NONE_LENGTH: int = 0xFFFF
+
+
+class KanaTransducer:
+    """Finite-state transducer from kana to romaji compiled from the romaji tables.
+
+    The states form a trie of the kanas of the tables, and a state has the romaji alternatives of the kana which leads to it.
+    The flags of the state of a single character drive splitting into chunks:
+        - FLAG_REQUIRES_NEXT: the romaji depends on the next character, e.g. 'っ' and 'ん'.
+        - FLAG_ATTACHES_PREVIOUS: the character is attached to the previous one, e.g. 'ゃ'.
+
+    NOTE:
+        Splitting (`iter_chunks`), tokenizing a chunk (`tokenize`) and looking up romajis (`lookup`) share this transducer.
+        The transducer can be saved into a compact binary file and loaded with mmap. See `save` and `load`.
+
+    Examples:
+    >>> transducer = KanaTransducer.from_romaji_maps({'き': ['ki'], 'きゃ': ['kya'], 'っ': [None, 'xtu']}, {'ゃ': ['xya']})
+    >>> list(transducer.iter_chunks('っきゃき'))
+    ['っきゃ', 'き']
+    >>> transducer.tokenize('っきゃ')
+    ['っ', 'きゃ']
+    >>> transducer.lookup('きゃ'), transducer.lookup('ぱ')
+    (('kya',), None)
+    >>> KanaTransducer.from_bytes(transducer.to_bytes()) == transducer
+    True
+    """  # noqa
+
+    FLAG_REQUIRES_NEXT: int = 1
+    FLAG_ATTACHES_PREVIOUS: int = 2
+
+    __slots__ = ("_transitions", "_outputs", "_flags", "_char_flags")
+
+    def __init__(
+        self,
+        transitions: tuple[dict[str, int], ...],
+        outputs: tuple[tuple[str | None, ...] | None, ...],
+        flags: tuple[int, ...],
+    ) -> None:
+        self._transitions = transitions
+        self._outputs = outputs
+        self._flags = flags
+        # NOTE: the flags of single characters, which are looked up for each character in splitting.
+        self._char_flags: dict[str, int] = {c: flags[state] for c, state in transitions[0].items() if flags[state]}
+
+    @property
+    def num_states(self) -> int:
+        return len(self._transitions)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, KanaTransducer):
+            return NotImplemented
+        return (self._transitions, self._outputs, self._flags) == (other._transitions, other._outputs, other._flags)
+
+    def __hash__(self) -> int:
+        return hash((self._outputs, self._flags))
+
+    @classmethod
+    def from_romaji_maps(
+        cls,
+        hira2roma_map: Mapping[str, Iterable[str | None]],
+        small_hira2roma_map: Mapping[str, Iterable[str]],
+        requires_next: Iterable[str] = ("っ", "ん"),
+    ) -> KanaTransducer:
+        """Compile the romaji tables.
+
+        Args:
+            hira2roma_map (Mapping[str, Iterable[str | None]]): kanas to romajis like `HIRA2ROMA_MAP`.
+            small_hira2roma_map (Mapping[str, Iterable[str]]): small kanas to romajis like `SMALL_HIRA2ROMA_MAP`.
+            requires_next (Iterable[str], optional): kanas whose romaji depends on the next character. Defaults to ("っ", "ん").
+
+        Returns:
+            KanaTransducer: the transducer.
+        """  # noqa
+        transitions: list[dict[str, int]] = [{}]
+        outputs: list[tuple[str | None, ...] | None] = [None]
+        flags: list[int] = [0]
+
+        def add(kana: str, romajis: Iterable[str | None]):
+            state = 0
+            for c in kana:
+                if c not in transitions[state]:
+                    transitions[state][c] = len(transitions)
+                    transitions.append({})
+                    outputs.append(None)
+                    flags.append(0)
+                state = transitions[state][c]
+            outputs[state] = tuple(romajis)
+
+        for small_kana, small_romajis in small_hira2roma_map.items():
+            add(small_kana, small_romajis)
+            flags[transitions[0][small_kana]] |= cls.FLAG_ATTACHES_PREVIOUS
+        for kana, romajis in hira2roma_map.items():
+            add(kana, romajis)
+        for kana in requires_next:
+            if kana in transitions[0]:
+                flags[transitions[0][kana]] |= cls.FLAG_REQUIRES_NEXT
+        return cls(tuple(transitions), tuple(outputs), tuple(flags))
+
+    def char_flags(self, c: str) -> int:
+        """Get the flags of a character. 0 if the character is not in the tables."""
+        return self._char_flags.get(c, 0)
+
+    def lookup(self, kana: str) -> tuple[str | None, ...] | None:
+        """Get the romaji alternatives of a kana. None if the kana is not in the tables."""
+        state: int | None = 0
+        for c in kana:
+            state = self._transitions[state].get(c)  # type: ignore
+            if state is None:
+                return None
+        return self._outputs[state]  # type: ignore
+
+    def iter_chunks(self, chars: Iterable[str]) -> Iterator[str]:
+        """Split characters into chunks lazily. See `split_hiraganas_alphabets_symbols` for the chunks."""
+        get_flags = self._char_flags.get
+        pattern: str = ""
+        c: str | None = None
+        c_flags: int = 0
+        for next_c in chars:
+            next_flags = get_flags(next_c, 0)
+            if c is not None:
+                pattern += c
+                if not (c_flags & self.FLAG_REQUIRES_NEXT or next_flags & self.FLAG_ATTACHES_PREVIOUS):
+                    yield pattern
+                    pattern = ""
+            c, c_flags = next_c, next_flags
+
+        if c is not None:
+            # NOTE: the last chunk including the case that the sentence ends with 'っ' or 'ん'.
+            yield pattern + c
+
+    def tokenize(self, chunk: str) -> list[str]:
+        """Split a chunk into the longest kanas in the tables. An unknown character is a token by itself."""
+        tokens: list[str] = []
+        i = 0
+        while i < len(chunk):
+            state: int | None = 0
+            end = i + 1
+            for j in range(i, len(chunk)):
+                state = self._transitions[state].get(chunk[j])  # type: ignore
+                if state is None:
+                    break
+                if self._outputs[state] is not None:
+                    end = j + 1
+            tokens.append(chunk[i:end])
+            i = end
+        return tokens
+
+    def to_bytes(self, checksum: bytes = b"") -> bytes:
+        """Serialize the transducer.
+
+        Args:
+            checksum (bytes, optional): up to 32 bytes stored in the header to identify the source tables. Defaults to b"".
+
+        Returns:
+            bytes: the binary representation. All integers are little endian.
+        """  # noqa
+        pool = bytearray()
+        pool_offsets: dict[str, int] = {}
+        states = bytearray()
+        transitions = bytearray()
+        strings = bytearray()
+        num_transitions = num_strings = 0
+        for state, table in enumerate(self._transitions):
+            output = self._outputs[state]
+            states += _STATE.pack(
+                num_transitions,
+                len(table),
+                num_strings if output is not None else -1,
+                len(output) if output is not None else 0,
+                self._flags[state],
+            )
+            for c, next_state in sorted(table.items()):
+                transitions += _TRANSITION.pack(ord(c), next_state)
+                num_transitions += 1
+            for romaji in output or ():
+                if romaji is None:
+                    strings += _STRING.pack(0, _NONE_LENGTH)
+                else:
+                    encoded = romaji.encode("utf-8")
+                    if romaji not in pool_offsets:
+                        pool_offsets[romaji] = len(pool)
+                        pool += encoded
+                    strings += _STRING.pack(pool_offsets[romaji], len(encoded))
+                num_strings += 1
+        header = _HEADER.pack(
+            _MAGIC, FORMAT_VERSION, checksum, len(self._transitions), num_transitions, num_strings, len(pool)
+        )
+        return header + bytes(states) + bytes(transitions) + bytes(strings) + bytes(pool)
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes | mmap.mmap, checksum: bytes | None = None) -> KanaTransducer:
+        """Deserialize the output of `to_bytes`.
+
+        Args:
+            buffer (bytes | mmap.mmap): the binary representation.
+            checksum (bytes | None, optional): if given, the checksum in the header must be equal to it. Defaults to None.
+
+        Returns:
+            KanaTransducer: the transducer.
+
+        Raises:
+            ValueError: if the buffer is not a valid transducer of this version or the checksum does not match.
+        """  # noqa
+        try:
+            magic, version, stored_checksum, num_states, num_transitions, num_strings, pool_size = _HEADER.unpack_from(
+                buffer, 0
+            )  # noqa
+            if magic != _MAGIC or version != FORMAT_VERSION:
+                raise ValueError(f"unsupported format: magic={magic!r}, version={version}")
+            if checksum is not None and stored_checksum != checksum.ljust(32, b"\0"):
+                raise ValueError("checksum mismatch")
+            offset = _HEADER.size
+            # NOTE: the view is released before a mmap is closed.
+            with memoryview(buffer) as view:
+                raw_states = list(_STATE.iter_unpack(view[offset : offset + num_states * _STATE.size]))
+                offset += num_states * _STATE.size
+                raw_transitions = list(
+                    _TRANSITION.iter_unpack(view[offset : offset + num_transitions * _TRANSITION.size])
+                )  # noqa
+                offset += num_transitions * _TRANSITION.size
+                raw_strings = list(_STRING.iter_unpack(view[offset : offset + num_strings * _STRING.size]))
+                offset += num_strings * _STRING.size
+                pool = bytes(view[offset : offset + pool_size])
+                if len(pool) != pool_size:
+                    raise ValueError("truncated buffer")
+                strings: list[str | None] = [
+                    None if length == _NONE_LENGTH else pool[start : start + length].decode("utf-8")
+                    for start, length in raw_strings
+                ]
+                transitions = tuple(
+                    {chr(code): next_state for code, next_state in raw_transitions[first : first + count]}
+                    for first, count, _, _, _ in raw_states
+                )
+                outputs = tuple(
+                    tuple(strings[first : first + count]) if first >= 0 else None
+                    for _, _, first, count, _ in raw_states
+                )
+                flags = tuple(state_flags for *_, state_flags in raw_states)
+        except (struct.error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"invalid transducer: {e}") from e
+        if any(not 0 < s < num_states for table in transitions for s in table.values()):
+            raise ValueError("invalid transducer: a transition to an invalid state")
+        return cls(transitions, outputs, flags)
+
+    def save(self, path: str, checksum: bytes = b"") -> None:
+        """Save the transducer into a binary file atomically. See `to_bytes`."""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.to_bytes(checksum))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, checksum: bytes | None = None) -> KanaTransducer:
+        """Load the transducer from a binary file with mmap. See `from_bytes`.
+
+        Raises:
+            OSError: if the file cannot be read.
+            ValueError: if the file is not a valid transducer or the checksum does not match.
+        """
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return cls.from_bytes(buffer, checksum)
+
+
+def _romaji_maps_checksum(
+    hira2roma_map: Mapping[str, Iterable[str | None]],
+    small_hira2roma_map: Mapping[str, Iterable[str]],
+) -> bytes:
+    return hashlib.sha256(
+        repr(
+            (
+                sorted((k, tuple(v)) for k, v in hira2roma_map.items()),
+                sorted((k, tuple(v)) for k, v in small_hira2roma_map.items()),
+            )
+        ).encode("utf-8")
+    ).digest()
+
+
+def get_kana_transducer_path(cache_direc: str) -> str:
+    """Get the path of the binary file of the transducer in the cache directory."""
+    return os.path.join(cache_direc, f"kana_transducer_v{FORMAT_VERSION}.bin")
+
+
+def load_kana_transducer(
+    hira2roma_map: Mapping[str, Iterable[str | None]],
+    small_hira2roma_map: Mapping[str, Iterable[str]],
+    cache_direc: str,
+) -> KanaTransducer:
+    """Load the transducer of the romaji tables from the cache directory, or compile it in memory.
+
+    Args:
+        hira2roma_map (Mapping[str, Iterable[str | None]]): See `KanaTransducer.from_romaji_maps`.
+        small_hira2roma_map (Mapping[str, Iterable[str]]): See `KanaTransducer.from_romaji_maps`.
+        cache_direc (str): directory of the binary file.
+
+    Returns:
+        KanaTransducer: the transducer.
+
+    NOTE:
+        Nothing is written. The binary file is saved only by `save_kana_transducer`.
+        It has the sha256 of the tables, so that a stale file is ignored.
+    """  # noqa
+    try:
+        return KanaTransducer.load(
+            get_kana_transducer_path(cache_direc),
+            _romaji_maps_checksum(hira2roma_map, small_hira2roma_map),
+        )
+    except (OSError, ValueError):
+        return KanaTransducer.from_romaji_maps(hira2roma_map, small_hira2roma_map)
+
+
+def save_kana_transducer(
+    hira2roma_map: Mapping[str, Iterable[str | None]],
+    small_hira2roma_map: Mapping[str, Iterable[str]],
+    cache_direc: str,
+) -> str:
+    """Compile the transducer of the romaji tables and save it into the cache directory for `load_kana_transducer`.
+
+    Args:
+        hira2roma_map (Mapping[str, Iterable[str | None]]): See `KanaTransducer.from_romaji_maps`.
+        small_hira2roma_map (Mapping[str, Iterable[str]]): See `KanaTransducer.from_romaji_maps`.
+        cache_direc (str): directory of the binary file. It is created if it does not exist.
+
+    Returns:
+        str: the path of the binary file.
+
+    Raises:
+        OSError: if the file cannot be written.
+    """  # noqa
+    path = get_kana_transducer_path(cache_direc)
+    os.makedirs(cache_direc, exist_ok=True)
+    KanaTransducer.from_romaji_maps(hira2roma_map, small_hira2roma_map).save(
+        path,
+        _romaji_maps_checksum(hira2roma_map, small_hira2roma_map),
+    )
+    return path
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
+from threading import Thread
 from typing import Callable
 
 from ..const.keys import EMetaKey
+from ..utils.latency import KeystrokeLatencyTracer
 
 
 class BaseKeyMonitor(ABC):
@@ -33,10 +36,49 @@ class BaseKeyMonitor(ABC):
         """  # noqa
         self._on_release_callback = callback
 
+    def set_latency_tracer(self, tracer: KeystrokeLatencyTracer | None):
+        """Set a tracer which is notified when a key is pressed.
+
+        Args:
+            tracer (KeystrokeLatencyTracer | None): latency tracer. None disables tracing.
+        """  # noqa
+        self._latency_tracer = tracer
+
     @abstractmethod
     def start(self):
         raise NotImplementedError()
 
+    async def start_async(self):
+        """Start the key monitor and wait until it stops without blocking the event loop.
+
+        NOTE:
+            `start` blocks until the key monitor stops, so it is run in a daemon thread
+            and its completion is handed to the event loop through a future.
+            Exceptions raised by `start`, e.g. SystemExit, are re-raised here.
+            The callbacks are called from the thread of the key monitor as well as `start`.
+        """  # noqa
+        loop = asyncio.get_running_loop()
+        stopped: asyncio.Future[None] = loop.create_future()
+
+        def set_result(exception: BaseException | None):
+            if stopped.done():
+                return
+            if exception is None:
+                stopped.set_result(None)
+            else:
+                stopped.set_exception(exception)
+
+        def run():
+            try:
+                self.start()
+            except BaseException as e:  # noqa
+                loop.call_soon_threadsafe(set_result, e)
+            else:
+                loop.call_soon_threadsafe(set_result, None)
+
+        Thread(target=run, name=f"{self.__class__.__name__}.start", daemon=True).start()
+        await stopped
+
     @abstractmethod
     def stop(self):
         raise NotImplementedError()
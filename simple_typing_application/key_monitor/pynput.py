@@ -4,6 +4,7 @@ from typing import Callable
 from pynput import keyboard
 from .base import BaseKeyMonitor
 from ..const.keys import EMetaKey
+from ..utils.latency import KeystrokeLatencyTracer
 
 
 class PynputBasedKeyMonitor(BaseKeyMonitor):
@@ -14,6 +15,7 @@ class PynputBasedKeyMonitor(BaseKeyMonitor):
         self._listener: keyboard.Listener | None = None
         self._on_press_callback: Callable[[EMetaKey | str | None], bool | None] | None = None  # noqa
         self._on_release_callback: Callable[[EMetaKey | str | None], bool | None] | None = None  # noqa
+        self._latency_tracer: KeystrokeLatencyTracer | None = None
         self._logger = logger
 
     def start(self):
@@ -43,6 +45,8 @@ class PynputBasedKeyMonitor(BaseKeyMonitor):
                 return EMetaKey.ESC
             elif key == keyboard.Key.tab:
                 return EMetaKey.TAB
+            elif key == keyboard.Key.backspace:
+                return EMetaKey.BACKSPACE
             elif key == keyboard.Key.space:
                 return " "
             else:
@@ -58,6 +62,8 @@ class PynputBasedKeyMonitor(BaseKeyMonitor):
         self,
         key: keyboard.Key | keyboard.KeyCode | None,
     ):
+        if self._latency_tracer is not None:
+            self._latency_tracer.on_key_received()
         self._logger.debug(f"pressed key: {key}")
         cleaned_key = self._clean_key(key)
 
@@ -6,6 +6,7 @@ from typing import Callable
 from sshkeyboard import listen_keyboard, stop_listening
 from .base import BaseKeyMonitor
 from ..const.keys import EMetaKey
+from ..utils.latency import KeystrokeLatencyTracer
 
 
 class SSHKeyboardBasedKeyMonitor(BaseKeyMonitor):
@@ -15,6 +16,7 @@ class SSHKeyboardBasedKeyMonitor(BaseKeyMonitor):
     ):
         self._on_press_callback: Callable[[EMetaKey | str | None], bool | None] | None = None  # noqa
         self._on_release_callback: Callable[[EMetaKey | str | None], bool | None] | None = None  # noqa
+        self._latency_tracer: KeystrokeLatencyTracer | None = None
         self._logger = logger
 
         self.__thread: Thread | None = None
@@ -53,6 +55,8 @@ class SSHKeyboardBasedKeyMonitor(BaseKeyMonitor):
             return EMetaKey.TAB
         elif key.lower() == "esc":
             return EMetaKey.ESC
+        elif key.lower() == "backspace":
+            return EMetaKey.BACKSPACE
         elif key.lower() == "space":
             return " "
         else:
@@ -60,6 +64,8 @@ class SSHKeyboardBasedKeyMonitor(BaseKeyMonitor):
             return None
 
     def _on_press_callback_wrapper(self, key: str):
+        if self._latency_tracer is not None:
+            self._latency_tracer.on_key_received()
         self._logger.debug(f"pressed key: {key}")
         # record key
         if len(key) == 1:
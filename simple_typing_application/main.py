@@ -7,16 +7,28 @@ from .key_monitor import create_key_monitor
 from .sentence_generator import create_sentence_generator
 from .typing_game import TypingGame
 from .ui import create_user_interface
+from .utils.http_client import configure_http_clients
+from .utils.latency import KeystrokeLatencyTracer
 
 
 @click.command()
 @click.option("--config-path", "-c", default="./config.json", help="path to config file. Defaults to ./config.json")  # noqa
 @click.option("--log-level", "-l", default="INFO", help="log level. Defaults to INFO.")  # noqa
 @click.option("--debug", "-d", is_flag=True, help="debug mode.")
+@click.option(
+    "--trace-latency", is_flag=True, help="measure keystroke-to-echo latency and show its percentiles on exit."
+)  # noqa
+@click.option(
+    "--dump-latency-samples",
+    is_flag=True,
+    help="save raw latency samples to the record directory on exit. Implies --trace-latency.",
+)  # noqa
 def main(
     config_path: str,
     log_level: str,
     debug: bool,
+    trace_latency: bool = False,
+    dump_latency_samples: bool = False,
     logger: logging.Logger = logging.getLogger(__name__),
 ):
     # set log level
@@ -40,12 +52,23 @@ def main(
     config = load_config(config_path)  # noqa
 
     # initialize
+    configure_http_clients(**config.http_client_config.model_dump())
     key_monitor = create_key_monitor(config.key_monitor_type, config.key_monitor_config)  # noqa
     sentence_generator = create_sentence_generator(config.sentence_generator_type, config.sentence_generator_config)  # noqa
     ui = create_user_interface(config.user_interface_type, config.user_interface_config)  # noqa
     record_direc = config.record_direc
+    latency_tracer = (
+        KeystrokeLatencyTracer(keep_samples=dump_latency_samples) if trace_latency or dump_latency_samples else None
+    )
 
-    game = TypingGame(sentence_generator, key_monitor, ui, record_direc)
+    game = TypingGame(
+        sentence_generator,
+        key_monitor,
+        ui,
+        record_direc,
+        latency_tracer=latency_tracer,
+        prefetch_depth=config.prefetch_depth,
+    )  # noqa
     game.start()
 
 
@@ -1,12 +1,20 @@
 from . import config_models
+from . import corpus_compile_result_model
+from . import kana_cache_metrics_model
 from . import output_model
+from . import prefetch_metrics_model
 from . import record_model
+from . import replay_result_model
 from . import typing_target_model
 
 
 __all__ = [
     config_models.__name__,
+    corpus_compile_result_model.__name__,
+    kana_cache_metrics_model.__name__,
     output_model.__name__,
+    prefetch_metrics_model.__name__,
     record_model.__name__,
+    replay_result_model.__name__,
     typing_target_model.__name__,
 ]
@@ -1,5 +1,6 @@
 from . import (
     general_config_model,
+    http_client_config_model,
     key_monitor_config_model,
     sentence_generator_config_model,
     user_interface_config_model,
@@ -10,6 +11,7 @@ from .general_config_model import ConfigModel
 
 __all__ = [
     general_config_model.__name__,
+    http_client_config_model.__name__,
     key_monitor_config_model.__name__,
     sentence_generator_config_model.__name__,
     user_interface_config_model.__name__,
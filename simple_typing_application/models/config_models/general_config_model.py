@@ -1,6 +1,7 @@
 from __future__ import annotations
 from pydantic import BaseModel
 
+from .http_client_config_model import HttpClientConfigModel
 from .key_monitor_config_model import (
     BaseKeyMonitorConfigModel,
     PynputBasedKeyMonitorConfigModel,
@@ -41,3 +42,5 @@ class ConfigModel(BaseModel):
     ) = BaseKeyMonitorConfigModel()
 
     record_direc: str = "./record"
+    prefetch_depth: int = 1
+    http_client_config: HttpClientConfigModel = HttpClientConfigModel()
@@ -0,0 +1,16 @@
+from __future__ import annotations
+from pydantic import BaseModel
+
+from ...utils.http_client import (
+    DEFAULT_KEEPALIVE_EXPIRY_SEC,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_TIMEOUT_SEC,
+)
+
+
+class HttpClientConfigModel(BaseModel):
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry_sec: float = DEFAULT_KEEPALIVE_EXPIRY_SEC
+    timeout_sec: float = DEFAULT_TIMEOUT_SEC
@@ -3,6 +3,8 @@ from dotenv import load_dotenv
 import os
 from pydantic import BaseModel, SecretStr
 
+from ...const.kana_reader import EKanaReaderType
+
 load_dotenv()
 
 
@@ -25,6 +27,13 @@ class HuggingfaceSentenceGeneratorConfigModel(BaseSentenceGeneratorConfigModel):
     top_k: int = 50
     top_p: float = 0.95
     device: str = "cuda"
+    kana_reader_type: EKanaReaderType = EKanaReaderType.EXCELAPI
+    kana_reader_dictionary_path: str | None = None
+    use_kana_cache: bool = True
+    kana_cache_path: str | None = None
+    kana_cache_ttl_sec: float | None = None
+    kana_cache_max_entries: int = 100_000
+    kana_cache_read_only: bool = False
 
 
 class StaticSentenceGeneratorConfigModel(BaseSentenceGeneratorConfigModel):
@@ -33,3 +42,12 @@ class StaticSentenceGeneratorConfigModel(BaseSentenceGeneratorConfigModel):
         "This is a sample text.": "This is a sample text.",
     }
     is_random: bool = False
+    compiled_corpus_path: str | None = None
+    kana_reader_type: EKanaReaderType = EKanaReaderType.EXCELAPI
+    kana_reader_dictionary_path: str | None = None
+    use_kana_cache: bool = True
+    kana_cache_path: str | None = None
+    kana_cache_ttl_sec: float | None = None
+    kana_cache_max_entries: int = 100_000
+    kana_cache_read_only: bool = False
+    kana_prefetch_size: int = 4
@@ -0,0 +1,15 @@
+from __future__ import annotations
+from pydantic import BaseModel, Field
+
+
+class CorpusCompileResultModel(BaseModel):
+    num_lines: int = Field(0, description="The number of non-empty input lines.")
+    num_sentences: int = Field(0, description="The number of compiled sentences.")
+    failed_lines: dict[int, str] = Field(
+        {}, description="The error messages of failed lines by line number (1-origin)."
+    )  # noqa
+    elapsed_time: float = Field(0.0, description="The elapsed time in seconds.")
+
+    @property
+    def sentences_per_sec(self) -> float:
+        return self.num_sentences / max(self.elapsed_time, 1e-9)
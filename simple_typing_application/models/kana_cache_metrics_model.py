@@ -0,0 +1,14 @@
+from __future__ import annotations
+from pydantic import BaseModel, Field
+
+
+class KanaCacheMetricsModel(BaseModel):
+    hits: int = Field(0, description="The number of lookups which found a fresh reading.")
+    misses: int = Field(0, description="The number of lookups which found no fresh reading, including expired ones.")  # noqa
+    expired: int = Field(0, description="The number of lookups which found an expired reading.")
+    writes: int = Field(0, description="The number of readings written to the cache.")
+    evictions: int = Field(0, description="The number of readings evicted because the cache was full.")
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / max(self.hits + self.misses, 1)
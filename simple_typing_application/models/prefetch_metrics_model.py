@@ -0,0 +1,11 @@
+from __future__ import annotations
+from pydantic import BaseModel, Field
+
+
+class PrefetchMetricsModel(BaseModel):
+    depth: int = Field(0, description="The number of typing targets ready in the queue.")
+    max_depth: int = Field(1, description="The maximum number of typing targets prefetched.")
+    num_gets: int = Field(0, description="The number of typing targets taken from the queue.")
+    num_waits: int = Field(0, description="The number of times the queue was empty when a typing target was requested.")  # noqa
+    total_wait_seconds: float = Field(0.0, description="The total time spent waiting for typing targets.")  # noqa
+    last_wait_seconds: float = Field(0.0, description="The time spent waiting for the last typing target.")  # noqa
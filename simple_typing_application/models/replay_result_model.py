@@ -0,0 +1,9 @@
+from __future__ import annotations
+from pydantic import BaseModel, Field
+
+
+class ReplayResultModel(BaseModel):
+    path: str = Field(..., description="The path to the replayed record file.")
+    num_records: int = Field(0, description="The number of replayed records.")
+    num_changed_records: int = Field(0, description="The number of records whose scores have changed.")  # noqa
+    error: str | None = Field(None, description="The error message if the record file could not be replayed.")  # noqa
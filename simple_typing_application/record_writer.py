@@ -0,0 +1,87 @@
+from __future__ import annotations
+import atexit
+import json
+from logging import getLogger, Logger
+from queue import Queue
+from threading import Lock, Thread
+
+from .models.output_model import OutputModel
+
+
+class RecordWriter:
+    """Background writer which serializes outputs and saves them to files.
+
+    Outputs are passed through a bounded queue to a dedicated thread,
+    so that the serialization and the disk I/O do not delay the next typing target.
+    If the queue is full, `submit` blocks until the writer catches up.
+
+    NOTE:
+        `close` waits until all the submitted outputs have been written.
+        It is also registered with `atexit` while the writer is running,
+        so that the outputs are flushed even if the application exits without calling `close`.
+    """  # noqa
+
+    def __init__(
+        self,
+        max_queue_size: int = 16,
+        logger: Logger = getLogger(__name__),
+    ):
+        self._queue: Queue[tuple[str, OutputModel] | None] = Queue(maxsize=max_queue_size)
+        self._logger = logger
+        self._thread: Thread | None = None
+        self._lock = Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def submit(self, path: str, output: OutputModel):
+        """Submit an output to be saved.
+
+        Args:
+            path (str): path to the output file. The output is appended if the file exists.
+            output (OutputModel): output to be saved. It must not be modified after submission.
+        """  # noqa
+        self.start()
+        self._queue.put((path, output))
+
+    def flush(self):
+        """Wait until all the submitted outputs have been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self):
+        """Flush the submitted outputs and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            atexit.unregister(self.close)
+        self._queue.put(None)
+        thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._write(*item)
+            except Exception as e:
+                self._logger.error(f"failed to save the record: {e.__class__.__name__}({e})")  # noqa
+            finally:
+                self._queue.task_done()
+
+    def _write(self, path: str, output: OutputModel):
+        data = output.model_dump(mode="json")
+        with open(path, "a", encoding="utf-8") as f:
+            json.dump(data, f, indent=4, ensure_ascii=False)
+        self._logger.debug(f"The following data has been saved to {path}: {data}")
@@ -0,0 +1,233 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import glob
+import json
+import logging
+from logging import getLogger, Logger
+import os
+import shutil
+import time
+from typing import Any, Iterable, Iterator
+
+import click
+
+from .models.output_model import OutputModel
+from .models.record_model import RecordModel
+from .models.replay_result_model import ReplayResultModel
+from .models.typing_target_model import TypingTargetModel
+from .sentence_generator.utils import (
+    normalize_kana_text,
+    split_hiraganas_alphabets_symbols,
+    splitted_hiraganas_alphabets_symbols_to_typing_target,
+)
+from .typing_automaton import TypingAutomaton, TypingProgress, compile_typing_target
+
+
+@lru_cache(maxsize=1024)
+def _compile_typing_target_cached(typing_target: tuple[tuple[str, ...], ...]) -> TypingAutomaton:
+    return compile_typing_target(typing_target)
+
+
+def _build_progress(typing_target: TypingTargetModel, rebuild_typing_target: bool) -> TypingProgress:
+    if rebuild_typing_target:
+        typing_target = TypingTargetModel(
+            text=typing_target.text,
+            text_hiragana_alphabet_symbol=typing_target.text_hiragana_alphabet_symbol,
+            typing_target=splitted_hiraganas_alphabets_symbols_to_typing_target(
+                split_hiraganas_alphabets_symbols(normalize_kana_text(typing_target.text_hiragana_alphabet_symbol)),
+                normalized=True,
+            ),
+        )
+    automaton = _compile_typing_target_cached(tuple(map(tuple, typing_target.typing_target)))
+    return TypingProgress(typing_target, automaton=automaton)
+
+
+def _replay_keys(
+    progress: TypingProgress,
+    keys: Iterable[tuple[str, bool]],
+) -> Iterator[tuple[tuple[str, ...], bool] | None]:
+    # NOTE: keys are pairs of pressed_key and is_undo. None is yielded for undo.
+    for pressed_key, is_undo in keys:
+        if is_undo:
+            progress.undo()
+            yield None
+        else:
+            correct_keys = progress.correct_keys
+            yield correct_keys, progress.advance(pressed_key)
+
+
+def replay_output(
+    output: OutputModel,
+    rebuild_typing_target: bool = False,
+) -> tuple[OutputModel, int]:
+    """Re-score the records of an output by replaying them through the matcher.
+
+    Args:
+        output (OutputModel): an output saved by `TypingGame`.
+        rebuild_typing_target (bool, optional): if True, rebuild the typing target from `text_hiragana_alphabet_symbol` with the current romaji tables. Defaults to False.
+
+    Returns:
+        OutputModel: the output whose `is_correct` and `correct_keys` of the records are recomputed.
+        int: the number of records whose `is_correct` or `correct_keys` have changed.
+
+    NOTE:
+        Compiled typing targets are cached and reused among outputs with the same typing target.
+    """  # noqa
+    progress = _build_progress(output.typing_target, rebuild_typing_target)
+
+    records: list[RecordModel] = []
+    num_changed_records: int = 0
+    for record, replayed in zip(
+        output.records,
+        _replay_keys(progress, ((record.pressed_key, record.is_undo) for record in output.records)),
+    ):
+        # NOTE: the correct keys are compared as sets because older records stored them in arbitrary order.
+        if replayed is not None and (replayed[1] != record.is_correct or set(replayed[0]) != set(record.correct_keys)):
+            num_changed_records += 1
+            record = record.model_copy(update=dict(correct_keys=replayed[0], is_correct=replayed[1]))
+        records.append(record)
+
+    return (
+        OutputModel.model_construct(timestamp=output.timestamp, typing_target=progress.typing_target, records=records),  # noqa
+        num_changed_records,
+    )
+
+
+def replay_file(
+    path: str,
+    output_direc: str,
+    rebuild_typing_target: bool = False,
+    logger: Logger = getLogger(__name__),
+) -> ReplayResultModel:
+    """Re-score a record file and save the result to `output_direc` with the same file name.
+
+    Args:
+        path (str): path to a record file.
+        output_direc (str): directory where the re-scored record file is saved.
+        rebuild_typing_target (bool, optional): See `replay_output`. Defaults to False.
+        logger (Logger, optional): logger. Defaults to getLogger(__name__).
+
+    Returns:
+        ReplayResultModel: the result. `error` is set instead of raising an exception when the file is invalid.
+
+    NOTE:
+        For speed, the records are processed as plain JSON objects instead of `RecordModel`,
+        and the file is copied as it is when neither the records nor the typing target have changed.
+    """  # noqa
+    output_path = os.path.join(output_direc, os.path.basename(path))
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            output: dict[str, Any] = json.load(f)
+        typing_target = TypingTargetModel.model_validate(output["typing_target"])
+        progress = _build_progress(typing_target, rebuild_typing_target)
+        records: list[dict[str, Any]] = output["records"]
+
+        num_changed_records: int = 0
+        for record, replayed in zip(
+            records,
+            _replay_keys(progress, ((record["pressed_key"], record.get("is_undo", False)) for record in records)),  # noqa
+        ):
+            if replayed is None:
+                continue
+            correct_keys, is_correct = replayed
+            # NOTE: See `replay_output` for the comparison of the correct keys.
+            if is_correct != record["is_correct"] or set(correct_keys) != set(record["correct_keys"]):
+                num_changed_records += 1
+                record["correct_keys"] = list(correct_keys)
+                record["is_correct"] = is_correct
+
+        if num_changed_records == 0 and progress.typing_target is typing_target:
+            shutil.copyfile(path, output_path)
+        else:
+            output["typing_target"] = progress.typing_target.model_dump(mode="json")
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(output, f, indent=4, ensure_ascii=False)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"failed to replay {path}: {e.__class__.__name__}({e})")
+        return ReplayResultModel(path=path, error=f"{e.__class__.__name__}({e})")
+
+    return ReplayResultModel(
+        path=path,
+        num_records=len(records),
+        num_changed_records=num_changed_records,
+    )
+
+
+def replay_files(
+    paths: list[str],
+    output_direc: str,
+    rebuild_typing_target: bool = False,
+    max_workers: int | None = None,
+    chunksize: int = 16,
+) -> list[ReplayResultModel]:
+    """Re-score record files in parallel.
+
+    Args:
+        paths (list[str]): paths to record files.
+        output_direc (str): directory where the re-scored record files are saved.
+        rebuild_typing_target (bool, optional): See `replay_output`. Defaults to False.
+        max_workers (int | None, optional): the number of worker processes. If 1, files are replayed in this process. Defaults to None (the number of CPUs).
+        chunksize (int, optional): the number of files sent to a worker process at once. Defaults to 16.
+
+    Returns:
+        list[ReplayResultModel]: the results in the same order as `paths`.
+    """  # noqa
+    os.makedirs(output_direc, exist_ok=True)
+
+    if max_workers == 1:
+        return [replay_file(path, output_direc, rebuild_typing_target) for path in paths]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                replay_file,
+                paths,
+                [output_direc] * len(paths),
+                [rebuild_typing_target] * len(paths),
+                chunksize=chunksize,
+            )
+        )
+
+
+@click.command()
+@click.option("--input-direc", "-i", required=True, help="directory containing record files.")  # noqa
+@click.option("--output-direc", "-o", required=True, help="directory where re-scored record files are saved.")  # noqa
+@click.option("--rebuild-typing-target", is_flag=True, help="rebuild typing targets with the current romaji tables.")  # noqa
+@click.option(
+    "--max-workers",
+    "-w",
+    default=None,
+    type=int,
+    help="the number of worker processes. Defaults to the number of CPUs.",
+)  # noqa
+@click.option("--debug", "-d", is_flag=True, help="debug mode.")
+def main(
+    input_direc: str,
+    output_direc: str,
+    rebuild_typing_target: bool,
+    max_workers: int | None,
+    debug: bool,
+    logger: logging.Logger = logging.getLogger(__name__),
+):
+    logging.basicConfig(level=logging.DEBUG if debug else logging.INFO)
+
+    # replay
+    paths = sorted(glob.glob(os.path.join(input_direc, "*.json")))
+    start_time = time.perf_counter()
+    results = replay_files(paths, output_direc, rebuild_typing_target=rebuild_typing_target, max_workers=max_workers)  # noqa
+    elapsed_time = time.perf_counter() - start_time
+
+    # report
+    num_records = sum(result.num_records for result in results)
+    num_changed_records = sum(result.num_changed_records for result in results)
+    failed_results = [result for result in results if result.error is not None]
+    for result in failed_results:
+        logger.error(f"failed to replay {result.path}: {result.error}")
+    click.echo(f"files: {len(results)} (failed: {len(failed_results)})")
+    click.echo(f"records: {num_records} (changed: {num_changed_records})")
+    click.echo(f"elapsed time: {elapsed_time:.3f} seconds ({num_records / max(elapsed_time, 1e-9):.0f} keystrokes/sec)")  # noqa
+
+
+if __name__ == "__main__":
+    main()
@@ -10,3 +10,6 @@ class BaseSentenceGenerator(ABC):
         callback: Callable[[TypingTargetModel], TypingTargetModel] = lambda x: x,  # noqa
     ) -> TypingTargetModel:
         raise NotImplementedError()
+
+    def close(self) -> None:
+        """Release the resources of the generator, e.g. background threads. Does nothing by default."""
@@ -10,14 +10,12 @@ except ImportError:
 
 from .base import BaseSentenceGenerator
 from ..models.typing_target_model import TypingTargetModel
-from .utils import (
-    split_hiraganas_alphabets_symbols,
-    splitted_hiraganas_alphabets_symbols_to_typing_target,
-)
-from ..utils.japanese_string_utils import (
-    delete_space_between_hiraganas,
-    excelapi_kanji2kana,
-)
+from .utils import iter_typing_target, normalize_kana_text
+from ..const.kana_reader import EKanaReaderType
+from ..kana_reader.base import BaseKanaReader
+from ..kana_reader.factory import create_kana_reader
+from ..utils.japanese_string_utils import delete_space_between_hiraganas
+from ..utils.kana_cache import DEFAULT_MAX_ENTRIES, KanaCache
 
 
 class HuggingfaceSentenceGenerator(BaseSentenceGenerator):
@@ -30,6 +28,13 @@ class HuggingfaceSentenceGenerator(BaseSentenceGenerator):
         top_p: float = 0.95,
         torch_dtype: "torch.dtype" | None = None,
         device: str | None = None,
+        kana_reader_type: EKanaReaderType = EKanaReaderType.EXCELAPI,
+        kana_reader_dictionary_path: str | None = None,
+        use_kana_cache: bool = True,
+        kana_cache_path: str | None = None,
+        kana_cache_ttl_sec: float | None = None,
+        kana_cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+        kana_cache_read_only: bool = False,
         logger: Logger = getLogger(__name__),
     ) -> None:
         torch_dtype = torch_dtype or torch.float32
@@ -42,6 +47,22 @@ class HuggingfaceSentenceGenerator(BaseSentenceGenerator):
         self._top_k = top_k
         self._top_p = top_p
         self._logger = logger
+        self._kana_cache: KanaCache | None = (
+            KanaCache(kana_cache_path, kana_cache_ttl_sec, kana_cache_max_entries, kana_cache_read_only, logger=logger)
+            if use_kana_cache
+            else None
+        )
+        self._kana_reader: BaseKanaReader = create_kana_reader(
+            kana_reader_type,
+            dictionary_path=kana_reader_dictionary_path,
+            cache=self._kana_cache,
+            logger=logger,
+        )
+
+    @property
+    def kana_cache(self) -> KanaCache | None:
+        """The persistent cache of the readings by excelapi_kanji2kana. None if disabled."""
+        return self._kana_cache
 
     async def generate(
         self,
@@ -62,11 +83,14 @@ class HuggingfaceSentenceGenerator(BaseSentenceGenerator):
         generated_text = generated_text.replace(self._prompt, "")
         generated_text = generated_text.split("。")[0] + ("。" if "。" in generated_text else "")  # noqa
         self._logger.debug(f"generated text: {generated_text}")
-        hiragana_text: str = excelapi_kanji2kana(generated_text)
+        hiragana_text: str = await self._kana_reader.read_async(generated_text)
+        if self._kana_cache is not None:
+            self._logger.debug(f"kana cache metrics: {self._kana_cache.metrics()}")
         self._logger.debug(f"generated text (hira): {hiragana_text}")
-        splitted: list[str] = split_hiraganas_alphabets_symbols(hiragana_text)  # noqa
-        self._logger.debug(f"splitted pattern: {splitted}")
-        typing_target: list[list[str]] = splitted_hiraganas_alphabets_symbols_to_typing_target(splitted)  # noqa
+        typing_target: list[list[str]] = [
+            list(alternatives)
+            for _, alternatives in iter_typing_target(normalize_kana_text(hiragana_text), normalized=True)
+        ]
         self._logger.debug(f"typing target: {typing_target}")
 
         if callback is None:
@@ -9,8 +9,8 @@ from pydantic import BaseModel, Field, SecretStr
 
 from .base import BaseSentenceGenerator
 from ..models.typing_target_model import TypingTargetModel
-from .utils import split_hiraganas_alphabets_symbols, splitted_hiraganas_alphabets_symbols_to_typing_target  # noqa
-from ..utils.japanese_string_utils import delete_space_between_hiraganas
+from .utils import iter_typing_target, normalize_kana_text
+from ..utils.japanese_string_utils import delete_space_between_hiraganas, katakana_to_hiragana
 from ..utils.rerun import rerun_deco
 from ..utils.stopwatch import stopwatch
 
@@ -26,11 +26,17 @@ class _OutputSchema(BaseModel):
         dic: dict[str, str | list[list[str]]] = {}
         # assign values
         dic["text"] = self.text
+        # NOTE: katakanas are converted locally though the prompt forbids them.
+        text_hiragana_alphabet_symbol = katakana_to_hiragana(self.text_hiragana_alphabet_symbol)
         # delete space between hiraganas
-        dic["text_hiragana_alphabet_symbol"] = delete_space_between_hiraganas(self.text_hiragana_alphabet_symbol)
+        dic["text_hiragana_alphabet_symbol"] = delete_space_between_hiraganas(text_hiragana_alphabet_symbol)
         # create typing target
-        splitted = split_hiraganas_alphabets_symbols(self.text_hiragana_alphabet_symbol)
-        dic["typing_target"] = splitted_hiraganas_alphabets_symbols_to_typing_target(splitted)  # noqa
+        dic["typing_target"] = [
+            list(alternatives)
+            for _, alternatives in iter_typing_target(
+                normalize_kana_text(text_hiragana_alphabet_symbol), normalized=True
+            )
+        ]
         return TypingTargetModel(**dic)
 
 
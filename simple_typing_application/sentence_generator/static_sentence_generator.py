@@ -1,74 +1,217 @@
 from __future__ import annotations
+import asyncio
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import getLogger, Logger
-import time
+from threading import Lock
 from typing import Callable
 import random
 
 from .base import BaseSentenceGenerator
 from ..models.typing_target_model import TypingTargetModel
-from .utils import (
-    split_hiraganas_alphabets_symbols,
-    splitted_hiraganas_alphabets_symbols_to_typing_target,
-)
-from ..utils.japanese_string_utils import excelapi_kanji2kana
+from .utils import build_typing_target
+from ..const.kana_reader import EKanaReaderType
+from ..kana_reader.base import BaseKanaReader
+from ..kana_reader.factory import create_kana_reader
+from ..utils.japanese_string_utils import contains_kanji, katakana_to_hiragana
+from ..utils.kana_cache import DEFAULT_MAX_ENTRIES, KanaCache
+
+
+DEFAULT_KANA_PREFETCH_SIZE: int = 4
+
+
+def load_compiled_corpus(path: str) -> tuple[TypingTargetModel, ...]:
+    """Load a compiled corpus.
+
+    Args:
+        path (str): path to a compiled corpus, i.e. JSON Lines of `TypingTargetModel` written by `simple_typing_application.corpus_compiler`.
+
+    Returns:
+        tuple[TypingTargetModel, ...]: the typing targets.
+
+    Raises:
+        ValueError: if the compiled corpus is invalid or empty.
+    """  # noqa
+    with open(path, "r", encoding="utf-8") as f:
+        typing_targets = tuple(TypingTargetModel.model_validate_json(line) for line in f if line.strip())
+    if not typing_targets:
+        raise ValueError(f"The compiled corpus is empty: {path}")
+    return typing_targets
 
 
 class StaticSentenceGenerator(BaseSentenceGenerator):
-    __WAIT_TIME_SEC: float = 1.0
+    """Sentence generator of predefined typing targets.
+
+    The kanas of the texts whose values are None in `text_kana_map` are read lazily by the kana reader:
+    the next `kana_prefetch_size` typing targets are read in the background,
+    and a typing target which has not been read yet is read on its first use.
+    So the first typing target is available without waiting for the whole map to be read.
+
+    NOTE:
+        The requests to excelapi.org are spaced at least 1 second apart by a rate limiter shared by all the generators.
+        A typing target whose kana cannot be read is skipped with a warning and read again on its next use.
+    """  # noqa
 
     def __init__(
         self,
         text_kana_map: dict[str, str | None],
         is_random: bool = False,
+        compiled_corpus_path: str | None = None,
+        kana_reader_type: EKanaReaderType = EKanaReaderType.EXCELAPI,
+        kana_reader_dictionary_path: str | None = None,
+        use_kana_cache: bool = True,
+        kana_cache_path: str | None = None,
+        kana_cache_ttl_sec: float | None = None,
+        kana_cache_max_entries: int = DEFAULT_MAX_ENTRIES,
+        kana_cache_read_only: bool = False,
+        kana_prefetch_size: int = DEFAULT_KANA_PREFETCH_SIZE,
         logger: Logger = getLogger(__name__),
     ) -> None:
-        self._text_kana_pairs = tuple(
-            (k, v if v is not None else self._kanji2kana(k)) for k, v in text_kana_map.items()
+        if kana_prefetch_size < 0:
+            raise ValueError(f"kana_prefetch_size must not be negative, but {kana_prefetch_size} was given.")
+        self._kana_cache: KanaCache | None = (
+            KanaCache(kana_cache_path, kana_cache_ttl_sec, kana_cache_max_entries, kana_cache_read_only, logger=logger)
+            if use_kana_cache
+            else None
+        )
+        self._kana_reader: BaseKanaReader = create_kana_reader(
+            kana_reader_type,
+            dictionary_path=kana_reader_dictionary_path,
+            cache=self._kana_cache,
+            logger=logger,
         )
+        # NOTE: a compiled corpus is used instead of text_kana_map if given.
+        self._compiled_typing_targets: tuple[TypingTargetModel, ...] | None = (
+            load_compiled_corpus(compiled_corpus_path) if compiled_corpus_path is not None else None
+        )
+        self._texts: tuple[str, ...]
+        # NOTE: None for the kanas which have not been read yet.
+        self._kanas: list[str | None]
+        if self._compiled_typing_targets is None:
+            self._texts = tuple(text_kana_map)
+            # NOTE: texts of kanas, alphabets and symbols are converted locally.
+            self._kanas = [
+                katakana_to_hiragana(v) if v is not None else None if contains_kanji(k) else katakana_to_hiragana(k)
+                for k, v in text_kana_map.items()
+            ]
+        else:
+            self._texts = tuple(t.text for t in self._compiled_typing_targets)
+            self._kanas = [t.text_hiragana_alphabet_symbol for t in self._compiled_typing_targets]
+        # NOTE: the number of None in self._kanas, so as not to scan them on every typing target.
+        self._num_unread: int = self._kanas.count(None)
         self._is_random: bool = is_random
         self._index: int = -1
+        self._cursor: int = -1
         self._logger = logger
 
+        self._kana_prefetch_size: int = kana_prefetch_size
+        self._upcoming_indices: deque[int] = deque()
+        self._kana_futures: dict[int, Future[str]] = {}
+        self._kana_lock = Lock()
+        self._kana_executor = ThreadPoolExecutor(
+            max_workers=max(kana_prefetch_size, 1),
+            thread_name_prefix=self.__class__.__name__,
+        )
+        if self._num_unread > 0:
+            # NOTE: start reading the first typing targets in the background.
+            self._prefetch()
+
+    @property
+    def kana_cache(self) -> KanaCache | None:
+        """The persistent cache of the readings by excelapi_kanji2kana. None if disabled."""
+        return self._kana_cache
+
     async def generate(
         self,
         callback: Callable[[TypingTargetModel], TypingTargetModel] | None = None,  # noqa
     ) -> TypingTargetModel:
         # generate
-        generated_text, generated_kana = self._get_next()
+        generated_text, generated_kana = await self._get_next_async()
         self._logger.debug(f"generated text: {generated_text}")
         self._logger.debug(f"generated kana: {generated_kana}")
 
+        # compiled
+        if self._compiled_typing_targets is not None:
+            # NOTE: a shallow copy so that callers cannot replace the fields of the loaded typing targets.
+            compiled = self._compiled_typing_targets[self._index].model_copy()
+            return compiled if callback is None else callback(compiled)
+
         # postprocess
-        splitted = split_hiraganas_alphabets_symbols(generated_kana)
-        self._logger.debug(f"splitted pattern: {splitted}")
-        typing_target = splitted_hiraganas_alphabets_symbols_to_typing_target(splitted)  # noqa
-        self._logger.debug(f"typing target: {typing_target}")
+        typing_target = build_typing_target(generated_text, generated_kana, self._logger)
+        self._logger.debug(f"typing target: {typing_target.typing_target}")
 
         # callback
-        if callback is None:
-            return TypingTargetModel(
-                text=generated_text,
-                text_hiragana_alphabet_symbol=generated_kana,
-                typing_target=typing_target,
-            )
-        else:
-            return callback(
-                TypingTargetModel(
-                    text=generated_text,
-                    text_hiragana_alphabet_symbol=generated_kana,
-                    typing_target=typing_target,
-                )
-            )
-
-    def _get_next(self) -> tuple[str, str]:
-        # get index
+        return typing_target if callback is None else callback(typing_target)
+
+    def close(self) -> None:
+        """Stop reading kanas in the background.
+
+        The reads which have not started are cancelled, and the reads waiting for the rate limiter stop waiting.
+        """
+        self._kana_reader.close()
+        self._kana_executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _get_next_async(self) -> tuple[str, str]:
+        # NOTE: waits for the kana read in the background without blocking the event loop.
+        for _ in range(len(self._texts)):
+            self._index = self._next_index()
+            try:
+                return self._texts[self._index], await asyncio.wrap_future(self._read_kana(self._index))
+            except Exception as e:
+                self._warn_unread(self._index, e)
+        raise RuntimeError("Failed to read the kanas of the typing targets.")
+
+    def _warn_unread(self, index: int, error: Exception) -> None:
+        self._logger.warning(
+            f"Skip {self._texts[index]} because its kana cannot be read: {error.__class__.__name__}({error})"
+        )
+
+    def _draw_index(self) -> int:
         if self._is_random:
-            self._index = random.randint(0, len(self._text_kana_pairs) - 1)
-        else:
-            self._index = (self._index + 1) % len(self._text_kana_pairs)
+            return random.randint(0, len(self._texts) - 1)
+        self._cursor = (self._cursor + 1) % len(self._texts)
+        return self._cursor
+
+    def _next_index(self) -> int:
+        if not self._upcoming_indices:
+            self._upcoming_indices.append(self._draw_index())
+        index = self._upcoming_indices.popleft()
+        if self._num_unread > 0:
+            self._prefetch()
+        return index
+
+    def _prefetch(self) -> None:
+        # NOTE: draw the next indices in advance so that their kanas are read in the background.
+        while len(self._upcoming_indices) < self._kana_prefetch_size:
+            self._upcoming_indices.append(self._draw_index())
+        for index in self._upcoming_indices:
+            self._read_kana(index)
 
-        return self._text_kana_pairs[self._index]
+    def _read_kana(self, index: int) -> Future[str]:
+        """Get the kana of the text at index, which is read in the background unless it has been read or is being read."""  # noqa
+        with self._kana_lock:
+            kana = self._kanas[index]
+            if kana is not None:
+                future: Future[str] = Future()
+                future.set_result(kana)
+                return future
+            if index not in self._kana_futures:
+                self._kana_futures[index] = self._kana_executor.submit(self._read_kana_in_background, index)
+            return self._kana_futures[index]
 
-    def _kanji2kana(self, text: str) -> str:
-        time.sleep(self.__WAIT_TIME_SEC)
-        return excelapi_kanji2kana(text)
+    def _read_kana_in_background(self, index: int) -> str:
+        try:
+            kana = self._kana_reader.read(self._texts[index])
+        except Exception:
+            # NOTE: a kana which failed to be read is read again on its next use.
+            with self._kana_lock:
+                self._kana_futures.pop(index, None)
+            raise
+        with self._kana_lock:
+            if self._kanas[index] is None:
+                self._num_unread -= 1
+            self._kanas[index] = kana
+            self._kana_futures.pop(index, None)
+        if self._kana_cache is not None:
+            self._logger.debug(f"kana cache metrics: {self._kana_cache.metrics()}")
+        return kana
@@ -1,7 +1,73 @@
 from __future__ import annotations
-import itertools
+from functools import lru_cache
 from logging import getLogger, Logger
-from ..const.hiragana_romaji_map import HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP
+from typing import Iterable, Iterator
+from ..const.hiragana_romaji_map import HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, get_cache_direc
+from ..kana_transducer import KanaTransducer, load_kana_transducer
+from ..models.typing_target_model import TypingTargetModel
+from ..utils.japanese_string_utils import katakana_to_hiragana
+from ..utils.lru_cache import CacheInfo, LRUCache
+
+
+_EXPANSION_CACHE: LRUCache[str, tuple[str, ...]] = LRUCache(maxsize=4096)
+
+
+# NOTE: zenkaku ascii -> hankaku ascii, and zenkaku symbol -> hankaku symbol
+_KANA_NORMALIZATION_TABLE: dict[int, int] = {
+    **str.maketrans(
+        "#　！＂＃＄％＆＇（）＊＋，－．／０１２３４５６７８９：；＜＝＞？＠ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺ［＼］＾＿｀ａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ｛｜｝～￥",  # noqa
+        "# !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¥",  # noqa
+    ),
+    **str.maketrans(
+        "、。・「」ー",
+        ",./[]-",
+    ),
+}
+
+MAX_EXPANSION_ALTERNATIVES: int = 10000
+_FORBIDDEN_SUBSTRINGS: tuple[str, ...] = ("xxtsu", "lltsu")  # NOTE: 'xxtsu' -> 'ｘっ', 'lltsu' -> 'ｌっ'
+_TAIL_LENGTH: int = max(map(len, _FORBIDDEN_SUBSTRINGS)) - 1
+
+
+class TooManyAlternativesError(ValueError):
+    """Raised when a chunk has too many romaji alternatives to be expanded."""
+
+
+@lru_cache(maxsize=None)
+def get_kana_transducer() -> KanaTransducer:
+    """Get the transducer of the romaji tables, which splitting, tokenizing and looking up romajis share.
+
+    Returns:
+        KanaTransducer: the transducer.
+
+    NOTE:
+        The transducer is built on the first call, not at import.
+        It is loaded with mmap from the cache directory if `python -m simple_typing_application.corpus_compiler --save-kana-transducer` has saved it,
+        otherwise compiled in memory. Nothing is written into the cache directory.
+    """  # noqa
+    return load_kana_transducer(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, get_cache_direc())
+
+
+def iter_hiraganas_alphabets_symbols(chars: Iterable[str]) -> Iterator[str]:
+    """Split characters of hiraganas, alphabets, and symbols into chunks lazily.
+
+    Args:
+        chars (Iterable[str]): characters, e.g. a string or a stream of characters.
+
+    Yields:
+        str: a chunk of hiraganas, alphabets, and symbols. See `split_hiraganas_alphabets_symbols`.
+
+    NOTE:
+        Each chunk is yielded as soon as the next character is read.
+
+    Examples:
+    >>> chunks = iter_hiraganas_alphabets_symbols('あっ、なんなん？')
+    >>> next(chunks), next(chunks)
+    ('あ', 'っ、')
+    >>> list(chunks)
+    ['な', 'んな', 'ん？']
+    """  # noqa
+    return get_kana_transducer().iter_chunks(chars)
 
 
 def split_hiraganas_alphabets_symbols(s: str) -> list[str]:
@@ -43,37 +109,287 @@ def split_hiraganas_alphabets_symbols(s: str) -> list[str]:
     >>> split_hiraganas_alphabets_symbols(s)
     ['っきゃぁ']
     """
-    # split hiraganas into patterns
-    patterns: list[str] = []
-    pattern: list[str] = []
-    for c, next_c in zip(s, s[1:] + " "):
-        pattern.append(c)
-        if c in ["っ", "ん"] or next_c in SMALL_HIRA2ROMA_MAP:
-            # NOTE: 'っ' and 'ん' requires the next character.
-            # NOTE: keys of SMALL_HIRA2ROMA_MAP require the previous character.
-            # See ../const/hiragana_romaji_map.py.
+    return list(iter_hiraganas_alphabets_symbols(s))
+
+
+def normalize_kana_text(text: str) -> str:
+    """Normalize zenkaku ascii characters and Japanese symbols into hankaku ones.
+
+    Args:
+        text (str): a string of hiraganas, alphabets, and symbols.
+
+    Returns:
+        str: the normalized string.
+
+    NOTE:
+        The translation table is built once at import.
+        Call this once per sentence and pass `normalized=True` to `splitted_hiraganas_alphabets_symbols_to_typing_target`
+        instead of normalizing each chunk.
+
+    Examples:
+    >>> normalize_kana_text('ＨＥＬＬＯ、せかい！「ー」')
+    'HELLO,せかい![-]'
+    """  # noqa
+    return text.translate(_KANA_NORMALIZATION_TABLE)
+
+
+def _expand_lattice(
+    splitted: list[str],
+    max_alternatives: int = MAX_EXPANSION_ALTERNATIVES,
+    max_candidates: int | None = None,
+    allow_none: bool = True,
+) -> list[str]:
+    """Expand a lattice of the romaji candidates of characters into typing targets.
+
+    Args:
+        splitted (list[str]): characters (or combinations of a character and a small hiragana) of a chunk.
+        max_alternatives (int, optional): the maximum number of typing targets. Defaults to MAX_EXPANSION_ALTERNATIVES.
+        max_candidates (int | None, optional): if given, only the first `max_candidates` romajis of each character in the romaji tables are used. Defaults to None.
+        allow_none (bool, optional): if False, None, i.e. doubling the next consonant for 'っ', is not used. Defaults to True.
+
+    Returns:
+        list[str]: typing targets. They may contain duplicates.
+
+    Raises:
+        TooManyAlternativesError: if the number of typing targets exceeds `max_alternatives`.
+
+    NOTE:
+        The adjacency rules of 'っ' (None) and 'ん' ('n') and the invalid repetition patterns are applied
+        while walking the lattice, so that no invalid combination is enumerated.
+        The suffixes are memoized by the position and the context, i.e. whether the previous candidate is None or 'n',
+        and the last characters which can be a part of an invalid repetition pattern.
+
+    Examples:
+    >>> sorted(_expand_lattice(['っ', 'あ']))
+    ['ltsua', 'ltua', 'xtsua', 'xtua']
+    >>> sorted(_expand_lattice(['ん', 'な']))
+    ["n'na", 'nnna', 'xnna']
+    """  # noqa
+    candidates: list[tuple[str | None, ...]] = [
+        tuple(dict.fromkeys(get_kana_transducer().lookup(c) or (c,))) for c in splitted
+    ]
+    if max_candidates is not None or not allow_none:
+        candidates = [
+            ((None,) if allow_none and None in c else ()) + tuple(x for x in c if x is not None)[:max_candidates]
+            for c in candidates
+        ]
+    num_chars = len(candidates)
+
+    def transitions(i: int, prev_is_none: bool, prev_is_n: bool, tail: str) -> list[tuple[str, bool, bool, str]]:
+        # NOTE: returns (emitted string, next is None, next is 'n', next tail) for each valid candidate of i-th character.  # noqa
+        results: list[tuple[str, bool, bool, str]] = []
+        for candidate in candidates[i]:
+            if candidate is None:
+                if prev_is_none:
+                    # Example: 'tttu' -> 'ｔっつ'
+                    continue
+                results.append(("", True, False, tail))
+                continue
+            if prev_is_none:
+                if candidate[0] in ["a", "i", "u", "e", "o", "n"]:
+                    # Example: 'aa' -> not 'っあ' but 'ああ'
+                    continue
+                if not ("a" <= candidate[0] <= "z" or "A" <= candidate[0] <= "Z"):
+                    # Example: ',,' -> not 'っ、' but '、、'
+                    continue
+                emitted = candidate[0] + candidate
+            elif prev_is_n and candidate[0] in ["a", "i", "u", "e", "o", "n", "y"]:
+                # Example: 'nna' -> not 'んな' but 'んあ'
+                continue
+            else:
+                emitted = candidate
+            text = tail + emitted
+            if any(forbidden in text for forbidden in _FORBIDDEN_SUBSTRINGS):
+                continue
+            results.append((emitted, False, candidate == "n", text[-_TAIL_LENGTH:]))
+        return results
+
+    # forward: collect reachable contexts and their transitions
+    # NOTE: a context is a tuple of (previous candidate is None, previous candidate is 'n', tail).  # noqa
+    initial_context: tuple[bool, bool, str] = (False, False, "")
+    edges: list[dict[tuple[bool, bool, str], list[tuple[str, bool, bool, str]]]] = []
+    contexts: set[tuple[bool, bool, str]] = {initial_context}
+    for i in range(num_chars):
+        edges.append({context: transitions(i, *context) for context in contexts})
+        contexts = {(is_none, is_n, tail) for results in edges[i].values() for _, is_none, is_n, tail in results}
+
+    # backward: count the typing targets from each context
+    # NOTE: the counts saturate at max_alternatives + 1 so that they do not grow exponentially for pathological inputs.  # noqa
+    saturation = max_alternatives + 1
+    counts: dict[tuple[bool, bool, str], int] = {
+        context: int(not context[0] and not context[1]) for context in contexts
+    }
+    counts_list = [counts]
+    for i in reversed(range(num_chars)):
+        counts = {
+            context: min(sum(counts_list[-1][(is_none, is_n, tail)] for _, is_none, is_n, tail in results), saturation)
+            for context, results in edges[i].items()
+        }
+        counts_list.append(counts)
+    num_alternatives = counts[initial_context]
+    if num_alternatives > max_alternatives:
+        chunk = "".join(splitted)
+        raise TooManyAlternativesError(
+            f"{chunk if len(chunk) <= 32 else chunk[:32] + '...'} has more than {max_alternatives} romaji alternatives."
+        )
+
+    # backward: expand the suffixes from each context which leads to a typing target
+    suffixes: dict[tuple[bool, bool, str], tuple[str, ...]] = {
+        context: ("",) for context, count in counts_list[0].items() if count > 0
+    }
+    for i in reversed(range(num_chars)):
+        suffixes = {
+            context: tuple(
+                emitted + suffix
+                for emitted, is_none, is_n, tail in results
+                for suffix in suffixes.get((is_none, is_n, tail), ())
+            )
+            for context, results in edges[i].items()
+            if counts_list[num_chars - i][context] > 0
+        }
+    return list(suffixes.get(initial_context, ()))
+
+
+def _expand_lattice_with_fallback(
+    splitted: list[str],
+    max_alternatives: int = MAX_EXPANSION_ALTERNATIVES,
+    logger: Logger = getLogger(__name__),
+) -> list[str]:
+    """Expand a lattice like `_expand_lattice`, but fall back to the preferred romajis if there are too many alternatives.
+
+    Args:
+        splitted (list[str]): See `_expand_lattice`.
+        max_alternatives (int, optional): See `_expand_lattice`. Defaults to MAX_EXPANSION_ALTERNATIVES.
+        logger (Logger, optional): a logger. Defaults to getLogger(__name__).
+
+    Returns:
+        list[str]: typing targets. All of them are correct, but some correct typings may be missing if the fallback is used.
+
+    Raises:
+        TooManyAlternativesError: if no fallback works.
+
+    NOTE:
+        The fallbacks are tried in order: the first 2 romajis with None, the first romaji with None, and the first romaji without None.
+        The last one has at most one typing target, so that the time is linear in the length of the chunk.
+
+    Examples:
+    >>> len(_expand_lattice_with_fallback(['っ'] * 8))
+    985
+    >>> _expand_lattice_with_fallback(['っ'] * 30)[0][:12]
+    'xtuxtuxtuxtu'
+    """  # noqa
+    try:
+        return _expand_lattice(splitted, max_alternatives)
+    except TooManyAlternativesError as e:
+        error = e
+
+    for max_candidates, allow_none in [(2, True), (1, True), (1, False)]:
+        try:
+            targets = _expand_lattice(splitted, max_alternatives, max_candidates=max_candidates, allow_none=allow_none)
+        except TooManyAlternativesError:
             continue
-        else:
-            patterns.append("".join(pattern))
-            pattern = []
+        if targets:
+            logger.warning(f"{error} Only {len(targets)} preferred alternatives are accepted.")
+            return targets
+    raise error
+
+
+def _expand_chunk(
+    pattern: str,
+    logger: Logger = getLogger(__name__),
+) -> tuple[str, ...]:
+    # initialize
+    targets: list[str]
+
+    # pattern -> typing target
+    if pattern.isascii() or pattern == "¥":
+        # NOTE: pattern is typing target when pattern is ascii.
+        targets = [pattern]
+
+    elif pattern == "ん":
+        # Case: the sentence ends with 'ん'.
+        targets = [c for c in HIRA2ROMA_MAP[pattern] if c != "n" and c is not None]  # noqa
+
+    elif pattern == "っ":
+        # Case: the sentence ends with 'っ'.
+        targets = [c for c in HIRA2ROMA_MAP[pattern] if c is not None]  # noqa
+
+    elif pattern in HIRA2ROMA_MAP:
+        # NOTE: pattern is a key of typing target when pattern is in HIRA2ROMA_MAP.  # noqa
+        # NOTE: Assume that HIRA2ROMA_MAP[pattern] does not contain None when pattern is in HIRA2ROMA_MAP.  # noqa
+        targets = list(HIRA2ROMA_MAP[pattern])  # type: ignore
+
+    else:
+        logger.warning(f'This pattern "{pattern}" may cause unexpected behavior.')  # noqa
+
+        # extract typing targets from the lattice of candidates
+        _target = _expand_lattice_with_fallback(get_kana_transducer().tokenize(pattern), logger=logger)
+
+        targets = _target
+
+    # check
+    for target in targets:
+        if not target.isascii() and target != "¥":
+            raise ValueError(f"Invalid typing target: {target}")
+
+    # clean
+    return tuple(sorted(set(targets)))
+
+
+def expand_chunk(
+    pattern: str,
+    logger: Logger = getLogger(__name__),
+    normalized: bool = False,
+) -> tuple[str, ...]:
+    """Get the romaji alternatives of a chunk of hiraganas, alphabets, and symbols.
+
+    Args:
+        pattern (str): a chunk like an element of the output of `split_hiraganas_alphabets_symbols`.
+        logger (Logger, optional): a logger. Defaults to getLogger(__name__).
+        normalized (bool, optional): if True, `pattern` is assumed to be normalized by `normalize_kana_text`. Defaults to False.
+
+    Returns:
+        tuple[str, ...]: the sorted romaji alternatives.
+
+    Raises:
+        ValueError: if the chunk cannot be converted into romaji.
+
+    NOTE:
+        The alternatives are memoized by the normalized chunk in a bounded LRU cache.
+        The returned tuple is shared among callers. See `expansion_cache_info`.
+
+    Examples:
+    >>> expand_chunk('し')
+    ('ci', 'shi', 'si')
+    >>> expand_chunk('し') is expand_chunk('し')
+    True
+    """  # noqa
+    if not normalized:
+        pattern = normalize_kana_text(pattern)
+    return _EXPANSION_CACHE.get_or_compute(pattern, lambda p: _expand_chunk(p, logger))
 
-    if c in ["っ", "ん"]:
-        # Case: the sentence ends with 'っ' or 'ん'.
-        patterns.append("".join(pattern))
-        pattern = []
 
-    return patterns
+def expansion_cache_info() -> CacheInfo:
+    """Get the hits, misses, maxsize, and current size of the cache of `expand_chunk`."""
+    return _EXPANSION_CACHE.info()
+
+
+def clear_expansion_cache():
+    """Clear the cache of `expand_chunk`."""
+    _EXPANSION_CACHE.clear()
 
 
 def splitted_hiraganas_alphabets_symbols_to_typing_target(
     splitted_patterns: list[str],
     logger: Logger = getLogger(__name__),
+    normalized: bool = False,
 ) -> list[list[str]]:
     """Convert a list of splitted hiraganas, alphabets, and symbols into a typing target.
 
     Args:
         splitted_patterns (list[str]): a list of splitted hiraganas, alphabets, and symbols.
         logger (Logger, optional): a logger. Defaults to getLogger(__name__).
+        normalized (bool, optional): if True, the patterns are assumed to be split from a string normalized by `normalize_kana_text`. Defaults to False.
 
     Returns:
         list[list[str]]: a typing target.
@@ -94,132 +410,74 @@ def splitted_hiraganas_alphabets_symbols_to_typing_target(
     [['ltsua', 'ltua', 'xtsua', 'xtua']]
     """  # noqa
 
-    # initialize
-    typing_targets: list[list[str]] = []
-
-    for pattern in splitted_patterns:
-        # clean
-        # zenkaku ascii -> hankaku ascii
-        pattern = pattern.translate(
-            str.maketrans(
-                "#　！＂＃＄％＆＇（）＊＋，－．／０１２３４５６７８９：；＜＝＞？＠ＡＢＣＤＥＦＧＨＩＪＫＬＭＮＯＰＱＲＳＴＵＶＷＸＹＺ［＼］＾＿｀ａｂｃｄｅｆｇｈｉｊｋｌｍｎｏｐｑｒｓｔｕｖｗｘｙｚ｛｜｝～￥",  # noqa
-                "# !\"#$%&'()*+,-./0123456789:;<=>?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_`abcdefghijklmnopqrstuvwxyz{|}~¥",  # noqa
-            )
-        )
-        # zenkaku symbol -> hankaku symbol
-        pattern = pattern.translate(
-            str.maketrans(
-                "、。・「」ー",
-                ",./[]-",
-            )
-        )
+    return [list(expand_chunk(pattern, logger, normalized=normalized)) for pattern in splitted_patterns]
 
-        # pattern -> typing target
-        if pattern.isascii() or pattern == "¥":
-            # NOTE: pattern is typing target when pattern is ascii.
-            typing_targets.append([pattern])
-
-        elif pattern == "ん":
-            # Case: the sentence ends with 'ん'.
-            typing_targets.append([c for c in HIRA2ROMA_MAP[pattern] if c != "n" and c is not None])  # noqa
-
-        elif pattern == "っ":
-            # Case: the sentence ends with 'っ'.
-            typing_targets.append([c for c in HIRA2ROMA_MAP[pattern] if c is not None])  # noqa
-
-        elif pattern in HIRA2ROMA_MAP:
-            # NOTE: pattern is a key of typing target when pattern is in HIRA2ROMA_MAP.  # noqa
-            # NOTE: Assume that HIRA2ROMA_MAP[pattern] does not contain None when pattern is in HIRA2ROMA_MAP.  # noqa
-            typing_targets.append(HIRA2ROMA_MAP[pattern])  # type: ignore
-
-        else:
-            logger.warning(f'This pattern "{pattern}" may cause unexpected behavior.')  # noqa
-
-            # initialize
-            _target = []
-
-            # split
-            _splitted: list[str] = []
-            for c in pattern:
-                if c in SMALL_HIRA2ROMA_MAP and len(_splitted) > 0 and _splitted[-1] + c in HIRA2ROMA_MAP:
-                    _splitted[-1] += c
-                else:
-                    _splitted.append(c)
-
-            # extract typing targets from candidates
-            candidate: tuple[str | None, ...]
-            for candidate in itertools.product(
-                *[HIRA2ROMA_MAP.get(c, SMALL_HIRA2ROMA_MAP.get(c, [c])) for c in _splitted]
-            ):
-                # preparation
-                target_flag = True
-
-                # check
-                if candidate[-1] == "n" or candidate[-1] is None:
-                    target_flag = False
-                    continue
 
-                for s, t in zip(candidate, candidate[1:]):
-                    if s is None and t is None:
-                        # Example: 'tttu' -> 'ｔっつ'
-                        target_flag = False
-                        break
-                    if s is None and t is not None and t[0] in ["a", "i", "u", "e", "o", "n"]:  # noqa
-                        # Example: 'aa' -> not 'っあ' but 'ああ'
-                        target_flag = False
-                        break
-                    if s is None and t is not None and not ("a" <= t[0] <= "z" or "A" <= t[0] <= "Z"):  # noqa
-                        # Example: ',,' -> not 'っ、' but '、、'
-                        target_flag = False
-                        break
-                    if s == "n" and t is not None and t[0] in ["a", "i", "u", "e", "o", "n", "y"]:  # noqa
-                        # Example: 'nna' -> not 'んな' but 'んあ'
-                        target_flag = False
-                        break
-
-                if not target_flag:
-                    continue  # Skip this candidate.
-
-                # join
-                _joined = "".join(
-                    [
-                        x if x is not None else y[0]  # type: ignore
-                        # NOTE: when x is None, y is not None. See the above for-loop.  # noqa
-                        for x, y in zip(candidate, candidate[1:] + (None,))
-                    ]
-                )
-
-                # invalid repetition patterns
-                if "xxtsu" in _joined:
-                    # NOTE: 'xxtsu' -> 'ｘっ'
-                    target_flag = False
-                    continue
-                if "lltsu" in _joined:
-                    # NOTE: 'lltsu' -> 'ｌっ'
-                    target_flag = False
-                    continue
+def iter_typing_target(
+    chars: Iterable[str],
+    logger: Logger = getLogger(__name__),
+    normalized: bool = False,
+) -> Iterator[tuple[str, tuple[str, ...]]]:
+    """Tokenize characters and expand each chunk into romaji alternatives in a single pass.
 
-                # target registration
-                if target_flag:
-                    _target.append(
-                        "".join(
-                            [
-                                x if x is not None else y[0]  # type: ignore
-                                # NOTE: when x is None, y is not None. See the above for-loop.  # noqa
-                                for x, y in zip(candidate, candidate[1:] + (None,))
-                            ]
-                        )
-                    )
+    Args:
+        chars (Iterable[str]): characters of hiraganas, alphabets, and symbols, e.g. a string or a stream of characters.
+        logger (Logger, optional): a logger. Defaults to getLogger(__name__).
+        normalized (bool, optional): if True, `chars` are assumed to be normalized by `normalize_kana_text`. Defaults to False.
 
-            typing_targets.append(_target)
+    Yields:
+        tuple[str, tuple[str, ...]]: a chunk and its sorted romaji alternatives. See `expand_chunk`.
 
-    # check
-    for targets in typing_targets:
-        for target in targets:
-            if not target.isascii() and target != "¥":
-                raise ValueError(f"Invalid typing target: {target}")
+    Raises:
+        ValueError: if a chunk cannot be converted into romaji. The chunks before it have already been yielded.
 
-    # clean
-    typing_targets = [sorted(set(targets)) for targets in typing_targets]
+    NOTE:
+        No intermediate list is built, so that a consumer can start on the first chunk before a long text is processed.
+        The alternatives are shared with the cache of `expand_chunk`.
 
-    return typing_targets
+    Examples:
+    >>> chunks = iter_typing_target('こんにちは')
+    >>> next(chunks)
+    ('こ', ('co', 'ko'))
+    >>> [list(alternatives) for _, alternatives in chunks]
+    [["n'ni", 'nnni', 'xnni'], ['chi', 'ti'], ['ha']]
+    """  # noqa
+    for chunk in iter_hiraganas_alphabets_symbols(chars):
+        yield chunk, expand_chunk(chunk, logger, normalized=normalized)
+
+
+def build_typing_target(
+    text: str,
+    kana: str,
+    logger: Logger = getLogger(__name__),
+) -> TypingTargetModel:
+    """Build a typing target from a text and its kana.
+
+    Args:
+        text (str): the text to display.
+        kana (str): the kana of the text. Katakanas are converted into hiraganas.
+        logger (Logger, optional): a logger. Defaults to getLogger(__name__).
+
+    Returns:
+        TypingTargetModel: the typing target.
+
+    Raises:
+        ValueError: if the kana cannot be converted into romaji.
+
+    NOTE:
+        The static sentence generator and the corpus compiler share this function,
+        so that a compiled corpus is the same as the one converted at runtime.
+
+    Examples:
+    >>> build_typing_target('ヴァイオリン', 'ヴァイオリン').text_hiragana_alphabet_symbol
+    'ゔぁいおりん'
+    """  # noqa
+    kana = katakana_to_hiragana(kana)
+    return TypingTargetModel(
+        text=text,
+        text_hiragana_alphabet_symbol=kana,
+        typing_target=[
+            list(alternatives)
+            for _, alternatives in iter_typing_target(normalize_kana_text(kana), logger, normalized=True)
+        ],
+    )
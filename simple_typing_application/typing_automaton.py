@@ -0,0 +1,282 @@
+from __future__ import annotations
+from collections import deque
+from typing import Sequence
+
+from .models.typing_target_model import TypingTargetModel
+
+
+class TypingAutomaton:
+    """Deterministic automaton compiled from a typing target.
+
+    Each state corresponds to a pair of the index of the current chunk of the typing target
+    and the patterns of the chunk which are still partially matched.
+    A keystroke is accepted if and only if the current state has a transition for it.
+
+    NOTE:
+        Do not instantiate this class directly. Use `compile_typing_target` instead.
+    """  # noqa
+
+    def __init__(
+        self,
+        chunks: tuple[tuple[str, ...], ...],
+        transitions: tuple[dict[str, int], ...],
+        chunk_indices: tuple[int, ...],
+        pending: tuple[tuple[str, ...], ...],
+        next_keys: tuple[tuple[str, ...], ...],
+        initial_state: int,
+        accept_state: int,
+    ) -> None:
+        self._chunks = chunks
+        self._transitions = transitions
+        self._chunk_indices = chunk_indices
+        self._pending = pending
+        self._next_keys = next_keys
+        self._initial_state = initial_state
+        self._accept_state = accept_state
+
+    @property
+    def chunks(self) -> tuple[tuple[str, ...], ...]:
+        """The patterns of each chunk of the typing target."""
+        return self._chunks
+
+    @property
+    def transitions(self) -> tuple[dict[str, int], ...]:
+        """Transition tables. `transitions[state][char]` is the next state."""
+        return self._transitions
+
+    @property
+    def chunk_indices(self) -> tuple[int, ...]:
+        """The index of the chunk of the typing target for each state."""
+        return self._chunk_indices
+
+    @property
+    def pending(self) -> tuple[tuple[str, ...], ...]:
+        """The remaining parts of the partially matched patterns for each state."""
+        return self._pending
+
+    @property
+    def next_keys(self) -> tuple[tuple[str, ...], ...]:
+        """The sorted correct keys for each state.
+
+        NOTE:
+            States with the same correct keys share the same tuple object.
+        """
+        return self._next_keys
+
+    @property
+    def initial_state(self) -> int:
+        return self._initial_state
+
+    @property
+    def accept_state(self) -> int:
+        return self._accept_state
+
+    @property
+    def num_states(self) -> int:
+        return len(self._transitions)
+
+    def step(self, state: int, char: str) -> int | None:
+        """Get the next state.
+
+        Args:
+            state (int): the current state.
+            char (str): an input character.
+
+        Returns:
+            int | None: the next state. None if `char` is not acceptable at `state`.
+        """
+        return self._transitions[state].get(char)
+
+    def is_accepted(self, state: int) -> bool:
+        return state == self._accept_state
+
+
+def compile_typing_target(typing_target: Sequence[Sequence[str]]) -> TypingAutomaton:
+    """Compile a typing target into a deterministic automaton.
+
+    Args:
+        typing_target (Sequence[Sequence[str]]): a typing target like `TypingTargetModel.typing_target`.
+
+    Returns:
+        TypingAutomaton: the compiled automaton.
+
+    NOTE:
+        When a pattern of a chunk has been input, the other partially matched patterns of the chunk
+        are carried over to the next chunk.
+
+    Examples:
+    >>> automaton = compile_typing_target([['ti', 'chi'], ['a']])
+    >>> state = automaton.step(automaton.initial_state, 'c')
+    >>> automaton.pending[state]
+    ('hi',)
+    >>> automaton.step(state, 't') is None
+    True
+    >>> state = automaton.step(automaton.step(state, 'h'), 'i')
+    >>> automaton.chunk_indices[state], automaton.pending[state]
+    (1, ('a',))
+    >>> automaton.is_accepted(automaton.step(state, 'a'))
+    True
+    """  # noqa
+    # initialize
+    chunks: tuple[tuple[str, ...], ...] = tuple(tuple(dict.fromkeys(chunk)) for chunk in typing_target)
+    num_chunks: int = len(chunks)
+    state_ids: dict[tuple[int, tuple[str, ...]], int] = {}
+    transitions: list[dict[str, int]] = []
+    chunk_indices: list[int] = []
+    pending: list[tuple[str, ...]] = []
+    queue: deque[int] = deque()
+
+    def get_or_create_state(chunk_index: int, patterns: tuple[str, ...]) -> int:
+        key = (chunk_index, patterns) if chunk_index < num_chunks else (num_chunks, ())
+        if key not in state_ids:
+            state_ids[key] = len(transitions)
+            transitions.append({})
+            chunk_indices.append(key[0])
+            pending.append(key[1])
+            queue.append(state_ids[key])
+        return state_ids[key]
+
+    initial_state = get_or_create_state(0, chunks[0] if chunks else ())
+    accept_state = get_or_create_state(num_chunks, ())
+
+    # build transitions
+    while queue:
+        state = queue.popleft()
+        chunk_index = chunk_indices[state]
+        if chunk_index == num_chunks:
+            continue
+
+        patterns = pending[state]
+        for char in dict.fromkeys(pattern[0] for pattern in patterns if pattern):
+            next_patterns = tuple(dict.fromkeys(pattern[1:] for pattern in patterns if pattern.startswith(char)))  # noqa
+            if "" not in next_patterns:
+                transitions[state][char] = get_or_create_state(chunk_index, next_patterns)
+                continue
+
+            # NOTE: '' in next_patterns means that a pattern has been input correctly.
+            carried_over = tuple(pattern for pattern in next_patterns if pattern)
+            if chunk_index + 1 < num_chunks:
+                transitions[state][char] = get_or_create_state(
+                    chunk_index + 1,
+                    tuple(dict.fromkeys(chunks[chunk_index + 1] + carried_over)),
+                )
+            else:
+                transitions[state][char] = accept_state
+
+    # precompute correct keys
+    interned_keys: dict[tuple[str, ...], tuple[str, ...]] = {}
+    next_keys: tuple[tuple[str, ...], ...] = tuple(
+        interned_keys.setdefault(keys, keys) for keys in (tuple(sorted(table)) for table in transitions)
+    )
+
+    return TypingAutomaton(
+        chunks=chunks,
+        transitions=tuple(transitions),
+        chunk_indices=tuple(chunk_indices),
+        pending=tuple(pending),
+        next_keys=next_keys,
+        initial_state=initial_state,
+        accept_state=accept_state,
+    )
+
+
+class TypingProgress:
+    """Progress of typing a typing target.
+
+    The typing target is compiled once and never copied nor modified.
+    The progress is represented by the current state of the compiled automaton,
+    which determines the position in the typing target and the partially matched patterns.
+    The states before each input character are stacked so that `undo` takes O(1).
+
+    Examples:
+    >>> progress = TypingProgress(
+    ...     TypingTargetModel(text="ちあ", text_hiragana_alphabet_symbol="ちあ", typing_target=[["ti", "chi"], ["a"]])
+    ... )
+    >>> progress.romaji
+    'tia'
+    >>> progress.advance('c'), progress.advance('x')
+    (True, False)
+    >>> progress.position, progress.partial_matches, progress.romaji
+    (0, ('hi',), 'hia')
+    >>> progress.undo(), progress.undo(), progress.partial_matches
+    (True, True, ('ti', 'chi'))
+    >>> [progress.advance(c) for c in 'tia'], progress.is_done
+    ([True, True, True], True)
+    """  # noqa
+
+    def __init__(
+        self,
+        typing_target: TypingTargetModel,
+        automaton: TypingAutomaton | None = None,
+    ) -> None:
+        self._typing_target = typing_target
+        self._automaton = automaton or compile_typing_target(typing_target.typing_target)
+        self._state = self._automaton.initial_state
+        self._history: list[int] = []
+
+    @property
+    def typing_target(self) -> TypingTargetModel:
+        return self._typing_target
+
+    @property
+    def automaton(self) -> TypingAutomaton:
+        return self._automaton
+
+    @property
+    def state(self) -> int:
+        return self._state
+
+    @property
+    def position(self) -> int:
+        """The index of the chunk of the typing target to be input next."""
+        return self._automaton.chunk_indices[self._state]
+
+    @property
+    def partial_matches(self) -> tuple[str, ...]:
+        """The remaining parts of the partially matched patterns of the current chunk."""
+        return self._automaton.pending[self._state]
+
+    @property
+    def correct_keys(self) -> tuple[str, ...]:
+        """The keys which are correct at the current position."""
+        return self._automaton.next_keys[self._state]
+
+    @property
+    def is_done(self) -> bool:
+        return self._state == self._automaton.accept_state
+
+    @property
+    def romaji(self) -> str:
+        """One of the correct key sequences for the rest of the typing target."""
+        if self.is_done:
+            return ""
+        return "".join(
+            self.partial_matches[:1] + tuple(chunk[0] for chunk in self._automaton.chunks[self.position + 1 :])
+        )  # noqa
+
+    def advance(self, char: str) -> bool:
+        """Advance the progress with an input character.
+
+        Args:
+            char (str): an input character.
+
+        Returns:
+            bool: True if the input character is correct. The position does not change otherwise.
+        """  # noqa
+        self._history.append(self._state)
+        next_state = self._automaton.transitions[self._state].get(char)
+        if next_state is None:
+            return False
+        self._state = next_state
+        return True
+
+    def undo(self) -> bool:
+        """Undo the last input character whether it was correct or not.
+
+        Returns:
+            bool: True if an input character has been undone. False if there is nothing to undo.
+        """  # noqa
+        if not self._history:
+            return False
+        self._state = self._history.pop()
+        return True
@@ -1,7 +1,6 @@
 from __future__ import annotations
 import asyncio
 from datetime import datetime as dt
-import json
 from logging import getLogger, Logger
 import os
 
@@ -10,60 +9,42 @@ from .const.keys import EMetaKey
 from .key_monitor.base import BaseKeyMonitor
 from .models.output_model import OutputModel
 from .models.record_model import RecordModel
-from .models.typing_target_model import TypingTargetModel
+from .record_writer import RecordWriter
 from .sentence_generator.base import BaseSentenceGenerator
+from .typing_automaton import TypingProgress
+from .typing_target_queue import TypingTargetQueue
 from .ui.base import BaseUserInterface
+from .utils.http_client import aclose_async_client, close_http_clients
+from .utils.latency import KeystrokeLatencyTracer
 
 
-def _input_char_is_correct(
-    char: str,
-    typing_target: TypingTargetModel,
-) -> tuple[bool, TypingTargetModel]:
+def _input_char_is_correct(char: str, progress: TypingProgress) -> bool:
     """Check if the input character is correct.
 
     Args:
         char (str): an input character.
-        typing_target (TypingTargetModel): typing target.
+        progress (TypingProgress): the current typing progress.
+            It is advanced when the input character is correct.
 
     Returns:
         bool: True if the input character is correct.
-        TypingTargetModel: the next typing pattern.
     """
-    # check
-    new_typing_target = typing_target.model_copy(deep=True)
-    new_typing_target.typing_target[0] = [
-        pattern[1:] for pattern in new_typing_target.typing_target[0] if pattern.startswith(char)
-    ]
+    return progress.advance(char)
 
-    # return result
-    if len(new_typing_target.typing_target[0]) == 0:
-        return False, typing_target
-    else:
-        if "" in new_typing_target.typing_target[0]:
-            # NOTE: When '' in typing_target.typing_target[0], it means that a patten has been input correctly.  # noqa
-            # TODO: pop(0) is slow.
-            head = new_typing_target.typing_target.pop(0)
-            head.remove("")
 
-            if new_typing_target.typing_target:
-                new_typing_target.typing_target[0].extend(head)
-
-        return True, new_typing_target
-
-
-def _typing_is_done(typing_target: TypingTargetModel) -> bool:
+def _typing_is_done(progress: TypingProgress) -> bool:
     """Check if typing is done.
 
     Args:
-        typing_target (TypingTargetModel): typing target.
+        progress (TypingProgress): the current typing progress.
 
     Returns:
         bool: True if typing is done.
 
     NOTE:
-        Typing is done when typing_target.typing_target is empty.
+        Typing is done when all the chunks of the typing target have been input.
     """  # noqa
-    return len(typing_target.typing_target) == 0
+    return progress.is_done
 
 
 class TypingGame:
@@ -80,15 +61,24 @@ class TypingGame:
         ui: BaseUserInterface,
         record_direc: str,
         logger: Logger = getLogger(__name__),
+        latency_tracer: KeystrokeLatencyTracer | None = None,
+        prefetch_depth: int = 1,
     ):
         self._sentence_generator = sentence_generator
         self._key_monitor = key_monitor
         self._ui = ui
         self._record_direc = record_direc
         self._logger = logger
+        self._latency_tracer = latency_tracer
+        self._record_writer = RecordWriter(logger=logger)
+        self._typing_target_queue = TypingTargetQueue(sentence_generator, max_depth=prefetch_depth, logger=logger)  # noqa
 
-        self.__current_typing_target: TypingTargetModel | None = None
+        if self._latency_tracer is not None:
+            self._key_monitor.set_latency_tracer(self._latency_tracer)
+
+        self.__current_progress: TypingProgress | None = None
         self.__current_records: list[RecordModel] | None = None
+        self.__exit_requested: bool = False
 
         os.makedirs(self._record_direc, exist_ok=True)
 
@@ -123,25 +113,56 @@ class TypingGame:
 Key Commands:
   - Press 'Esc' to exit the game at any time.
   - Press 'Tab' to skip the current typing target.
+  - Press 'Backspace' to undo the last input.
 """
 
     def start(self):
-        asyncio.run(self._main_loop())
+        try:
+            asyncio.run(self._main_loop())
+        finally:
+            # NOTE: make sure that all the records are saved before exit.
+            self._record_writer.close()
+            self._sentence_generator.close()
+            close_http_clients()
+            if self._latency_tracer is not None:
+                self._report_latency(self._latency_tracer)
+
+    def _report_latency(self, tracer: KeystrokeLatencyTracer):
+        self._ui.system_anounce("")
+        self._ui.system_anounce("Keystroke-to-echo latency:", color=self._system_anounce_color)  # noqa
+        self._ui.system_anounce(tracer.format_summary())
+        if tracer.keep_samples:
+            path = os.path.join(self._record_direc, f"latency_{dt.now().strftime('%Y%m%d_%H%M%S')}.jsonl")  # noqa
+            tracer.dump_samples(path)
+            self._ui.system_anounce(f"Latency samples have been saved to {path}")
+
+    @property
+    def typing_target_queue(self) -> TypingTargetQueue:
+        return self._typing_target_queue
+
+    @property
+    def record_writer(self) -> RecordWriter:
+        return self._record_writer
 
     async def _main_loop(self):
         # initialize
-        task1 = asyncio.create_task(self._sentence_generator.generate())
-        typing_target: TypingTargetModel = await task1  # type: ignore
+        # NOTE: typing targets are generated in the background while typing.
+        self._typing_target_queue.start()
 
         # typing start
-        while True:
-            self._logger.debug(f"typing target: {typing_target}")
-            self._show_typing_target(typing_target)
-            task1 = asyncio.create_task(self._sentence_generator.generate())
-            task2 = asyncio.create_task(self._typing_step(typing_target))
-            typing_target, _ = await asyncio.gather(task1, task2)
-
-    def _show_typing_target(self, typing_target: TypingTargetModel):
+        try:
+            while True:
+                progress = await self._typing_target_queue.get()
+                self._logger.debug(f"typing target: {progress.typing_target}")
+                self._show_typing_target(progress)
+                await self._typing_step(progress)
+        finally:
+            await self._typing_target_queue.stop()
+            # NOTE: the async HTTP client must be closed in the event loop which created it.
+            await aclose_async_client()
+
+    def _show_typing_target(self, progress: TypingProgress):
+        typing_target = progress.typing_target
         self._ui.system_anounce("")
         self._ui.show_typing_target(
             typing_target.text,
@@ -156,47 +177,50 @@ Key Commands:
             title_color=self._typing_target_title_color,
         )
         self._ui.show_typing_target(
-            "".join([target[0] for target in typing_target.typing_target]),
+            progress.romaji,
             title="Typing Target (Romaji)",
             color=self._typing_target_text_color,
             title_color=self._typing_target_title_color,
         )
 
-    async def _typing_step(self, typing_target: TypingTargetModel):
+    async def _typing_step(self, progress: TypingProgress):
         # initialize
-        self.__initialize_typing_step(typing_target.model_copy(deep=True))
-        assert self.__current_typing_target is not None
+        self.__initialize_typing_step(progress)
+        assert self.__current_progress is not None
         assert self.__current_records is not None
         output = OutputModel(
             timestamp=dt.now(),
-            typing_target=typing_target.model_copy(deep=True),
+            typing_target=self.__current_progress.typing_target,
             records=self.__current_records,
         )
         output_path = os.path.join(self._record_direc, f"{dt.now().strftime('%Y%m%d_%H%M%S')}.json")  # noqa
 
-        # start
-        self._key_monitor.start()
+        # start and wait for done
+        # NOTE: the event loop is not blocked while typing so that the next typing target is generated in the background.  # noqa
+        await self._key_monitor.start_async()
 
-        # wait for done
         # post process
+        # NOTE: serialization and disk I/O are done by the background writer.
         output.records = sorted(list(self.__current_records), key=lambda x: x.timestamp)  # noqa
-        self._logger.debug(f"The following data has been saved to {output_path}: {output.model_dump(mode='json')}")  # noqa
-        with open(output_path, "a", encoding="utf-8") as f:
-            json.dump(output.model_dump(mode="json"), f, indent=4, ensure_ascii=False)  # noqa
+        self._record_writer.submit(output_path, output)
 
         # clean up
         self.__clean_up_typing_step()
 
+        if self.__exit_requested:
+            # NOTE: exit from the event loop, too, because the key monitor may catch SystemExit in its own thread.  # noqa
+            exit(-1)
+
         return
 
-    def __initialize_typing_step(self, typing_target: TypingTargetModel):
-        self.__current_typing_target = typing_target
+    def __initialize_typing_step(self, progress: TypingProgress):
+        self.__current_progress = progress
         self.__current_records = []
         self._key_monitor.set_on_press_callback(self.__on_press_callback)
         self._key_monitor.set_on_release_callback(self.__on_release_callback)
 
     def __clean_up_typing_step(self):
-        self.__current_typing_target = None
+        self.__current_progress = None
         self.__current_records = None
         self._key_monitor.set_on_press_callback(None)
         self._key_monitor.set_on_release_callback(None)
@@ -211,6 +235,7 @@ Key Commands:
 
     def __exit_typing_step(self):
         self._ui.system_anounce("EXIT!", color=self._system_anounce_color)
+        self.__exit_requested = True
         self._key_monitor.stop()
         exit(-1)
 
@@ -218,18 +243,22 @@ Key Commands:
         self,
         key: EMetaKey | str | None,
     ) -> bool | None:
+        if self._latency_tracer is not None:
+            self._latency_tracer.on_callback_started()
+
         # validation
-        assert self.__current_typing_target is not None
+        assert self.__current_progress is not None
         assert self.__current_records is not None
 
         # preparation
-        record = RecordModel(
+        # NOTE: model_construct skips validation so that correct_keys shares the precomputed tuple.  # noqa
+        record = RecordModel.model_construct(
             timestamp=dt.now(),
             pressed_key="",
             is_correct=False,
-            correct_keys=list(set([x[0] for x in self.__current_typing_target.typing_target[0] if len(x) > 0])),  # noqa
+            correct_keys=self.__current_progress.correct_keys,
         )
-        self._logger.debug(f"current typing target: {self.__current_typing_target}")  # noqa
+        self._logger.debug(f"current position: {self.__current_progress.position}")  # noqa
         self._logger.debug(f"correct keys: {record.correct_keys}")
 
         # chcek key
@@ -237,11 +266,21 @@ Key Commands:
             self._logger.debug("Escape key has been pressed.")
         elif key == EMetaKey.TAB:
             self._logger.debug("Tab key has been pressed.")
+        elif key == EMetaKey.BACKSPACE:
+            self._logger.debug("Backspace key has been pressed.")
+            if self.__current_progress.undo():
+                record.pressed_key = EMetaKey.BACKSPACE.value
+                record.is_undo = True
+                self._ui.erase_user_input()
         elif isinstance(key, str):
             self._logger.debug(f"{key} key has been pressed.")
             record.pressed_key = key
-            record.is_correct, self.__current_typing_target = _input_char_is_correct(key, self.__current_typing_target)  # noqa
+            record.is_correct = _input_char_is_correct(key, self.__current_progress)
+            if self._latency_tracer is not None:
+                self._latency_tracer.on_echo_started()
             self._ui.show_user_input(key, color=EColor.GREEN if record.is_correct else EColor.RED)  # noqa
+            if self._latency_tracer is not None:
+                self._latency_tracer.on_echo_finished()
         else:
             self._logger.debug("key is invalid.")
 
@@ -255,7 +294,7 @@ Key Commands:
         self._logger.debug(f"{key} key has been released.")
 
         # validation
-        assert self.__current_typing_target is not None
+        assert self.__current_progress is not None
         assert self.__current_records is not None
 
         # meta key
@@ -267,7 +306,7 @@ Key Commands:
             return False
 
         # check if typing is done
-        if _typing_is_done(self.__current_typing_target):
+        if _typing_is_done(self.__current_progress):
             self._logger.debug("Typing is done.")
             self.__done_typing_step()
             return False
@@ -0,0 +1,118 @@
+from __future__ import annotations
+import asyncio
+from logging import getLogger, Logger
+import time
+
+from .models.prefetch_metrics_model import PrefetchMetricsModel
+from .models.typing_target_model import TypingTargetModel
+from .sentence_generator.base import BaseSentenceGenerator
+from .typing_automaton import TypingProgress
+
+
+class TypingTargetQueue:
+    """Bounded queue of typing targets prefetched in the background.
+
+    A producer task keeps generating typing targets with a sentence generator
+    and compiling them into `TypingProgress` until `max_depth` of them are waiting to be typed.
+    Whenever a typing target is taken, e.g. after it has been typed or skipped,
+    the producer starts generating the next one immediately.
+
+    NOTE:
+        `max_depth` includes the typing target being generated,
+        so `max_depth=1` looks one typing target ahead like the original main loop.
+    """  # noqa
+
+    def __init__(
+        self,
+        sentence_generator: BaseSentenceGenerator,
+        max_depth: int = 1,
+        logger: Logger = getLogger(__name__),
+    ):
+        if max_depth < 1:
+            raise ValueError(f"max_depth must be positive, but {max_depth} was given.")
+
+        self._sentence_generator = sentence_generator
+        self._max_depth = max_depth
+        self._logger = logger
+
+        self._queue: asyncio.Queue[TypingProgress] | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._producer: asyncio.Task | None = None
+        self._metrics = PrefetchMetricsModel(max_depth=max_depth)
+
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @property
+    def metrics(self) -> PrefetchMetricsModel:
+        return self._metrics.model_copy(update=dict(depth=self._queue.qsize() if self._queue else 0))
+
+    def start(self):
+        """Start the producer task. This must be called in a running event loop."""
+        if self._producer is not None:
+            self._logger.warning(f"{self.__class__.__name__}() has already been started.")
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_depth)
+        self._slots = asyncio.Semaphore(self._max_depth)
+        self._producer = asyncio.create_task(self._produce())
+
+    async def stop(self):
+        """Cancel the producer task and discard the prefetched typing targets."""
+        if self._producer is None:
+            return
+        self._producer.cancel()
+        try:
+            await self._producer
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self._logger.debug(f"the producer has stopped with {e.__class__.__name__}({e})")
+        self._producer = None
+        self._queue = None
+        self._slots = None
+
+    async def get(self) -> TypingProgress:
+        """Take the next typing target. Wait until it is ready if the queue is empty.
+
+        Returns:
+            TypingProgress: the progress of the next typing target, whose automaton has been compiled.
+
+        Raises:
+            RuntimeError: if the queue has not been started.
+            Exception: the exception raised by the sentence generator.
+        """  # noqa
+        if self._producer is None or self._queue is None or self._slots is None:
+            raise RuntimeError(f"{self.__class__.__name__}() has not been started.")
+
+        start_time = time.perf_counter()
+        waited = self._queue.empty()
+        if waited:
+            getter = asyncio.ensure_future(self._queue.get())
+            await asyncio.wait({getter, self._producer}, return_when=asyncio.FIRST_COMPLETED)
+            if not getter.done():
+                getter.cancel()
+                # NOTE: the producer has stopped without a typing target, so raise its exception.  # noqa
+                self._producer.result()
+                raise RuntimeError("the producer has stopped unexpectedly.")
+            progress = getter.result()
+        else:
+            progress = self._queue.get_nowait()
+        wait_seconds = time.perf_counter() - start_time
+        self._slots.release()
+
+        self._metrics.num_gets += 1
+        self._metrics.num_waits += int(waited)
+        self._metrics.total_wait_seconds += wait_seconds
+        self._metrics.last_wait_seconds = wait_seconds
+        self._logger.debug(f"prefetch metrics: {self.metrics}")
+        return progress
+
+    async def _produce(self) -> None:
+        assert self._queue is not None
+        assert self._slots is not None
+        while True:
+            await self._slots.acquire()
+            typing_target: TypingTargetModel = await self._sentence_generator.generate()
+            self._logger.debug(f"prefetched typing target: {typing_target}")
+            self._queue.put_nowait(TypingProgress(typing_target))
@@ -23,6 +23,10 @@ class BaseUserInterface(ABC):
     ) -> None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def erase_user_input(self) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     def system_anounce(
         self,
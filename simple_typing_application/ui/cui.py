@@ -21,6 +21,9 @@ class ConsoleUserInterface(BaseUserInterface):
         text = f"{ecolor2terminalcolor_map[color]}{text}{ecolor2terminalcolor_map[EColor.END]}"  # noqa
         print(text, end="", flush=True)
 
+    def erase_user_input(self) -> None:
+        print("\b \b", end="", flush=True)
+
     def system_anounce(self, text: str, *, color: EColor = EColor.DEFAULT) -> None:
         text = f"{ecolor2terminalcolor_map[color]}{text}{ecolor2terminalcolor_map[EColor.END]}"  # noqa
         print(text, flush=True)
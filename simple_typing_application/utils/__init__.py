@@ -1,8 +1,12 @@
 from . import japanese_string_utils
+from . import latency
+from . import lru_cache
 from . import rerun
 
 
 __all__ = [
     japanese_string_utils.__name__,
+    latency.__name__,
+    lru_cache.__name__,
     rerun.__name__,
 ]
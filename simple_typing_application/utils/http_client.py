@@ -0,0 +1,120 @@
+from __future__ import annotations
+import asyncio
+from threading import Lock
+import weakref
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+
+DEFAULT_MAX_CONNECTIONS: int = 10
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: int = 10
+DEFAULT_KEEPALIVE_EXPIRY_SEC: float = 30.0
+DEFAULT_TIMEOUT_SEC: float = 10.0
+
+_lock = Lock()
+_max_connections: int = DEFAULT_MAX_CONNECTIONS
+_max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+_keepalive_expiry_sec: float = DEFAULT_KEEPALIVE_EXPIRY_SEC
+_timeout_sec: float = DEFAULT_TIMEOUT_SEC
+_session: requests.Session | None = None
+# NOTE: an httpx.AsyncClient cannot be used across event loops, so that a client is created for each event loop.
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = weakref.WeakKeyDictionary()
+
+
+def configure_http_clients(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry_sec: float = DEFAULT_KEEPALIVE_EXPIRY_SEC,
+    timeout_sec: float = DEFAULT_TIMEOUT_SEC,
+) -> None:
+    """Configure the shared HTTP clients. The clients created before are closed.
+
+    Args:
+        max_connections (int, optional): the maximum number of connections of a client. Defaults to DEFAULT_MAX_CONNECTIONS.
+        max_keepalive_connections (int, optional): the maximum number of idle connections kept alive. Defaults to DEFAULT_MAX_KEEPALIVE_CONNECTIONS.
+        keepalive_expiry_sec (float, optional): seconds after which idle connections of the async clients are closed. Defaults to DEFAULT_KEEPALIVE_EXPIRY_SEC.
+        timeout_sec (float, optional): timeout of a request in seconds. Defaults to DEFAULT_TIMEOUT_SEC.
+
+    Raises:
+        ValueError: if a limit is not positive.
+    """  # noqa
+    global _max_connections, _max_keepalive_connections, _keepalive_expiry_sec, _timeout_sec
+    if min(max_connections, max_keepalive_connections) < 1 or min(keepalive_expiry_sec, timeout_sec) <= 0:
+        raise ValueError(
+            "limits must be positive, but "
+            f"max_connections={max_connections}, max_keepalive_connections={max_keepalive_connections}, "
+            f"keepalive_expiry_sec={keepalive_expiry_sec}, timeout_sec={timeout_sec} were given."
+        )
+    close_http_clients()
+    with _lock:
+        _max_connections = max_connections
+        _max_keepalive_connections = max_keepalive_connections
+        _keepalive_expiry_sec = keepalive_expiry_sec
+        _timeout_sec = timeout_sec
+
+
+def get_timeout_sec() -> float:
+    return _timeout_sec
+
+
+def get_session() -> requests.Session:
+    """Get the shared `requests.Session` whose connections are pooled and kept alive.
+
+    NOTE:
+        The session can be used from multiple threads. Up to `max_connections` connections to a host are pooled.
+    """
+    global _session
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=_max_connections, pool_maxsize=_max_connections)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Get the shared `httpx.AsyncClient` of the running event loop.
+
+    Raises:
+        RuntimeError: if there is no running event loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=_max_connections,
+                    max_keepalive_connections=_max_keepalive_connections,
+                    keepalive_expiry=_keepalive_expiry_sec,
+                ),
+                timeout=_timeout_sec,
+            )
+            _async_clients[loop] = client
+        return client
+
+
+async def aclose_async_client() -> None:
+    """Close the shared `httpx.AsyncClient` of the running event loop if any."""
+    with _lock:
+        client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def close_http_clients() -> None:
+    """Close the shared `requests.Session` and forget the async clients.
+
+    NOTE:
+        The async clients are not closed here because they must be closed in their event loops.
+        Use `aclose_async_client` in the event loop to close them explicitly.
+    """
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+        _async_clients.clear()
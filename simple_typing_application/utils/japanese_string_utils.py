@@ -1,10 +1,35 @@
-import requests
+from __future__ import annotations
+import asyncio
 import time
+from typing import Awaitable, Callable
+from urllib.parse import quote
 
 from ..const.hiragana_katakana_map import KATAKANA2HIRAGANA_MAP
+from .http_client import get_async_client, get_session, get_timeout_sec
+from .kana_cache import KanaCache
 from .rerun import rerun_deco
 
 
+EXCELAPI_KANJI2KANA_URL: str = "https://api.excelapi.org/language/kanji2kana"
+
+
+# NOTE: small 'ヵ' and 'ヶ' are read as 'か' and 'け' because 'ゕ' and 'ゖ' cannot be typed.
+#       'ヷ', 'ヸ', 'ヹ' and 'ヺ' have no hiragana and are decomposed.
+#       halfwidth 'ｰ' is the long vowel mark.
+_KATAKANA2HIRAGANA_TABLE: dict[int, str] = str.maketrans(
+    {
+        **KATAKANA2HIRAGANA_MAP,
+        "ヵ": "か",
+        "ヶ": "け",
+        "ヷ": "ゔぁ",
+        "ヸ": "ゔぃ",
+        "ヹ": "ゔぇ",
+        "ヺ": "ゔぉ",
+        "ｰ": "ー",
+    }
+)
+
+
 def is_hiragana(c: str) -> bool:
     """Check if a character is a hiragana.
 
@@ -30,6 +55,45 @@ def is_hiragana(c: str) -> bool:
     return "ぁ" <= c <= "ゔ"
 
 
+def katakana_to_hiragana(s: str) -> str:
+    """Convert katakanas into hiraganas in one pass.
+
+    Args:
+        s (str): a string including katakanas.
+
+    Returns:
+        str: a string where katakanas are replaced with hiraganas.
+
+    NOTE:
+        The long vowel mark 'ー' is kept as it is, and halfwidth 'ｰ' is converted into 'ー'.
+
+    Examples:
+    >>> katakana_to_hiragana('ファーブルのヴァイオリン')
+    'ふぁーぶるのゔぁいおりん'
+    >>> katakana_to_hiragana('ヷｰ')
+    'ゔぁー'
+    """
+    return s.translate(_KATAKANA2HIRAGANA_TABLE)
+
+
+def contains_kanji(s: str) -> bool:
+    """Check if a string contains kanjis, which require the reading to be typed.
+
+    Args:
+        s (str): a string.
+
+    Returns:
+        bool: True if `s` contains a CJK ideograph or an ideographic mark like '々', otherwise False.
+
+    Examples:
+    >>> contains_kanji('ファーブル、Hello!')
+    False
+    >>> contains_kanji('日々')
+    True
+    """
+    return any("\u4e00" <= c <= "\u9fff" or "\u3400" <= c <= "\u4dbf" or c in "々〆〇" for c in s)
+
+
 def delete_space_between_hiraganas(s: str) -> str:
     """Delete spaces between hiraganas.
 
@@ -64,6 +128,9 @@ def excelapi_kanji2kana(
     transform_katakana_to_hiragana: bool = True,
     max_retry: int = 3,
     interval_sec: float = 3.0,
+    cache: KanaCache | None = None,
+    before_request: Callable[[], None] | None = None,
+    url: str = EXCELAPI_KANJI2KANA_URL,
 ) -> str:
     """Convert kanji to kana using excelapi.org.
 
@@ -72,6 +139,9 @@ def excelapi_kanji2kana(
         transform_katakana_to_hiragana (bool, optional): if True, transform katakana to hiragana. Defaults to True.
         max_retry (int, optional): max number of retries. Defaults to 3.
         interval_sec (float, optional): interval seconds between retries. Defaults to 3.
+        cache (KanaCache | None, optional): a cache of the results. If given, the API is requested only on a miss. Defaults to None.
+        before_request (Callable[[], None] | None, optional): function called before requesting the API, e.g. to wait. Defaults to None.
+        url (str, optional): the endpoint of the API, e.g. a local stand-in server. Defaults to EXCELAPI_KANJI2KANA_URL.
 
     Returns:
         str: a string including kana.
@@ -82,14 +152,87 @@ def excelapi_kanji2kana(
 
     NOTE:
         ref. https://excelapi.org/docs/language/kanji2kana/
+        The connections are pooled and kept alive by the shared `requests.Session`. See `simple_typing_application.utils.http_client`.
+        Use `excelapi_kanji2kana_async` in async functions so as not to block the event loop.
     """  # noqa
 
-    url = f"https://api.excelapi.org/language/kanji2kana?text={text}"
-    response = rerun_deco(
-        requests.get,
-        max_retry=max_retry,
-        callback=lambda *args, **kwargs: time.sleep(interval_sec),
-    )(url)
+    def request(text: str) -> str:
+        if before_request is not None:
+            before_request()
+        response = rerun_deco(
+            get_session().get,
+            max_retry=max_retry,
+            callback=lambda *args, **kwargs: time.sleep(interval_sec),
+        )(f"{url}?text={quote(text, safe='')}", timeout=get_timeout_sec())
+
+        # chech status code
+        response.raise_for_status()
+        transformed_text: str = response.text
+
+        # katakana -> hiragana
+        if transform_katakana_to_hiragana:
+            transformed_text = katakana_to_hiragana(transformed_text)
+
+        return transformed_text
+
+    if cache is None:
+        return request(text)
+    return cache.get_or_compute(text, request, options=_excelapi_cache_options(transform_katakana_to_hiragana))
+
+
+async def excelapi_kanji2kana_async(
+    text: str,
+    transform_katakana_to_hiragana: bool = True,
+    max_retry: int = 3,
+    interval_sec: float = 3.0,
+    cache: KanaCache | None = None,
+    before_request: Callable[[], Awaitable[None]] | None = None,
+    url: str = EXCELAPI_KANJI2KANA_URL,
+) -> str:
+    """Convert kanji to kana using excelapi.org without blocking the event loop.
+
+    Args:
+        text (str): a string including kanji.
+        transform_katakana_to_hiragana (bool, optional): if True, transform katakana to hiragana. Defaults to True.
+        max_retry (int, optional): max number of retries. Defaults to 3.
+        interval_sec (float, optional): interval seconds between retries. Defaults to 3.
+        cache (KanaCache | None, optional): a cache of the results, shared with `excelapi_kanji2kana`. Defaults to None.
+        before_request (Callable[[], Awaitable[None]] | None, optional): coroutine function awaited before requesting the API. Defaults to None.
+        url (str, optional): See `excelapi_kanji2kana`. Defaults to EXCELAPI_KANJI2KANA_URL.
+
+    Returns:
+        str: a string including kana.
+
+    Raises:
+        httpx.HTTPStatusError: if the status code is not 20x.
+        simple_typing_application.utils.rerun.MaxRetryError: if the request fails max_retry times.
+
+    NOTE:
+        The connections are pooled and kept alive by the shared `httpx.AsyncClient` of the running event loop.
+        See `simple_typing_application.utils.http_client`.
+        The cache is read and written in worker threads, i.e. off the event loop.
+    """  # noqa
+    options = _excelapi_cache_options(transform_katakana_to_hiragana)
+    if cache is not None:
+        # NOTE: SQLite blocks, so the cache is accessed in a worker thread.
+        cached = await asyncio.to_thread(cache.get, text, options)
+        if cached is not None:
+            return cached
+
+    if before_request is not None:
+        await before_request()
+    client = get_async_client()
+    num_attempts: int = 0
+
+    async def get():
+        # NOTE: wait here instead of the callback of rerun_deco, which is not awaited.
+        nonlocal num_attempts
+        if num_attempts > 0:
+            await asyncio.sleep(interval_sec)
+        num_attempts += 1
+        return await client.get(url, params={"text": text})
+
+    response = await rerun_deco(get, max_retry=max_retry)()
 
     # chech status code
     response.raise_for_status()
@@ -97,7 +240,12 @@ def excelapi_kanji2kana(
 
     # katakana -> hiragana
     if transform_katakana_to_hiragana:
-        for k, h in KATAKANA2HIRAGANA_MAP.items():
-            transformed_text = transformed_text.replace(k, h)
+        transformed_text = katakana_to_hiragana(transformed_text)
 
+    if cache is not None:
+        await asyncio.to_thread(cache.put, text, transformed_text, options)
     return transformed_text
+
+
+def _excelapi_cache_options(transform_katakana_to_hiragana: bool) -> str:
+    return f"excelapi.kanji2kana:transform_katakana_to_hiragana={transform_katakana_to_hiragana}"
@@ -0,0 +1,238 @@
+from __future__ import annotations
+from logging import getLogger, Logger
+import os
+import sqlite3
+from threading import Lock
+import time
+from typing import Callable
+from urllib.parse import quote
+
+from ..const.hiragana_romaji_map import get_cache_direc
+from ..models.kana_cache_metrics_model import KanaCacheMetricsModel
+
+
+KANA_CACHE_FORMAT_VERSION: int = 1
+DEFAULT_MAX_ENTRIES: int = 100_000
+EVICTION_RATIO: float = 0.1
+
+
+def get_default_kana_cache_path() -> str:
+    return os.path.join(get_cache_direc(), f"kana_cache_v{KANA_CACHE_FORMAT_VERSION}.sqlite3")
+
+
+class KanaCache:
+    """Persistent cache of the readings of texts in SQLite, which is shared among runs and processes.
+
+    A reading is keyed by the text and the conversion options, e.g. the name of the backend and its flags.
+    Readings older than `ttl_sec` are treated as misses,
+    and the least recently used readings are evicted when there are more than `max_entries` readings.
+    The readings are evicted in batches of `EVICTION_RATIO * max_entries`, so that the table is not counted on every write.
+
+    NOTE:
+        The database is opened on the first lookup, so that creating a cache never touches the disk.
+        The cache is only a cache: if the database cannot be opened or is broken, it is disabled with a warning
+        and every lookup misses.
+        In the read-only mode, the database is never created nor modified, and a missing database is treated as empty.
+        The number of readings is counted when the database is opened and then kept by this instance.
+        Readings written by other processes are counted when the next batch is evicted.
+
+    Examples:
+    >>> import os, tempfile
+    >>> cache = KanaCache(os.path.join(tempfile.mkdtemp(), 'kana.sqlite3'))
+    >>> cache.get_or_compute('日本', lambda text: 'にほん'), cache.get_or_compute('日本', lambda text: 'にっぽん')
+    ('にほん', 'にほん')
+    >>> cache.metrics().hit_rate
+    0.5
+    """  # noqa
+
+    def __init__(
+        self,
+        path: str | None = None,
+        ttl_sec: float | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        read_only: bool = False,
+        logger: Logger = getLogger(__name__),
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, but {max_entries} was given.")
+        self._path = path or get_default_kana_cache_path()
+        self._ttl_sec = ttl_sec
+        self._max_entries = max_entries
+        self._read_only = read_only
+        self._logger = logger
+        self._connection: sqlite3.Connection | None = None
+        self._disabled: bool = False
+        self._num_entries: int = 0
+        self._lock = Lock()
+        self._metrics = KanaCacheMetricsModel()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def read_only(self) -> bool:
+        return self._read_only
+
+    def metrics(self) -> KanaCacheMetricsModel:
+        with self._lock:
+            return self._metrics.model_copy()
+
+    def _connect(self) -> sqlite3.Connection | None:
+        # NOTE: call with the lock.
+        if self._connection is not None or self._disabled:
+            return self._connection
+        try:
+            if self._read_only:
+                if not os.path.exists(self._path):
+                    self._disabled = True
+                    return None
+                self._connection = sqlite3.connect(
+                    f"file:{quote(os.path.abspath(self._path))}?mode=ro", uri=True, check_same_thread=False
+                )
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(self._path)), exist_ok=True)
+                self._connection = sqlite3.connect(self._path, timeout=10.0, check_same_thread=False)
+                with self._connection:
+                    self._connection.execute(
+                        "CREATE TABLE IF NOT EXISTS readings ("
+                        "text TEXT NOT NULL, options TEXT NOT NULL, kana TEXT NOT NULL, "
+                        "created_at REAL NOT NULL, accessed_at REAL NOT NULL, "
+                        "PRIMARY KEY (text, options))"
+                    )
+                    self._connection.execute(
+                        "CREATE INDEX IF NOT EXISTS readings_accessed_at ON readings (accessed_at)"
+                    )
+                    (self._num_entries,) = self._connection.execute("SELECT COUNT(*) FROM readings").fetchone()
+        except (OSError, sqlite3.Error) as e:
+            self._disable(e)
+        return self._connection
+
+    def _disable(self, error: Exception) -> None:
+        # NOTE: call with the lock.
+        self._logger.warning(f"The kana cache {self._path} is disabled: {error}")
+        self._disabled = True
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def get(self, text: str, options: str = "") -> str | None:
+        """Get the cached reading of a text.
+
+        Args:
+            text (str): a text.
+            options (str, optional): the conversion options. Defaults to "".
+
+        Returns:
+            str | None: the cached reading. None if it is not cached or expired.
+        """
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                self._metrics.misses += 1
+                return None
+            now = time.time()
+            try:
+                row = connection.execute(
+                    "SELECT kana, created_at FROM readings WHERE text = ? AND options = ?", (text, options)
+                ).fetchone()
+                if row is None:
+                    self._metrics.misses += 1
+                    return None
+                kana, created_at = row
+                if self._ttl_sec is not None and now - created_at > self._ttl_sec:
+                    self._metrics.misses += 1
+                    self._metrics.expired += 1
+                    if not self._read_only:
+                        with connection:
+                            cursor = connection.execute(
+                                "DELETE FROM readings WHERE text = ? AND options = ?", (text, options)
+                            )
+                        self._num_entries -= cursor.rowcount
+                    return None
+                if not self._read_only:
+                    with connection:
+                        connection.execute(
+                            "UPDATE readings SET accessed_at = ? WHERE text = ? AND options = ?", (now, text, options)
+                        )
+            except sqlite3.Error as e:
+                self._disable(e)
+                self._metrics.misses += 1
+                return None
+            self._metrics.hits += 1
+            return str(kana)
+
+    def put(self, text: str, kana: str, options: str = "") -> None:
+        """Cache the reading of a text. Nothing is done in the read-only mode.
+
+        Args:
+            text (str): a text.
+            kana (str): the reading of the text.
+            options (str, optional): the conversion options. Defaults to "".
+        """
+        if self._read_only:
+            return
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            now = time.time()
+            num_entries = self._num_entries
+            num_evicted = 0
+            try:
+                with connection:
+                    cursor = connection.execute(
+                        "UPDATE readings SET kana = ?, created_at = ?, accessed_at = ? WHERE text = ? AND options = ?",
+                        (kana, now, now, text, options),
+                    )
+                    if cursor.rowcount == 0:
+                        connection.execute(
+                            "INSERT OR REPLACE INTO readings (text, options, kana, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",  # noqa
+                            (text, options, kana, now, now),
+                        )
+                        num_entries += 1
+                    if self._ttl_sec is not None:
+                        cursor = connection.execute("DELETE FROM readings WHERE created_at < ?", (now - self._ttl_sec,))
+                        num_entries -= cursor.rowcount
+                    if num_entries > self._max_entries:
+                        # NOTE: recount the readings, which may have been written by other processes.
+                        (num_entries,) = connection.execute("SELECT COUNT(*) FROM readings").fetchone()
+                        if num_entries > self._max_entries:
+                            num_evicted = num_entries - self._max_entries + int(self._max_entries * EVICTION_RATIO)
+                            connection.execute(
+                                "DELETE FROM readings WHERE rowid IN (SELECT rowid FROM readings ORDER BY accessed_at LIMIT ?)",  # noqa
+                                (num_evicted,),
+                            )
+                            num_entries -= num_evicted
+            except sqlite3.Error as e:
+                self._disable(e)
+                return
+            self._num_entries = num_entries
+            self._metrics.writes += 1
+            self._metrics.evictions += num_evicted
+
+    def get_or_compute(self, text: str, compute: Callable[[str], str], options: str = "") -> str:
+        """Get the cached reading of a text, or compute and cache it.
+
+        Args:
+            text (str): a text.
+            compute (Callable[[str], str]): function to compute the reading from the text on a miss.
+            options (str, optional): the conversion options. Defaults to "".
+
+        Returns:
+            str: the cached or computed reading.
+
+        NOTE:
+            `compute` is called without holding the lock, and exceptions from it are not cached.
+        """
+        kana = self.get(text, options)
+        if kana is None:
+            kana = compute(text)
+            self.put(text, kana, options)
+        return kana
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,180 @@
+from __future__ import annotations
+import json
+import math
+import time
+
+
+class LatencyHistogram:
+    """Log-linear histogram of latencies in nanoseconds.
+
+    Each power of two is divided into 2**SUB_BUCKET_BITS buckets,
+    so that recording takes O(1) without allocation and the relative error of percentiles is less than 1/2**SUB_BUCKET_BITS.
+
+    Examples:
+    >>> histogram = LatencyHistogram()
+    >>> for value in range(1, 101):
+    ...     histogram.record(value)
+    >>> histogram.count, histogram.max
+    (100, 100)
+    >>> histogram.percentile(10), histogram.percentile(50), histogram.percentile(100)
+    (10, 51, 100)
+    """  # noqa
+
+    SUB_BUCKET_BITS: int = 4
+
+    def __init__(self, keep_samples: bool = False) -> None:
+        self._sub_bucket_count: int = 1 << self.SUB_BUCKET_BITS
+        self._counts: list[int] = [0] * (self._sub_bucket_count * 65)
+        self._count: int = 0
+        self._max: int = 0
+        self._samples: list[int] | None = [] if keep_samples else None
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def max(self) -> int:
+        return self._max
+
+    @property
+    def samples(self) -> list[int] | None:
+        return self._samples
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_bucket_count:
+            return value
+        exponent = value.bit_length() - self.SUB_BUCKET_BITS - 1
+        return self._sub_bucket_count * (exponent + 1) + (value >> exponent) - self._sub_bucket_count
+
+    def _upper_bound(self, index: int) -> int:
+        if index < self._sub_bucket_count:
+            return index
+        exponent = index // self._sub_bucket_count - 1
+        mantissa = index % self._sub_bucket_count + self._sub_bucket_count
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, value: int) -> None:
+        value = max(value, 0)
+        self._counts[self._index(value)] += 1
+        self._count += 1
+        if value > self._max:
+            self._max = value
+        if self._samples is not None:
+            self._samples.append(value)
+
+    def percentile(self, q: float) -> int:
+        """Get the q-th percentile. The upper bound of the bucket is returned.
+
+        Args:
+            q (float): percentile between 0 and 100.
+
+        Returns:
+            int: the q-th percentile. 0 if no value has been recorded.
+        """
+        if self._count == 0:
+            return 0
+        rank = max(math.ceil(self._count * q / 100), 1)
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(self._upper_bound(index), self._max)
+        return self._max
+
+
+class KeystrokeLatencyTracer:
+    """Tracer of the latency from a key event to the echo of the key.
+
+    The stages are:
+        - listener_to_callback: from the key monitor receiving a key to the start of the callback of the typing game.
+        - matching: from the start of the callback to the start of the echo.
+        - echo: from the start to the end of the echo, i.e. until the user interface has flushed.
+        - total: from the key monitor receiving a key to the end of the echo.
+
+    NOTE:
+        Timestamps are taken with time.monotonic_ns().
+        A key monitor and a typing game call the `on_*` methods in this order from the same thread.
+    """  # noqa
+
+    STAGES: tuple[str, ...] = ("listener_to_callback", "matching", "echo", "total")
+
+    def __init__(self, keep_samples: bool = False) -> None:
+        self._keep_samples = keep_samples
+        self._histograms: dict[str, LatencyHistogram] = {stage: LatencyHistogram(keep_samples) for stage in self.STAGES}  # noqa
+        self._key_received_ns: int | None = None
+        self._callback_started_ns: int | None = None
+        self._echo_started_ns: int | None = None
+
+    @property
+    def keep_samples(self) -> bool:
+        return self._keep_samples
+
+    @property
+    def histograms(self) -> dict[str, LatencyHistogram]:
+        return self._histograms
+
+    def on_key_received(self) -> None:
+        self._key_received_ns = time.monotonic_ns()
+
+    def on_callback_started(self) -> None:
+        self._callback_started_ns = time.monotonic_ns()
+
+    def on_echo_started(self) -> None:
+        self._echo_started_ns = time.monotonic_ns()
+
+    def on_echo_finished(self) -> None:
+        echo_finished_ns = time.monotonic_ns()
+        if self._callback_started_ns is None or self._echo_started_ns is None:
+            return
+
+        if self._key_received_ns is not None:
+            self._histograms["listener_to_callback"].record(self._callback_started_ns - self._key_received_ns)  # noqa
+            self._histograms["total"].record(echo_finished_ns - self._key_received_ns)
+        self._histograms["matching"].record(self._echo_started_ns - self._callback_started_ns)
+        self._histograms["echo"].record(echo_finished_ns - self._echo_started_ns)
+
+        self._key_received_ns = None
+        self._callback_started_ns = None
+        self._echo_started_ns = None
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """Summarize the latencies.
+
+        Returns:
+            dict[str, dict[str, int]]: count, p50, p95, p99 and max in nanoseconds for each stage.
+        """
+        return {
+            stage: {
+                "count": histogram.count,
+                "p50": histogram.percentile(50),
+                "p95": histogram.percentile(95),
+                "p99": histogram.percentile(99),
+                "max": histogram.max,
+            }
+            for stage, histogram in self._histograms.items()
+        }
+
+    def format_summary(self) -> str:
+        lines = [f"{'stage':<22}{'count':>8}{'p50[us]':>12}{'p95[us]':>12}{'p99[us]':>12}{'max[us]':>12}"]
+        for stage, s in self.summary().items():
+            lines.append(
+                f"{stage:<22}{s['count']:>8}" + "".join(f"{s[k] / 1000:>12.1f}" for k in ["p50", "p95", "p99", "max"])
+            )
+        return "\n".join(lines)
+
+    def dump_samples(self, path: str) -> None:
+        """Dump the raw samples as JSON Lines. Each line has the latencies of a stage in nanoseconds.
+
+        Args:
+            path (str): path to the output file.
+
+        Raises:
+            ValueError: if the tracer does not keep samples.
+        """  # noqa
+        if not self._keep_samples:
+            raise ValueError("The tracer does not keep samples. Set keep_samples=True.")
+
+        with open(path, "w", encoding="utf-8") as f:
+            for stage, histogram in self._histograms.items():
+                f.write(json.dumps({"stage": stage, "samples_ns": histogram.samples}) + "\n")
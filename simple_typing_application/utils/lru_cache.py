@@ -0,0 +1,93 @@
+from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Generic, Hashable, NamedTuple, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded thread-safe cache with LRU eviction and hit/miss counters.
+
+    NOTE:
+        Values are shared among callers, so they should be immutable, e.g. tuples.
+        `compute` of `get_or_compute` is called without holding the lock,
+        so the same key may be computed more than once by concurrent callers.
+
+    Examples:
+    >>> cache: LRUCache[str, int] = LRUCache(maxsize=2)
+    >>> cache.get_or_compute('a', len), cache.get_or_compute('bb', len), cache.get_or_compute('a', len)
+    (1, 2, 1)
+    >>> cache.get_or_compute('ccc', len)  # evict 'bb'
+    3
+    >>> 'bb' in cache, 'a' in cache
+    (False, True)
+    >>> cache.info()
+    CacheInfo(hits=1, misses=3, maxsize=2, currsize=2)
+    """  # noqa
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, but {maxsize} was given.")
+        self._maxsize = maxsize
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get_or_compute(self, key: K, compute: Callable[[K], V]) -> V:
+        """Get the cached value of the key, or compute and cache it.
+
+        Args:
+            key (K): key.
+            compute (Callable[[K], V]): function to compute the value from the key on a miss.
+
+        Returns:
+            V: the cached or computed value.
+        """  # noqa
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._data.move_to_end(key)
+                return value
+
+        value = compute(key)
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
+
+    def clear(self):
+        """Clear the cached values and the counters."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
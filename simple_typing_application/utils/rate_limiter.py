@@ -0,0 +1,69 @@
+from __future__ import annotations
+import asyncio
+from threading import Event, Lock
+import time
+
+
+class RateLimiter:
+    """Rate limiter which spaces the starts of operations at least `interval_sec` apart.
+
+    A limiter can be shared among threads and event loops, e.g. the requests to an API from foreground and background.
+    Unlike sleeping before every operation, the first operation and operations after an idle period start immediately.
+
+    Args:
+        interval_sec (float): the minimum interval between the starts of operations in seconds.
+
+    Raises:
+        ValueError: if interval_sec is negative.
+
+    Examples:
+    >>> limiter = RateLimiter(0.05)
+    >>> start = time.monotonic()
+    >>> for _ in range(3):
+    ...     limiter.acquire()
+    >>> 0.1 <= time.monotonic() - start < 0.5
+    True
+    """  # noqa
+
+    def __init__(self, interval_sec: float) -> None:
+        if interval_sec < 0:
+            raise ValueError(f"interval_sec must not be negative, but {interval_sec} was given.")
+        self._interval_sec = interval_sec
+        self._next_time: float = float("-inf")
+        self._lock = Lock()
+
+    @property
+    def interval_sec(self) -> float:
+        return self._interval_sec
+
+    def _reserve(self) -> float:
+        # NOTE: reserve the next slot and return the seconds to wait for it.
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self._interval_sec
+            return start - now
+
+    def acquire(self, cancel_event: Event | None = None) -> None:
+        """Wait until the next operation is allowed to start.
+
+        Args:
+            cancel_event (Event | None, optional): event to stop waiting as soon as it is set. Defaults to None.
+
+        NOTE:
+            The reserved slot is not released even if waiting is cancelled.
+            Check `cancel_event` after this returns to know whether the operation is allowed.
+        """
+        wait_sec = self._reserve()
+        if wait_sec <= 0:
+            return
+        if cancel_event is None:
+            time.sleep(wait_sec)
+        else:
+            cancel_event.wait(wait_sec)
+
+    async def acquire_async(self) -> None:
+        """Wait until the next operation is allowed to start without blocking the event loop."""
+        wait_sec = self._reserve()
+        if wait_sec > 0:
+            await asyncio.sleep(wait_sec)
@@ -0,0 +1,14 @@
+from __future__ import annotations
+import pathlib
+
+import pytest
+
+from simple_typing_application.const.hiragana_romaji_map import CACHE_DIREC_ENV
+
+
+@pytest.fixture(autouse=True)
+def cache_direc(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> pathlib.Path:
+    """Isolate the cache directory so that tests never write to the cache of the user."""
+    path = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_DIREC_ENV, str(path))
+    return path
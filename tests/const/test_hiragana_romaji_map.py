@@ -0,0 +1,54 @@
+from __future__ import annotations
+import os
+import subprocess
+import sys
+from types import MappingProxyType
+
+import pytest
+
+from simple_typing_application.const.hiragana_romaji_map import (
+    CACHE_DIREC_ENV,
+    HIRA2ROMA_MAP,
+    SMALL_HIRA2ROMA_MAP,
+    get_cache_direc,
+)
+
+
+def test_maps_are_immutable():
+    assert isinstance(HIRA2ROMA_MAP, MappingProxyType)
+    assert isinstance(SMALL_HIRA2ROMA_MAP, MappingProxyType)
+    assert all(isinstance(v, tuple) for v in HIRA2ROMA_MAP.values())
+    assert all(isinstance(v, tuple) for v in SMALL_HIRA2ROMA_MAP.values())
+    with pytest.raises(TypeError):
+        HIRA2ROMA_MAP["あ"] = ("dummy",)  # type: ignore
+
+
+def test_maps_contain_combinations_with_small_hiraganas():
+    assert HIRA2ROMA_MAP["きゃ"] == ("kya", "kixya", "kilya")
+    assert HIRA2ROMA_MAP["っ"] == (None, "xtu", "xtsu", "ltu", "ltsu")
+
+
+def test_get_cache_direc(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv(CACHE_DIREC_ENV, "/path/to/cache")
+    assert get_cache_direc() == "/path/to/cache"
+
+    monkeypatch.delenv(CACHE_DIREC_ENV)
+    monkeypatch.setenv("XDG_CACHE_HOME", "/path/to/xdg")
+    assert get_cache_direc() == os.path.join("/path/to/xdg", "simple_typing_application")
+
+
+def test_import_does_not_write_cache(tmp_path):
+    cache_direc = tmp_path / "cache"
+    env = {**os.environ, CACHE_DIREC_ENV: str(cache_direc), "PYNPUT_BACKEND": "dummy"}
+
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import simple_typing_application.corpus_compiler, simple_typing_application.sentence_generator.utils",
+        ],
+        env=env,
+        check=True,
+    )
+
+    assert not cache_direc.exists()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+import asyncio
+import random
+
+import pytest
+
+from simple_typing_application.kana_reader.base import BaseKanaReader
+from simple_typing_application.kana_reader.dictionary_kana_reader import (
+    BUNDLED_DICTIONARY_PATH,
+    DictionaryKanaReader,
+    load_reading_dictionary,
+    ReadingTrie,
+)
+from simple_typing_application.utils.japanese_string_utils import is_hiragana
+
+
+def test_inheritance():
+    assert issubclass(DictionaryKanaReader, BaseKanaReader)
+
+
+def test_reading_trie_is_equivalent_to_dict():
+    rng = random.Random(0)
+    chars = "日本語東京大学人"
+    items = [("".join(rng.choice(chars) for _ in range(rng.randint(1, 4))), str(i)) for i in range(200)]
+    expected = dict(items)
+    trie = ReadingTrie.from_items(items)
+
+    assert len(trie) == len(expected)
+    for _ in range(500):
+        surface = "".join(rng.choice(chars) for _ in range(rng.randint(1, 5)))
+        assert trie.get(surface) == expected.get(surface), surface
+
+    for _ in range(200):
+        text = "".join(rng.choice(chars + "あ") for _ in range(rng.randint(1, 8)))
+        start = rng.randint(0, len(text) - 1)
+        matches = [
+            (end, expected[text[start:end]]) for end in range(start + 1, len(text) + 1) if text[start:end] in expected
+        ]  # noqa
+        assert trie.longest_match(text, start) == (matches[-1] if matches else None), (text, start)
+
+
+def test_reading_trie_empty():
+    trie = ReadingTrie.from_items([])
+    assert len(trie) == 0
+    assert trie.get("日") is None
+    assert trie.longest_match("日本") is None
+
+
+@pytest.mark.parametrize("item", [("", "あ"), ("日", "")])
+def test_reading_trie_invalid_item(item: tuple[str, str]):
+    with pytest.raises(ValueError):
+        ReadingTrie.from_items([item])
+
+
+def test_bundled_dictionary_is_valid():
+    items = load_reading_dictionary(BUNDLED_DICTIONARY_PATH)
+    assert len(items) == len(dict(items))
+    assert all(all(is_hiragana(c) or c == "ー" for c in reading) for _, reading in items)
+
+
+def test_load_reading_dictionary(tmp_path):
+    path = tmp_path / "dictionary.tsv"
+    path.write_text("# comment\n\n日本\tニホン\r\n東京\tとうきょう\n", encoding="utf-8")
+    assert load_reading_dictionary(str(path)) == [("日本", "にほん"), ("東京", "とうきょう")]
+
+
+@pytest.mark.parametrize("line", ["日本", "日本\tにほん\tに", "\tにほん", "日本\t"])
+def test_load_reading_dictionary_invalid_line(line: str, tmp_path):
+    path = tmp_path / "dictionary.tsv"
+    path.write_text(f"東京\tとうきょう\n{line}\n", encoding="utf-8")
+    with pytest.raises(ValueError, match=":2:"):
+        load_reading_dictionary(str(path))
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("これはサンプルの文章です。", "これはさんぷるのぶんしょうです。"),
+        (
+            "今日は天気が良いので、友達と公園に行きました。",
+            "きょうはてんきがよいので、ともだちとこうえんにいきました。",
+        ),
+        ("日本語の文章を速く正確に入力する。", "にほんごのぶんしょうをはやくせいかくににゅうりょくする。"),
+        ("Hello, World!", "Hello, World!"),
+        ("", ""),
+    ],
+)
+def test_read(text: str, expected: str):
+    assert DictionaryKanaReader().read(text) == expected
+
+
+def test_read_with_user_dictionary(tmp_path):
+    path = tmp_path / "dictionary.tsv"
+    path.write_text("日本\tにっぽん\n鰻\tうなぎ\n", encoding="utf-8")
+    reader = DictionaryKanaReader(str(path))
+
+    # NOTE: the user dictionary takes precedence, and the longest match is preferred.
+    assert reader.read("日本の鰻") == "にっぽんのうなぎ"
+    assert reader.read("日本語") == "にほんご"
+    assert DictionaryKanaReader(str(path), use_bundled_dictionary=False).read("日本語") == "にっぽん語"
+
+
+def test_read_warns_unknown_kanji(caplog):
+    assert DictionaryKanaReader().read("鰻を食べる") == "鰻をたべる"
+    assert "Unknown kanjis" in caplog.text
+
+
+def test_read_async():
+    reader = DictionaryKanaReader()
+    assert asyncio.run(reader.read_async("日本語")) == "にほんご"
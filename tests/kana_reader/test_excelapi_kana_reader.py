@@ -0,0 +1,139 @@
+from __future__ import annotations
+import asyncio
+
+import pytest
+
+from simple_typing_application.kana_reader.base import BaseKanaReader, KanaReaderClosedError
+from simple_typing_application.kana_reader.excelapi_kana_reader import (
+    EXCELAPI_MIN_INTERVAL_SEC,
+    EXCELAPI_RATE_LIMITER,
+    ExcelapiKanaReader,
+)
+from simple_typing_application.utils.japanese_string_utils import EXCELAPI_KANJI2KANA_URL
+from simple_typing_application.utils.kana_cache import KanaCache
+from simple_typing_application.utils.rate_limiter import RateLimiter
+
+
+def test_inheritance():
+    assert issubclass(ExcelapiKanaReader, BaseKanaReader)
+
+
+def test_init_uses_shared_rate_limiter():
+    assert ExcelapiKanaReader().rate_limiter is EXCELAPI_RATE_LIMITER
+    assert ExcelapiKanaReader().rate_limiter is ExcelapiKanaReader().rate_limiter
+    assert EXCELAPI_RATE_LIMITER.interval_sec == EXCELAPI_MIN_INTERVAL_SEC
+    assert ExcelapiKanaReader(rate_limiter=None).rate_limiter is None
+
+
+def test_read(tmp_path, mocker):
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        return_value="にほんご",
+    )
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"))
+    rate_limiter = mocker.MagicMock(spec=RateLimiter)
+    reader = ExcelapiKanaReader(cache=cache, rate_limiter=rate_limiter, url="http://localhost:8080/kanji2kana")
+
+    assert reader.read("日本語") == "にほんご"
+
+    _, kwargs = mock_excelapi_kanji2kana.call_args
+    assert kwargs["cache"] is cache
+    assert kwargs["url"] == "http://localhost:8080/kanji2kana"
+    kwargs["before_request"]()
+    rate_limiter.acquire.assert_called_once_with(mocker.ANY)
+
+
+def test_read_without_wait(mocker):
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        return_value="にほんご",
+    )
+
+    assert ExcelapiKanaReader(rate_limiter=None).read("日本語") == "にほんご"
+    mock_excelapi_kanji2kana.assert_called_once_with(
+        "日本語", cache=None, before_request=mocker.ANY, url=EXCELAPI_KANJI2KANA_URL
+    )
+    _, kwargs = mock_excelapi_kanji2kana.call_args
+    kwargs["before_request"]()  # NOTE: does not wait.
+
+
+def test_read_async(mocker):
+    mock_excelapi_kanji2kana_async = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana_async",
+        return_value="にほんご",
+    )
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+    )
+
+    rate_limiter = mocker.MagicMock(spec=RateLimiter)
+    assert asyncio.run(ExcelapiKanaReader(rate_limiter=rate_limiter).read_async("日本語")) == "にほんご"
+    mock_excelapi_kanji2kana_async.assert_awaited_once()
+    _, kwargs = mock_excelapi_kanji2kana_async.call_args
+    asyncio.run(kwargs["before_request"]())
+    rate_limiter.acquire_async.assert_awaited_once_with()
+    mock_excelapi_kanji2kana.assert_not_called()
+
+
+def test_close_stops_requests(mocker):
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=lambda text, before_request, **kwargs: before_request() or "にほんご",
+    )
+
+    async def excelapi_kanji2kana_async(text: str, before_request, **kwargs) -> str:
+        await before_request()
+        return "にほんご"
+
+    mock_excelapi_kanji2kana_async = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana_async",
+        side_effect=excelapi_kanji2kana_async,
+    )
+    reader = ExcelapiKanaReader(rate_limiter=None)
+    assert reader.read("日本語") == "にほんご"
+
+    reader.close()
+
+    with pytest.raises(KanaReaderClosedError):
+        reader.read("日本語")
+    with pytest.raises(KanaReaderClosedError):
+        asyncio.run(reader.read_async("日本語"))
+    assert mock_excelapi_kanji2kana.call_count == 2
+    mock_excelapi_kanji2kana_async.assert_awaited_once()
+
+
+def test_read_with_default_rate_limiter(mocker):
+    # NOTE: the shared limiter is reset for this test and restored afterwards.
+    mocker.patch.object(EXCELAPI_RATE_LIMITER, "_next_time", float("-inf"))
+    # NOTE: the sync reads wait on the event to close the reader instead of sleeping.
+    mock_event = mocker.patch("simple_typing_application.kana_reader.excelapi_kana_reader.Event").return_value
+    mock_event.is_set.return_value = False
+    mock_asleep = mocker.patch("simple_typing_application.utils.rate_limiter.asyncio.sleep")
+
+    def excelapi_kanji2kana(text: str, before_request, **kwargs) -> str:
+        before_request()
+        return "にほんご"
+
+    async def excelapi_kanji2kana_async(text: str, before_request, **kwargs) -> str:
+        await before_request()
+        return "にほんご"
+
+    mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=excelapi_kanji2kana,
+    )
+    mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana_async",
+        side_effect=excelapi_kanji2kana_async,
+    )
+
+    # NOTE: readers share the limiter, so the requests of different readers are spaced too.
+    assert [ExcelapiKanaReader().read("日本語") for _ in range(3)] == ["にほんご"] * 3
+    assert asyncio.run(ExcelapiKanaReader().read_async("日本語")) == "にほんご"
+
+    # NOTE: waiting is mocked, so the slots are reserved back to back.
+    assert [args[0] for args, _ in mock_event.wait.call_args_list] == [
+        pytest.approx(EXCELAPI_MIN_INTERVAL_SEC, abs=0.1),
+        pytest.approx(2 * EXCELAPI_MIN_INTERVAL_SEC, abs=0.1),
+    ]
+    mock_asleep.assert_awaited_once_with(pytest.approx(3 * EXCELAPI_MIN_INTERVAL_SEC, abs=0.1))
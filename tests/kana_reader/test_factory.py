@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+
+from simple_typing_application.const.kana_reader import EKanaReaderType
+from simple_typing_application.kana_reader.dictionary_kana_reader import DictionaryKanaReader
+from simple_typing_application.kana_reader.excelapi_kana_reader import EXCELAPI_RATE_LIMITER, ExcelapiKanaReader
+from simple_typing_application.kana_reader.factory import create_kana_reader
+from simple_typing_application.utils.kana_cache import KanaCache
+from simple_typing_application.utils.rate_limiter import RateLimiter
+
+
+@pytest.mark.parametrize(
+    "kana_reader_type,expected_cls",
+    [
+        (EKanaReaderType.EXCELAPI, ExcelapiKanaReader),
+        (EKanaReaderType.DICTIONARY, DictionaryKanaReader),
+    ],
+)
+def test_create_kana_reader(kana_reader_type: EKanaReaderType, expected_cls: type):
+    assert isinstance(create_kana_reader(kana_reader_type), expected_cls)
+
+
+def test_create_kana_reader_passes_cache(tmp_path):
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"))
+    reader = create_kana_reader(EKanaReaderType.EXCELAPI, cache=cache)
+    assert isinstance(reader, ExcelapiKanaReader)
+    assert reader.cache is cache
+
+
+def test_create_kana_reader_uses_shared_rate_limiter():
+    reader = create_kana_reader(EKanaReaderType.EXCELAPI)
+    assert isinstance(reader, ExcelapiKanaReader)
+    assert reader.rate_limiter is EXCELAPI_RATE_LIMITER
+
+
+def test_create_kana_reader_passes_rate_limiter():
+    rate_limiter = RateLimiter(1.0)
+    reader = create_kana_reader(EKanaReaderType.EXCELAPI, rate_limiter=rate_limiter)
+    assert isinstance(reader, ExcelapiKanaReader)
+    assert reader.rate_limiter is rate_limiter
+
+
+def test_create_kana_reader_with_user_dictionary(tmp_path):
+    path = tmp_path / "dictionary.tsv"
+    path.write_text("鰻\tうなぎ\n", encoding="utf-8")
+    assert create_kana_reader(EKanaReaderType.DICTIONARY, dictionary_path=str(path)).read("鰻") == "うなぎ"
+
+
+def test_create_kana_reader_unsupported():
+    with pytest.raises(ValueError):
+        create_kana_reader("UNSUPPORTED")  # type: ignore
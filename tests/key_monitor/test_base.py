@@ -0,0 +1,50 @@
+from __future__ import annotations
+import asyncio
+from threading import Event
+
+import pytest
+
+from simple_typing_application.key_monitor.base import BaseKeyMonitor
+
+
+class _BlockingKeyMonitor(BaseKeyMonitor):
+    def __init__(self, exception: BaseException | None = None):
+        self._stopped = Event()
+        self._exception = exception
+
+    def start(self):
+        # NOTE: block like the real key monitors until stop is called.
+        self._stopped.wait(timeout=5)
+        if self._exception is not None:
+            raise self._exception
+
+    def stop(self):
+        self._stopped.set()
+
+
+def test_start_async_does_not_block_event_loop():
+    key_monitor = _BlockingKeyMonitor()
+    events: list[str] = []
+
+    async def background():
+        # NOTE: this runs only when the event loop is not blocked by start_async.
+        await asyncio.sleep(0.01)
+        events.append("background")
+        key_monitor.stop()
+
+    async def main():
+        await asyncio.gather(key_monitor.start_async(), background())
+        events.append("stopped")
+
+    asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+    assert events == ["background", "stopped"]
+
+
+@pytest.mark.parametrize("exception", [RuntimeError("error"), SystemExit(-1)])
+def test_start_async_reraises_exception(exception: BaseException):
+    key_monitor = _BlockingKeyMonitor(exception)
+    key_monitor.stop()
+
+    with pytest.raises(type(exception)):
+        asyncio.run(key_monitor.start_async())
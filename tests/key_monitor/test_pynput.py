@@ -15,7 +15,7 @@ PYNPUT_KEY_MAP: tuple[tuple[keyboard.Key | keyboard.KeyCode | None, EMetaKey | s
     (keyboard.Key.cmd, None),
     (keyboard.Key.caps_lock, None),
     (keyboard.Key.shift, None),
-    (keyboard.Key.backspace, None),
+    (keyboard.Key.backspace, EMetaKey.BACKSPACE),
     (keyboard.Key.enter, None),
     (keyboard.Key.delete, None),
     (keyboard.Key.up, None),
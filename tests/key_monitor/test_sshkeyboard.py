@@ -5,11 +5,12 @@ from sshkeyboard import stop_listening
 from simple_typing_application.const.keys import EMetaKey
 from simple_typing_application.key_monitor.sshkeyboard import SSHKeyboardBasedKeyMonitor  # noqa
 from simple_typing_application.key_monitor.base import BaseKeyMonitor
+from simple_typing_application.utils.latency import KeystrokeLatencyTracer
 
 
 KEY_STR_MAP: tuple[tuple[str, EMetaKey | str | None], ...] = (  # noqa
     ("esc", EMetaKey.ESC),
-    ("backspace", None),
+    ("backspace", EMetaKey.BACKSPACE),
     ("insert", None),
     ("delete", None),
     ("pageup", None),
@@ -99,6 +100,22 @@ def test__on_press_callback_wrapper(key: str, intemediate_expected: EMetaKey | s
     mock_callback.assert_called_once_with(intemediate_expected)
 
 
+def test__on_press_callback_wrapper_with_latency_tracer(mocker):
+    # mock
+    mock_tracer = mocker.MagicMock(spec=KeystrokeLatencyTracer)
+
+    # preparation
+    key_monitor = SSHKeyboardBasedKeyMonitor()
+    key_monitor.set_on_press_callback(mocker.MagicMock())
+    key_monitor.set_latency_tracer(mock_tracer)
+
+    # execute
+    key_monitor._on_press_callback_wrapper("a")
+
+    # assert
+    mock_tracer.on_key_received.assert_called_once_with()
+
+
 @pytest.mark.parametrize(
     "key, intemediate_expected",
     list(KEY_STR_MAP),
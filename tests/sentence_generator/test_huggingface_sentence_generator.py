@@ -96,7 +96,7 @@ def test_generate(mocker):
         return_value=mock_generator,
     )
     mocker.patch(
-        "simple_typing_application.sentence_generator.huggingface_sentence_generator.excelapi_kanji2kana",  # noqa
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana_async",  # noqa
         return_value=expected.text_hiragana_alphabet_symbol,
     )
 
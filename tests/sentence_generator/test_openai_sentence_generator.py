@@ -89,6 +89,21 @@ def test__OutputSchema_build_typing_target():
     assert actual == expected
 
 
+def test__OutputSchema_build_typing_target_with_katakana():
+    output_schema = _OutputSchema(text="ヴァイオリン", text_hiragana_alphabet_symbol="ヴァイオリン")
+
+    actual = output_schema.build_typing_target()
+
+    assert actual.text_hiragana_alphabet_symbol == "ゔぁいおりん"
+    assert [sorted(x) for x in actual.typing_target] == [
+        ["va", "vula", "vuxa"],
+        ["i", "yi"],
+        ["o"],
+        ["ri"],
+        ["n'", "nn", "xn"],
+    ]
+
+
 def test_generate(mocker):
     # preparation
     mocker.patch(
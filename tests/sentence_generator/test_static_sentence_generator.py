@@ -1,11 +1,21 @@
 from __future__ import annotations
 import asyncio
 import random
+import time
+from threading import Event
 
 import pytest
+from requests import Response
+from simple_typing_application.const.kana_reader import EKanaReaderType
+from simple_typing_application.kana_reader.base import KanaReaderClosedError
+from simple_typing_application.kana_reader.excelapi_kana_reader import EXCELAPI_RATE_LIMITER
 from simple_typing_application.models.typing_target_model import TypingTargetModel  # noqa
 from simple_typing_application.sentence_generator.base import BaseSentenceGenerator  # noqa
-from simple_typing_application.sentence_generator.static_sentence_generator import StaticSentenceGenerator  # noqa
+from simple_typing_application.utils.japanese_string_utils import contains_kanji
+from simple_typing_application.sentence_generator.static_sentence_generator import (
+    load_compiled_corpus,
+    StaticSentenceGenerator,
+)
 
 
 TUP_TYPING_TARGET: tuple[TypingTargetModel, ...] = (
@@ -60,28 +70,30 @@ def test_inhertance():
         ),
     ],
 )
-def test__get_next(is_random: bool, state: tuple, expecteds: list[tuple[str, str]], mocker):
+def test__get_next_async(is_random: bool, state: tuple, expecteds: list[tuple[str, str]], mocker):
     # mock
     mock_excelapi_kanji2kana = mocker.patch(
-        "simple_typing_application.sentence_generator.static_sentence_generator.excelapi_kanji2kana",  # noqa
-        side_effect={t.text: t.text_hiragana_alphabet_symbol for t in TUP_TYPING_TARGET}.get,
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",  # noqa
+        side_effect=lambda text, **kwargs: {t.text: t.text_hiragana_alphabet_symbol for t in TUP_TYPING_TARGET}[text],
     )
 
     # preparation
     num_calls: int = len(expecteds)
+    # NOTE: the next typing targets are drawn in advance to read their kanas in the background.
+    random.setstate(state)
     generator = StaticSentenceGenerator(
         text_kana_map={target.text: None for target in TUP_TYPING_TARGET},
         is_random=is_random,
     )
-    # NOTE: to check whether _get_next generates targets cyclically  # noqa
+    # NOTE: to check whether _get_next_async generates targets cyclically  # noqa
     assert num_calls > len(TUP_TYPING_TARGET)
 
     # execute
-    random.setstate(state)
-    actuals = [generator._get_next() for _ in range(num_calls)]
+    actuals = [asyncio.run(generator._get_next_async()) for _ in range(num_calls)]
 
     # assert
-    assert mock_excelapi_kanji2kana.call_count == len(TUP_TYPING_TARGET)
+    # NOTE: texts without kanjis are converted locally.
+    assert mock_excelapi_kanji2kana.call_count == sum(contains_kanji(t.text) for t in TUP_TYPING_TARGET)
     assert actuals == expecteds
 
 
@@ -106,26 +118,275 @@ def test__get_next(is_random: bool, state: tuple, expecteds: list[tuple[str, str
 def test_generate(is_random: bool, state: tuple, expecteds: list[TypingTargetModel], mocker):
     # mock
     mock_excelapi_kanji2kana = mocker.patch(
-        "simple_typing_application.sentence_generator.static_sentence_generator.excelapi_kanji2kana",  # noqa
-        side_effect={t.text: t.text_hiragana_alphabet_symbol for t in TUP_TYPING_TARGET}.get,
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",  # noqa
+        side_effect=lambda text, **kwargs: {t.text: t.text_hiragana_alphabet_symbol for t in TUP_TYPING_TARGET}[text],
     )
 
     # preparation
     num_calls: int = len(expecteds)
+    # NOTE: the next typing targets are drawn in advance to read their kanas in the background.
+    random.setstate(state)
     generator = StaticSentenceGenerator(
         text_kana_map={target.text: None for target in TUP_TYPING_TARGET},
         is_random=is_random,
     )
-    # NOTE: to check whether _get_next generates targets cyclically  # noqa
+    # NOTE: to check whether _get_next_async generates targets cyclically  # noqa
     assert num_calls > len(TUP_TYPING_TARGET)
 
     # execute
-    random.setstate(state)
     actuals = [asyncio.run(generator.generate()) for _ in range(num_calls)]
     # NOTE: the order of typing_target is not important
     for actual in actuals:
         actual.typing_target = list(map(sorted, actual.typing_target))  # type: ignore  # noqa
 
     # assert
-    assert mock_excelapi_kanji2kana.call_count == len(TUP_TYPING_TARGET)
+    # NOTE: texts without kanjis are converted locally.
+    assert mock_excelapi_kanji2kana.call_count == sum(contains_kanji(t.text) for t in TUP_TYPING_TARGET)
     assert actuals == expecteds
+
+
+@pytest.mark.parametrize("is_random", [False, True])
+def test_generate_with_compiled_corpus(is_random: bool, tmp_path, mocker):
+    # mock
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",  # noqa
+    )
+    mock_build_typing_target = mocker.patch(
+        "simple_typing_application.sentence_generator.static_sentence_generator.build_typing_target",  # noqa
+    )
+
+    # preparation
+    compiled_corpus_path = tmp_path / "compiled.jsonl"
+    compiled_corpus_path.write_text(
+        "\n".join(target.model_dump_json() for target in TUP_TYPING_TARGET) + "\n",
+        encoding="utf-8",
+    )
+    generator = StaticSentenceGenerator(
+        text_kana_map={"ignored": None},
+        is_random=is_random,
+        compiled_corpus_path=str(compiled_corpus_path),
+    )
+
+    # execute
+    actuals = [asyncio.run(generator.generate()) for _ in range(5 * len(TUP_TYPING_TARGET))]
+
+    # assert
+    mock_excelapi_kanji2kana.assert_not_called()
+    mock_build_typing_target.assert_not_called()
+    assert all(actual in TUP_TYPING_TARGET for actual in actuals)
+    if not is_random:
+        assert actuals[: len(TUP_TYPING_TARGET)] == list(TUP_TYPING_TARGET)
+
+
+def test_load_compiled_corpus_empty(tmp_path):
+    compiled_corpus_path = tmp_path / "compiled.jsonl"
+    compiled_corpus_path.write_text("\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        load_compiled_corpus(str(compiled_corpus_path))
+
+
+def test_init_converts_katakana_locally(mocker):
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",  # noqa
+    )
+
+    generator = StaticSentenceGenerator(text_kana_map={"ヴァイオリン": None, "バイオリン": "ヴァイオリン"})
+
+    mock_excelapi_kanji2kana.assert_not_called()
+    assert [asyncio.run(generator._get_next_async()) for _ in range(2)] == [
+        ("ヴァイオリン", "ゔぁいおりん"),
+        ("バイオリン", "ゔぁいおりん"),
+    ]
+
+
+def test_init_uses_kana_cache(tmp_path, mocker):
+    mock_response = mocker.MagicMock(spec=Response)
+    mock_response.text = "にほんご"
+    mock_response.raise_for_status.return_value = None
+    mock_get = mocker.patch(
+        "simple_typing_application.utils.http_client.requests.Session.get",
+        return_value=mock_response,
+    )
+    mocker.patch("simple_typing_application.utils.rate_limiter.time.sleep")
+    kana_cache_path = str(tmp_path / "kana.sqlite3")
+
+    generator = StaticSentenceGenerator(text_kana_map={"日本語": None}, kana_cache_path=kana_cache_path)
+    assert asyncio.run(generator._get_next_async()) == ("日本語", "にほんご")
+    generator = StaticSentenceGenerator(text_kana_map={"日本語": None}, kana_cache_path=kana_cache_path)
+    assert asyncio.run(generator._get_next_async()) == ("日本語", "にほんご")
+
+    assert mock_get.call_count == 1
+    assert generator.kana_cache is not None
+    assert generator.kana_cache.metrics().hit_rate == 1.0
+
+
+def test_init_without_kana_cache(mocker):
+    mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",  # noqa
+        return_value="にほんご",
+    )
+    generator = StaticSentenceGenerator(text_kana_map={"日本語": None}, use_kana_cache=False)
+    assert generator.kana_cache is None
+
+
+def test_init_with_dictionary_kana_reader(mocker):
+    mock_get = mocker.patch("simple_typing_application.utils.http_client.requests.Session.get")
+
+    generator = StaticSentenceGenerator(
+        text_kana_map={"これはサンプルの文章です。": None},
+        kana_reader_type=EKanaReaderType.DICTIONARY,
+    )
+
+    mock_get.assert_not_called()
+    assert asyncio.run(generator._get_next_async()) == (
+        "これはサンプルの文章です。",
+        "これはさんぷるのぶんしょうです。",
+    )
+
+
+def test_init_does_not_wait_for_kanas(mocker):
+    started = Event()
+    released = Event()
+
+    def excelapi_kanji2kana(text: str, **kwargs) -> str:
+        started.set()
+        assert released.wait(timeout=10.0)
+        return "にほんご"
+
+    mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=excelapi_kanji2kana,
+    )
+
+    generator = StaticSentenceGenerator(text_kana_map={"サンプル": None, "日本語": None}, use_kana_cache=False)
+
+    # NOTE: the kana of the second typing target is being read in the background.
+    assert started.wait(timeout=10.0)
+    assert asyncio.run(generator._get_next_async()) == ("サンプル", "さんぷる")
+    released.set()
+    assert asyncio.run(generator._get_next_async()) == ("日本語", "にほんご")
+
+
+@pytest.mark.parametrize("kana_prefetch_size", [0, 1, 3])
+def test_prefetch_kanas(kana_prefetch_size: int, mocker):
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=lambda text, **kwargs: "かな",
+    )
+    texts = [f"漢字{i}" for i in range(5)]
+
+    generator = StaticSentenceGenerator(
+        text_kana_map={text: None for text in texts},
+        use_kana_cache=False,
+        kana_prefetch_size=kana_prefetch_size,
+    )
+    for future in list(generator._kana_futures.values()):
+        future.result(timeout=10.0)
+
+    read_texts = sorted(args[0] for args, _ in mock_excelapi_kanji2kana.call_args_list)
+    assert read_texts == texts[:kana_prefetch_size]
+    assert [asyncio.run(generator._get_next_async()) for _ in range(len(texts))] == [(text, "かな") for text in texts]
+    assert mock_excelapi_kanji2kana.call_count == len(texts)
+
+
+def test_get_next_skips_unreadable_kana(mocker, caplog):
+    def excelapi_kanji2kana(text: str, **kwargs) -> str:
+        if text == "鰻":
+            raise RuntimeError("unreadable")
+        return "にほんご"
+
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=excelapi_kanji2kana,
+    )
+
+    generator = StaticSentenceGenerator(text_kana_map={"鰻": None, "日本語": None}, use_kana_cache=False)
+
+    assert asyncio.run(generator.generate()).text == "日本語"
+    assert "Skip 鰻" in caplog.text
+    # NOTE: the unreadable kana is read again on its next use.
+    assert asyncio.run(generator._get_next_async()) == ("日本語", "にほんご")
+    assert [args[0] for args, _ in mock_excelapi_kanji2kana.call_args_list].count("鰻") >= 2
+
+
+def test_get_next_raises_error_if_no_kana_can_be_read(mocker):
+    mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=RuntimeError("unreadable"),
+    )
+
+    generator = StaticSentenceGenerator(text_kana_map={"鰻": None, "鮪": None}, use_kana_cache=False)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(generator.generate())
+
+
+def test_prefetch_stops_after_all_kanas_are_read(mocker):
+    mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=lambda text, **kwargs: "かんじ",
+    )
+
+    generator = StaticSentenceGenerator(text_kana_map={"漢字": None, "かな": None}, use_kana_cache=False)
+    assert [asyncio.run(generator._get_next_async()) for _ in range(2)] == [("漢字", "かんじ"), ("かな", "かな")]
+    assert generator._num_unread == 0
+
+    spy_prefetch = mocker.spy(generator, "_prefetch")
+    assert asyncio.run(generator._get_next_async()) == ("漢字", "かんじ")
+    spy_prefetch.assert_not_called()
+
+
+def test_close_cancels_pending_reads(mocker):
+    started = Event()
+    released = Event()
+
+    def excelapi_kanji2kana(text: str, **kwargs) -> str:
+        started.set()
+        released.wait(timeout=10.0)
+        return "かな"
+
+    mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=excelapi_kanji2kana,
+    )
+
+    generator = StaticSentenceGenerator(
+        text_kana_map={"漢字0": None, "漢字1": None},
+        use_kana_cache=False,
+        kana_prefetch_size=1,
+    )
+    assert started.wait(timeout=10.0)
+    pending = generator._read_kana(1)
+
+    generator.close()
+    released.set()
+
+    assert pending.cancelled()
+
+
+def test_close_stops_reads_waiting_for_rate_limiter(mocker):
+    # NOTE: the next request to excelapi.org is allowed only after a minute. Restored after this test.
+    mocker.patch.object(EXCELAPI_RATE_LIMITER, "_next_time", time.monotonic() + 60.0)
+    mock_excelapi_kanji2kana = mocker.patch(
+        "simple_typing_application.kana_reader.excelapi_kana_reader.excelapi_kanji2kana",
+        side_effect=lambda text, before_request, **kwargs: before_request(),
+    )
+
+    generator = StaticSentenceGenerator(
+        text_kana_map={"漢字0": None, "漢字1": None},
+        use_kana_cache=False,
+        kana_prefetch_size=1,
+    )
+    waiting = generator._read_kana(0)
+
+    start = time.monotonic()
+    generator.close()
+
+    assert isinstance(waiting.exception(timeout=10.0), KanaReaderClosedError)
+    assert time.monotonic() - start < 10.0
+    mock_excelapi_kanji2kana.assert_called_once()
+
+
+def test_init_invalid_kana_prefetch_size():
+    with pytest.raises(ValueError):
+        StaticSentenceGenerator(text_kana_map={"日本語": None}, kana_prefetch_size=-1)
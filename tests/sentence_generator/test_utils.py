@@ -1,9 +1,23 @@
 from __future__ import annotations
+import itertools
+import random
 import pytest
 from simple_typing_application.const import ASCII_CHARS
+from simple_typing_application.const.hiragana_romaji_map import HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP
+from simple_typing_application.kana_transducer import KanaTransducer, save_kana_transducer
 from simple_typing_application.sentence_generator.utils import (
+    _expand_lattice,
+    _expand_lattice_with_fallback,
+    clear_expansion_cache,
+    expand_chunk,
+    expansion_cache_info,
+    get_kana_transducer,
+    iter_hiraganas_alphabets_symbols,
+    iter_typing_target,
+    normalize_kana_text,
     split_hiraganas_alphabets_symbols,
     splitted_hiraganas_alphabets_symbols_to_typing_target,
+    TooManyAlternativesError,
 )
 
 
@@ -323,3 +337,201 @@ def test_splitted_hiraganas_alphabets_symbols_to_typing_target(
 def test_splitted_hiraganas_alphabets_symbols_to_typing_target_raise_error():
     with pytest.raises(ValueError):
         splitted_hiraganas_alphabets_symbols_to_typing_target(["β"])
+
+
+def test_iter_hiraganas_alphabets_symbols_is_equivalent_to_split():
+    chars = ["っ", "ん", "あ", "き", "ゃ", "ぁ", "、", "a", "-"]
+    rng = random.Random(0)
+    for _ in range(1000):
+        text = "".join(rng.choice(chars) for _ in range(rng.randint(1, 8)))
+        assert list(iter_hiraganas_alphabets_symbols(iter(text))) == split_hiraganas_alphabets_symbols(text), text
+    assert list(iter_hiraganas_alphabets_symbols("")) == []
+
+
+def _stream(text: str, limit: int):
+    # NOTE: a stream of characters which fails after `limit` characters.
+    for i, c in enumerate(text):
+        if i >= limit:
+            raise RuntimeError("read too much")
+        yield c
+
+
+def test_iter_typing_target_yields_chunks_incrementally():
+    chunks = iter_typing_target(_stream("きゃっとふーど" * 1000, limit=5))
+    assert next(chunks) == ("きゃ", ("kilya", "kixya", "kya"))
+    assert next(chunks) == ("っと", ("ltsuto", "ltuto", "tto", "xtsuto", "xtuto"))
+    with pytest.raises(RuntimeError):
+        next(chunks)
+
+
+def test_iter_typing_target_is_equivalent_to_typing_target():
+    text = "「ちょっとまって」、ＨＥＬＬＯ！こんにちは。ふぁーぶるのてぃーかっぷ。" * 100
+    expected = splitted_hiraganas_alphabets_symbols_to_typing_target(split_hiraganas_alphabets_symbols(text))
+    assert [list(alternatives) for _, alternatives in iter_typing_target(text)] == expected
+    assert [
+        list(alternatives) for _, alternatives in iter_typing_target(normalize_kana_text(text), normalized=True)
+    ] == expected
+
+
+def test_iter_typing_target_raises_error_after_valid_chunks():
+    chunks = iter_typing_target("あいβ")
+    assert [chunk for chunk, _ in itertools.islice(chunks, 2)] == ["あ", "い"]
+    with pytest.raises(ValueError):
+        next(chunks)
+
+
+@pytest.mark.parametrize(
+    "text,expected",
+    [
+        ("HELLO、せかい！", "HELLO,せかい!"),
+        ("ＡＢＣａｂｃ０１２", "ABCabc012"),
+        ("「ふぁーぶる」・。", "[ふぁ-ぶる]/."),
+        ("＼￥　～", "\\¥ ~"),
+        ("こんにちは", "こんにちは"),
+        ("", ""),
+    ],
+)
+def test_normalize_kana_text(text: str, expected: str):
+    assert normalize_kana_text(text) == expected
+
+
+def test_splitted_hiraganas_alphabets_symbols_to_typing_target_with_normalized_text():
+    chars = ["っ", "ん", "あ", "きゃ", "ー", "、", "。", "「", "」", "・", "Ａ", "ａ", "！", "　", "a", "-"]
+    rng = random.Random(0)
+    for _ in range(200):
+        text = "".join(rng.choice(chars) for _ in range(rng.randint(1, 8)))
+        if text[-1] in "っん":
+            continue
+        expected = splitted_hiraganas_alphabets_symbols_to_typing_target(split_hiraganas_alphabets_symbols(text))
+        actual = splitted_hiraganas_alphabets_symbols_to_typing_target(
+            split_hiraganas_alphabets_symbols(normalize_kana_text(text)),
+            normalized=True,
+        )
+        assert actual == expected, text
+
+
+def test_expand_chunk_is_memoized():
+    clear_expansion_cache()
+
+    first = expand_chunk("っと")
+    second = expand_chunk("っと")
+    # NOTE: zenkaku symbols are normalized before the cache lookup.
+    third = expand_chunk("ー")
+    fourth = expand_chunk("-")
+
+    assert first is second
+    assert isinstance(first, tuple)
+    assert third is fourth == ("-",)
+    info = expansion_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 2, 2)
+
+
+def test_expand_chunk_does_not_cache_invalid_chunk():
+    clear_expansion_cache()
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            expand_chunk("β")
+    assert expansion_cache_info().currsize == 0
+
+
+def test_splitted_hiraganas_alphabets_symbols_to_typing_target_does_not_share_lists():
+    actual = splitted_hiraganas_alphabets_symbols_to_typing_target(["こ"])
+    actual[0].append("dummy")
+    assert splitted_hiraganas_alphabets_symbols_to_typing_target(["こ"]) == [["co", "ko"]]
+
+
+def _expand_by_brute_force(splitted: list[str]) -> set[str]:
+    # NOTE: the reference implementation which enumerates all the combinations of candidates.  # noqa
+    targets: set[str] = set()
+    for candidate in itertools.product(*[HIRA2ROMA_MAP.get(c, SMALL_HIRA2ROMA_MAP.get(c, [c])) for c in splitted]):
+        if candidate[-1] == "n" or candidate[-1] is None:
+            continue
+        if any(
+            (s is None and t is None)
+            or (s is None and t is not None and t[0] in "aiueon")
+            or (s is None and t is not None and not ("a" <= t[0] <= "z" or "A" <= t[0] <= "Z"))
+            or (s == "n" and t is not None and t[0] in "aiueony")
+            for s, t in zip(candidate, candidate[1:])
+        ):
+            continue
+        joined = "".join(x if x is not None else y[0] for x, y in zip(candidate, candidate[1:] + (None,)))  # type: ignore  # noqa
+        if "xxtsu" in joined or "lltsu" in joined:
+            continue
+        targets.add(joined)
+    return targets
+
+
+def test_expand_lattice_is_equivalent_to_brute_force():
+    chars = ["っ", "ん", "あ", "か", "きゃ", "ぁ", "ゃ", "つ", "し", "や", "x", "l", "n", "t", "s", "u", "-", ","]
+    rng = random.Random(0)
+    for _ in range(2000):
+        splitted = [rng.choice(chars) for _ in range(rng.randint(1, 5))]
+        assert set(_expand_lattice(splitted)) == _expand_by_brute_force(splitted), splitted
+
+
+@pytest.mark.parametrize("length", [8, 30, 1000])
+def test_expand_lattice_raises_error_for_too_many_alternatives(length: int):
+    with pytest.raises(TooManyAlternativesError):
+        _expand_lattice(["っ"] * length)
+
+
+def test_expand_lattice_long_chunk_with_few_alternatives():
+    assert sorted(_expand_lattice(["っ"] + ["-"] * 1000)) == sorted(
+        s + "-" * 1000 for s in ["ltsu", "ltu", "xtsu", "xtu"]
+    )
+
+
+def test_expand_lattice_with_fallback_returns_all_alternatives_if_not_too_many():
+    assert sorted(_expand_lattice_with_fallback(["っ", "と"])) == sorted(_expand_lattice(["っ", "と"]))
+
+
+@pytest.mark.parametrize("max_alternatives", [1, 2, 10, 100])
+def test_expand_lattice_with_fallback_returns_valid_subset(max_alternatives: int, caplog: pytest.LogCaptureFixture):
+    chars = ["っ", "ん", "あ", "か", "きゃ", "ぁ", "ゃ", "つ", "し", "や", "x", "l", "n", "t", "s", "u", "-", ","]
+    rng = random.Random(0)
+    for _ in range(200):
+        splitted = [rng.choice(chars) for _ in range(rng.randint(1, 5))]
+        expected = _expand_by_brute_force(splitted)
+        if not expected:
+            continue
+        actual = _expand_lattice_with_fallback(splitted, max_alternatives)
+        assert 0 < len(actual) <= max_alternatives, splitted
+        assert set(actual) <= expected, splitted
+        if len(expected) <= max_alternatives:
+            assert set(actual) == expected, splitted
+    assert "preferred alternatives are accepted" in caplog.text
+
+
+@pytest.mark.parametrize("length", [8, 30, 1000])
+def test_expand_lattice_with_fallback_for_too_many_alternatives(length: int):
+    actual = _expand_lattice_with_fallback(["っ"] * length + ["と"])
+    assert 0 < len(actual) <= 10000
+    assert all(target.endswith("to") for target in actual)
+    assert "xtu" * length + "to" in actual
+
+
+def test_expand_chunk_falls_back_for_too_many_alternatives():
+    clear_expansion_cache()
+    assert expand_chunk("っ" * 30 + "と") == ("xtu" * 30 + "to",)
+
+
+def test_get_kana_transducer_does_not_write_cache(cache_direc):
+    get_kana_transducer.cache_clear()
+    try:
+        transducer = get_kana_transducer()
+        assert get_kana_transducer() is transducer
+        assert transducer == KanaTransducer.from_romaji_maps(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP)
+        assert not cache_direc.exists()
+    finally:
+        get_kana_transducer.cache_clear()
+
+
+def test_get_kana_transducer_loads_saved_binary(cache_direc, mocker):
+    save_kana_transducer(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, str(cache_direc))
+    compile_spy = mocker.spy(KanaTransducer, "from_romaji_maps")
+    get_kana_transducer.cache_clear()
+    try:
+        assert get_kana_transducer().lookup("きゃ") == HIRA2ROMA_MAP["きゃ"]
+        compile_spy.assert_not_called()
+    finally:
+        get_kana_transducer.cache_clear()
@@ -3,6 +3,7 @@ from unittest.mock import mock_open
 
 import pytest
 from simple_typing_application.models.config_models import ConfigModel
+from simple_typing_application.models.config_models.http_client_config_model import HttpClientConfigModel
 from simple_typing_application.models.config_models.sentence_generator_config_model import (  # noqa
     OpenAISentenceGeneratorConfigModel,
 )
@@ -10,6 +11,7 @@ from simple_typing_application.models.config_models.user_interface_config_model
     ConsoleUserInterfaceConfigModel,
 )
 from simple_typing_application.config import load_config
+from simple_typing_application.utils.http_client import DEFAULT_MAX_KEEPALIVE_CONNECTIONS
 
 
 def test_load_config_json(mocker):
@@ -47,6 +49,21 @@ def test_load_config_json(mocker):
     assert actual_dic == expected_dic
 
 
+def test_load_config_json_with_http_client_config(mocker):
+    # mock
+    mocker.patch(
+        "simple_typing_application.config.open",
+        mock_open(read_data='{"http_client_config": {"max_connections": 2, "timeout_sec": 5.0}}'),
+    )
+
+    # run
+    actual: ConfigModel = load_config("dummy.json")
+
+    # assert
+    assert actual.http_client_config == HttpClientConfigModel(max_connections=2, timeout_sec=5.0)
+    assert actual.http_client_config.max_keepalive_connections == DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+
+
 def test_load_config_json_not_found(mocker):
     # mock
     mocker.patch(
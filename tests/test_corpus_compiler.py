@@ -0,0 +1,138 @@
+from __future__ import annotations
+import asyncio
+import json
+
+from click.testing import CliRunner
+import pytest
+from simple_typing_application.corpus_compiler import compile_corpus, compile_line, main
+from simple_typing_application.models.typing_target_model import TypingTargetModel  # noqa
+from simple_typing_application.sentence_generator.static_sentence_generator import (  # noqa
+    load_compiled_corpus,
+    StaticSentenceGenerator,
+)
+
+
+TSV_LINES: list[str] = [
+    "Hello, 世界！\tHello、せかい！",
+    "",
+    "ファーブル\tふぁーぶる",
+    "invalid line without kana",
+    "ちょっと\tちょっと",
+    "ベータ\tβ",
+]
+
+
+@pytest.mark.parametrize(
+    "line, input_format",
+    [
+        ("ちあ\tちあ", "tsv"),
+        (json.dumps({"text": "ちあ", "kana": "ちあ"}, ensure_ascii=False), "jsonl"),
+    ],
+)
+def test_compile_line(line: str, input_format: str):
+    assert compile_line(line, input_format) == TypingTargetModel(
+        text="ちあ",
+        text_hiragana_alphabet_symbol="ちあ",
+        typing_target=[["chi", "ti"], ["a"]],
+    )
+
+
+@pytest.mark.parametrize(
+    "line, input_format",
+    [
+        ("ちあ", "tsv"),
+        ("ちあ\tちあ\tちあ", "tsv"),
+        ("ちあ\t", "tsv"),
+        ("ベータ\tβ", "tsv"),
+        ("{", "jsonl"),
+        ('{"text": "ちあ"}', "jsonl"),
+        ('["ちあ", "ちあ"]', "jsonl"),
+        ("ちあ\tちあ", "csv"),
+    ],
+)
+def test_compile_line_invalid(line: str, input_format: str):
+    with pytest.raises(ValueError):
+        compile_line(line, input_format)
+
+
+@pytest.mark.parametrize(
+    "text, kana",
+    [
+        ("ヴァイオリン", "ヴァイオリン"),
+        ("ファーブル", "ファーブル"),
+        ("Ｈｅｌｌｏ、せかい！", "Ｈｅｌｌｏ、せかい！"),
+    ],
+)
+def test_compile_line_same_as_static_sentence_generator(text: str, kana: str):
+    generator = StaticSentenceGenerator(text_kana_map={text: kana})
+    assert compile_line(f"{text}\t{kana}", "tsv") == asyncio.run(generator.generate())
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+@pytest.mark.parametrize("batch_size", [1, 2, 256])
+def test_compile_corpus(max_workers: int, batch_size: int, tmp_path):
+    input_path = tmp_path / "corpus.tsv"
+    input_path.write_text("\n".join(TSV_LINES) + "\n", encoding="utf-8")
+    output_path = tmp_path / "corpus.jsonl"
+
+    result = compile_corpus(str(input_path), str(output_path), max_workers=max_workers, batch_size=batch_size)
+
+    assert result.num_lines == 5
+    assert result.num_sentences == 3
+    assert sorted(result.failed_lines) == [4, 6]
+    actuals = load_compiled_corpus(str(output_path))
+    assert [actual.text for actual in actuals] == ["Hello, 世界！", "ファーブル", "ちょっと"]
+    assert actuals[1].typing_target == [["fa", "fula", "fuxa", "hula", "huxa"], ["-"], ["bu"], ["ru"]]
+
+
+def test_compile_corpus_jsonl(tmp_path):
+    input_path = tmp_path / "corpus.jsonl"
+    input_path.write_text(
+        "\n".join(json.dumps({"text": "ちょっと", "kana": "ちょっと"}, ensure_ascii=False) for _ in range(3)),
+        encoding="utf-8",
+    )
+    output_path = tmp_path / "compiled.jsonl"
+
+    result = compile_corpus(str(input_path), str(output_path), max_workers=1)
+
+    assert (result.num_lines, result.num_sentences, result.failed_lines) == (3, 3, {})
+    assert len(load_compiled_corpus(str(output_path))) == 3
+
+
+def test_compile_corpus_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        compile_corpus(str(tmp_path / "corpus.csv"), str(tmp_path / "compiled.jsonl"))
+
+
+def test_main(tmp_path):
+    input_path = tmp_path / "corpus.txt"
+    input_path.write_text("\n".join(TSV_LINES), encoding="utf-8")
+    output_path = tmp_path / "compiled.jsonl"
+
+    result = CliRunner().invoke(
+        main,
+        ["-i", str(input_path), "-o", str(output_path), "-f", "tsv", "-w", "1"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "lines: 5 (failed: 2)" in result.output
+    assert "sentences: 3" in result.output
+    assert "sentences/sec" in result.output
+
+
+def test_main_save_kana_transducer(tmp_path, cache_direc):
+    input_path = tmp_path / "corpus.tsv"
+    input_path.write_text("ちあ\tちあ\n", encoding="utf-8")
+    output_path = tmp_path / "compiled.jsonl"
+
+    result = CliRunner().invoke(main, ["-i", str(input_path), "-o", str(output_path), "-w", "1"])
+    assert result.exit_code == 0, result.output
+    assert not cache_direc.exists()
+
+    result = CliRunner().invoke(
+        main,
+        ["-i", str(input_path), "-o", str(output_path), "-w", "1", "--save-kana-transducer"],
+    )
+    assert result.exit_code == 0, result.output
+    assert len(list(cache_direc.glob("kana_transducer_*.bin"))) == 1
+    assert "kana transducer:" in result.output
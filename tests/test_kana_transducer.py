@@ -0,0 +1,105 @@
+from __future__ import annotations
+import os
+import random
+
+import pytest
+from pytest_mock import MockerFixture
+
+from simple_typing_application.const.hiragana_romaji_map import HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP
+from simple_typing_application.kana_transducer import (
+    FORMAT_VERSION,
+    get_kana_transducer_path,
+    KanaTransducer,
+    load_kana_transducer,
+    save_kana_transducer,
+)
+
+
+TRANSDUCER: KanaTransducer = KanaTransducer.from_romaji_maps(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP)
+
+
+def test_lookup():
+    for kana, romajis in HIRA2ROMA_MAP.items():
+        assert TRANSDUCER.lookup(kana) == romajis
+    for kana, romajis in SMALL_HIRA2ROMA_MAP.items():
+        assert TRANSDUCER.lookup(kana) == romajis
+    assert TRANSDUCER.lookup("β") is None
+    assert TRANSDUCER.lookup("きき") is None
+
+
+def test_char_flags():
+    assert TRANSDUCER.char_flags("っ") == TRANSDUCER.char_flags("ん") == KanaTransducer.FLAG_REQUIRES_NEXT
+    assert TRANSDUCER.char_flags("ゃ") == KanaTransducer.FLAG_ATTACHES_PREVIOUS
+    assert TRANSDUCER.char_flags("あ") == TRANSDUCER.char_flags("a") == 0
+
+
+def _tokenize_by_merging(chunk: str) -> list[str]:
+    # NOTE: the reference implementation which attaches a small kana to the previous kana if possible.
+    tokens: list[str] = []
+    for c in chunk:
+        if c in SMALL_HIRA2ROMA_MAP and len(tokens) > 0 and tokens[-1] + c in HIRA2ROMA_MAP:
+            tokens[-1] += c
+        else:
+            tokens.append(c)
+    return tokens
+
+
+def test_tokenize_is_equivalent_to_merging():
+    chars = ["っ", "ん", "き", "ゃ", "ぁ", "い", "ぇ", "ふ", "a", "β"]
+    rng = random.Random(0)
+    for _ in range(1000):
+        chunk = "".join(rng.choice(chars) for _ in range(rng.randint(1, 8)))
+        assert TRANSDUCER.tokenize(chunk) == _tokenize_by_merging(chunk), chunk
+
+
+def test_save_and_load(tmp_path):
+    path = str(tmp_path / "transducer.bin")
+    TRANSDUCER.save(path, checksum=b"checksum")
+
+    assert KanaTransducer.load(path) == TRANSDUCER
+    assert KanaTransducer.load(path, checksum=b"checksum") == TRANSDUCER
+    with pytest.raises(ValueError):
+        KanaTransducer.load(path, checksum=b"another")
+    assert os.path.getsize(path) < 16 * 1024
+
+
+@pytest.mark.parametrize(
+    "buffer",
+    [
+        b"",
+        b"invalid",
+        TRANSDUCER.to_bytes()[:-10],
+        b"KANAFST\0" + bytes([FORMAT_VERSION + 1, 0]) + TRANSDUCER.to_bytes()[10:],
+    ],
+)
+def test_from_bytes_invalid(buffer: bytes):
+    with pytest.raises(ValueError):
+        KanaTransducer.from_bytes(buffer)
+
+
+def test_load_kana_transducer(tmp_path, mocker: MockerFixture):
+    compile_spy = mocker.spy(KanaTransducer, "from_romaji_maps")
+
+    # NOTE: loading never writes the binary file.
+    assert load_kana_transducer(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, str(tmp_path)) == TRANSDUCER
+    assert compile_spy.call_count == 1
+    assert not list(tmp_path.iterdir())
+
+    path = save_kana_transducer(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, str(tmp_path / "cache"))
+    assert path == get_kana_transducer_path(str(tmp_path / "cache"))
+    assert compile_spy.call_count == 2
+    assert load_kana_transducer(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, str(tmp_path / "cache")) == TRANSDUCER
+    assert compile_spy.call_count == 2
+
+    # NOTE: a change of the tables invalidates the binary file.
+    changed = load_kana_transducer({**HIRA2ROMA_MAP, "ゔぁ": ("va",)}, SMALL_HIRA2ROMA_MAP, str(tmp_path / "cache"))
+    assert compile_spy.call_count == 3
+    assert changed.lookup("ゔぁ") == ("va",)
+
+
+def test_save_kana_transducer_without_writable_cache_direc(tmp_path):
+    cache_direc = tmp_path / "file"
+    cache_direc.write_text("", encoding="utf-8")
+    with pytest.raises(OSError):
+        save_kana_transducer(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, str(cache_direc / "cache"))
+    assert load_kana_transducer(HIRA2ROMA_MAP, SMALL_HIRA2ROMA_MAP, str(cache_direc / "cache")) == TRANSDUCER
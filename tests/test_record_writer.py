@@ -0,0 +1,74 @@
+from __future__ import annotations
+from datetime import datetime as dt
+import json
+from threading import Event
+
+from simple_typing_application.models.output_model import OutputModel
+from simple_typing_application.models.record_model import RecordModel
+from simple_typing_application.models.typing_target_model import TypingTargetModel
+from simple_typing_application.record_writer import RecordWriter
+
+
+def _build_output(text: str) -> OutputModel:
+    return OutputModel(
+        timestamp=dt(2021, 1, 1),
+        typing_target=TypingTargetModel(text=text, text_hiragana_alphabet_symbol=text, typing_target=[[text]]),
+        records=[RecordModel(timestamp=dt(2021, 1, 1), pressed_key=text, is_correct=True, correct_keys=[text])],
+    )
+
+
+def test_record_writer_writes_all_outputs_on_close(tmp_path):
+    writer = RecordWriter(max_queue_size=2)
+    outputs = {str(tmp_path / f"{i}.json"): _build_output(str(i)) for i in range(10)}
+
+    for path, output in outputs.items():
+        writer.submit(path, output)
+    writer.close()
+
+    assert not writer.is_running
+    for path, output in outputs.items():
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f) == output.model_dump(mode="json")
+
+
+def test_record_writer_flush(tmp_path, mocker):
+    writer = RecordWriter()
+    started = Event()
+    release = Event()
+    original_write = writer._write
+
+    def slow_write(path: str, output: OutputModel):
+        started.set()
+        release.wait(timeout=5)
+        original_write(path, output)
+
+    mocker.patch.object(writer, "_write", side_effect=slow_write)
+    path = tmp_path / "record.json"
+
+    # NOTE: submit returns before the output is written.
+    writer.submit(str(path), _build_output("a"))
+    assert started.wait(timeout=5)
+    assert not path.exists()
+
+    release.set()
+    writer.flush()
+    assert path.exists()
+    writer.close()
+
+
+def test_record_writer_survives_write_error(tmp_path, caplog):
+    writer = RecordWriter()
+
+    writer.submit(str(tmp_path / "not_exist" / "record.json"), _build_output("a"))
+    writer.submit(str(tmp_path / "record.json"), _build_output("b"))
+    writer.close()
+
+    assert (tmp_path / "record.json").exists()
+    assert "failed to save the record" in caplog.text
+
+
+def test_record_writer_close_without_start():
+    writer = RecordWriter()
+    writer.flush()
+    writer.close()
+    assert not writer.is_running
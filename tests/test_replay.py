@@ -0,0 +1,188 @@
+from __future__ import annotations
+from datetime import datetime as dt
+import json
+import os
+
+import pytest
+from simple_typing_application.models.output_model import OutputModel
+from simple_typing_application.models.record_model import RecordModel
+from simple_typing_application.models.typing_target_model import TypingTargetModel  # noqa
+from simple_typing_application.replay import replay_file, replay_files, replay_output
+
+
+FIXED_TIMESTAMP: dt = dt(2021, 1, 1, 0, 0, 0, 0)
+
+
+def _create_output(records: list[tuple[str, bool, list[str], bool]]) -> OutputModel:
+    return OutputModel(
+        timestamp=FIXED_TIMESTAMP,
+        typing_target=TypingTargetModel(
+            text="ちあ",
+            text_hiragana_alphabet_symbol="ちあ",
+            typing_target=[["ti", "chi"], ["a"]],
+        ),
+        records=[
+            RecordModel(
+                timestamp=FIXED_TIMESTAMP,
+                pressed_key=pressed_key,
+                is_correct=is_correct,
+                correct_keys=correct_keys,
+                is_undo=is_undo,
+            )
+            for pressed_key, is_correct, correct_keys, is_undo in records
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    "output, expected_output, expected_num_changed_records",
+    [
+        (
+            _create_output([("c", True, ["c", "t"], False), ("h", True, ["h"], False)]),
+            _create_output([("c", True, ["c", "t"], False), ("h", True, ["h"], False)]),
+            0,
+        ),
+        (
+            _create_output([("c", False, [], False), ("x", True, [], False), ("h", True, ["h"], False)]),
+            _create_output([("c", True, ["c", "t"], False), ("x", False, ["h"], False), ("h", True, ["h"], False)]),  # noqa
+            2,
+        ),
+        (
+            _create_output(
+                [
+                    ("c", True, ["c", "t"], False),
+                    ("BACKSPACE", False, ["h"], True),
+                    ("t", False, [], False),
+                    ("i", True, ["i"], False),
+                ]
+            ),
+            _create_output(
+                [
+                    ("c", True, ["c", "t"], False),
+                    ("BACKSPACE", False, ["h"], True),
+                    ("t", True, ["c", "t"], False),
+                    ("i", True, ["i"], False),
+                ]
+            ),
+            1,
+        ),
+    ],
+)
+def test_replay_output(
+    output: OutputModel,
+    expected_output: OutputModel,
+    expected_num_changed_records: int,
+):
+    # execute
+    actual_output, actual_num_changed_records = replay_output(output)
+
+    # assert
+    assert actual_output.model_dump() == expected_output.model_dump()
+    assert actual_num_changed_records == expected_num_changed_records
+
+
+def test_replay_output_rebuild_typing_target():
+    # preparation
+    output = OutputModel(
+        timestamp=FIXED_TIMESTAMP,
+        typing_target=TypingTargetModel(
+            text="ち",
+            text_hiragana_alphabet_symbol="ち",
+            typing_target=[["ti"]],
+        ),
+        records=[RecordModel(timestamp=FIXED_TIMESTAMP, pressed_key="c", is_correct=False, correct_keys=["t"])],
+    )
+
+    # execute
+    actual_output, actual_num_changed_records = replay_output(output, rebuild_typing_target=True)
+
+    # assert
+    assert actual_output.typing_target.typing_target == [["chi", "ti"]]
+    assert actual_output.records[0].is_correct
+    assert actual_output.records[0].correct_keys == ("c", "t")
+    assert actual_num_changed_records == 1
+
+
+def test_replay_file(tmp_path):
+    # preparation
+    input_direc = tmp_path / "input"
+    output_direc = tmp_path / "output"
+    input_direc.mkdir()
+    output_direc.mkdir()
+    output = _create_output([("c", False, [], False), ("h", True, ["h"], False)])
+    expected_output, _ = replay_output(output)
+    path = str(input_direc / "record.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(output.model_dump(mode="json"), f, indent=4, ensure_ascii=False)
+
+    # execute
+    actual = replay_file(path, str(output_direc))
+
+    # assert
+    assert actual.error is None
+    assert actual.num_records == 2
+    assert actual.num_changed_records == 1
+    with open(output_direc / "record.json", "r", encoding="utf-8") as f:
+        assert json.load(f) == expected_output.model_dump(mode="json")
+
+
+def test_replay_file_ignores_order_of_correct_keys(tmp_path):
+    # NOTE: sample_record.json stores the correct keys in arbitrary order, e.g. ["y", "i"].
+    path = os.path.join(os.path.dirname(__file__), "..", "sample_record.json")
+
+    actual = replay_file(path, str(tmp_path))
+
+    assert actual.error is None
+    assert actual.num_records > 0
+    assert actual.num_changed_records == 0
+    with open(path, "rb") as f, open(tmp_path / "sample_record.json", "rb") as g:
+        assert f.read() == g.read()
+
+
+def test_replay_output_ignores_order_of_correct_keys():
+    output = _create_output([("c", True, ["t", "c"], False), ("h", True, ["h"], False)])
+
+    actual_output, actual_num_changed_records = replay_output(output)
+
+    assert actual_num_changed_records == 0
+    assert actual_output.records == output.records
+
+
+def test_replay_file_invalid(tmp_path):
+    # preparation
+    path = str(tmp_path / "invalid.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+
+    # execute
+    actual = replay_file(path, str(tmp_path / "output"))
+
+    # assert
+    assert actual.error is not None
+    assert actual.num_records == 0
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_replay_files(max_workers: int, tmp_path):
+    # preparation
+    input_direc = tmp_path / "input"
+    input_direc.mkdir()
+    paths: list[str] = []
+    for i in range(5):
+        path = str(input_direc / f"{i}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                _create_output([("c", True, ["c", "t"], False), ("x", True, ["h"], False)]).model_dump(mode="json"),  # noqa
+                f,
+                indent=4,
+                ensure_ascii=False,
+            )
+        paths.append(path)
+
+    # execute
+    actuals = replay_files(paths, str(tmp_path / "output"), max_workers=max_workers, chunksize=2)
+
+    # assert
+    assert [actual.path for actual in actuals] == paths
+    assert all(actual.num_changed_records == 1 for actual in actuals)
+    assert sorted(os.listdir(tmp_path / "output")) == sorted(os.path.basename(path) for path in paths)
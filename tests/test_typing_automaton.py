@@ -0,0 +1,171 @@
+from __future__ import annotations
+import pytest
+from simple_typing_application.models.typing_target_model import TypingTargetModel
+from simple_typing_application.typing_automaton import TypingProgress, compile_typing_target
+
+
+@pytest.mark.parametrize(
+    "typing_target, accepted_keys, rejected_keys",
+    [
+        ([["a"], ["b"], ["c"]], ["abc"], ["b", "ac", "abb"]),
+        ([["ti", "chi"]], ["ti", "chi"], ["ci", "th", "x"]),
+        (
+            [["ltsuto", "ltuto", "tto", "xtsuto", "xtuto"], ["i", "yi"]],
+            ["ttoi", "xtsutoyi", "ltutoi"],
+            ["tsu", "xto", "ttoe"],
+        ),
+        ([["a", "ab"], ["c"]], ["ac", "ab"], ["abc"]),
+    ],
+)
+def test_compile_typing_target(
+    typing_target: list[list[str]],
+    accepted_keys: list[str],
+    rejected_keys: list[str],
+):
+    # execute
+    automaton = compile_typing_target(typing_target)
+
+    # assert
+    for keys in accepted_keys:
+        state: int | None = automaton.initial_state
+        for key in keys:
+            assert state is not None
+            state = automaton.step(state, key)
+        assert state is not None
+        assert automaton.is_accepted(state)
+
+    for keys in rejected_keys:
+        state = automaton.initial_state
+        for key in keys:
+            if state is None:
+                break
+            state = automaton.step(state, key)
+        assert state is None or not automaton.is_accepted(state)
+
+
+def test_compile_typing_target_empty():
+    # execute
+    automaton = compile_typing_target([])
+
+    # assert
+    assert automaton.initial_state == automaton.accept_state
+    assert automaton.num_states == 1
+
+
+def test_compile_typing_target_deterministic():
+    # execute
+    automaton = compile_typing_target([["ka", "ca"], ["ki"]])
+
+    # assert
+    assert automaton.initial_state != automaton.accept_state
+    for table in automaton.transitions:
+        assert all(len(char) == 1 for char in table)
+        assert all(0 <= state < automaton.num_states for state in table.values())
+
+
+def test_typing_progress():
+    # preparation
+    typing_target = TypingTargetModel(
+        text="こんにちは",
+        text_hiragana_alphabet_symbol="こんにちは",
+        typing_target=[["ko", "co"], ["nnni", "n'ni", "xnni"], ["ti", "chi"], ["ha"]],
+    )
+    progress = TypingProgress(typing_target)
+
+    # assert: initial
+    assert progress.typing_target is typing_target
+    assert progress.position == 0
+    assert progress.partial_matches == ("ko", "co")
+    assert progress.romaji == "konnnitiha"
+    assert not progress.is_done
+
+    # execute & assert
+    assert progress.advance("k")
+    assert progress.advance("o")
+    assert progress.position == 1
+    assert not progress.advance("a")
+    assert progress.position == 1
+    for key in "n'nichiha":
+        assert progress.advance(key)
+    assert progress.is_done
+    assert progress.romaji == ""
+    assert typing_target.typing_target == [["ko", "co"], ["nnni", "n'ni", "xnni"], ["ti", "chi"], ["ha"]]
+
+
+def test_typing_progress_shares_automaton():
+    # preparation
+    typing_target = TypingTargetModel(text="abc", text_hiragana_alphabet_symbol="abc", typing_target=[["a"], ["b"]])
+    automaton = compile_typing_target(typing_target.typing_target)
+
+    # execute
+    progress1 = TypingProgress(typing_target, automaton=automaton)
+    progress2 = TypingProgress(typing_target, automaton=automaton)
+    progress1.advance("a")
+
+    # assert
+    assert progress1.automaton is progress2.automaton
+    assert progress1.position == 1
+    assert progress2.position == 0
+
+
+@pytest.mark.parametrize(
+    "typing_target, keys, expected",
+    [
+        ([["a"], ["b"]], "", ("a",)),
+        ([["a"], ["b"]], "a", ("b",)),
+        ([["a"], ["b"]], "ab", ()),
+        ([["ti", "chi"], ["a"]], "", ("c", "t")),
+        ([["ti", "chi"], ["a"]], "c", ("h",)),
+        ([["a", "ab"], ["c"]], "a", ("b", "c")),
+    ],
+)
+def test_next_keys(
+    typing_target: list[list[str]],
+    keys: str,
+    expected: tuple[str, ...],
+):
+    # preparation
+    automaton = compile_typing_target(typing_target)
+    state: int | None = automaton.initial_state
+    for key in keys:
+        assert state is not None
+        state = automaton.step(state, key)
+    assert state is not None
+
+    # assert
+    assert automaton.next_keys[state] == expected
+
+
+def test_next_keys_are_interned():
+    # execute
+    automaton = compile_typing_target([["ka"], ["ka"], ["ka"]])
+
+    # assert
+    keys_a = [keys for keys in automaton.next_keys if keys == ("a",)]
+    keys_k = [keys for keys in automaton.next_keys if keys == ("k",)]
+    assert len(keys_a) == 3
+    assert len(keys_k) == 3
+    assert all(keys is keys_a[0] for keys in keys_a)
+    assert all(keys is keys_k[0] for keys in keys_k)
+
+
+def test_typing_progress_undo():
+    # preparation
+    typing_target = TypingTargetModel(text="abc", text_hiragana_alphabet_symbol="abc", typing_target=[["a"], ["b"]])
+    progress = TypingProgress(typing_target)
+
+    # execute & assert
+    assert not progress.undo()
+    assert progress.advance("a")
+    assert not progress.advance("z")
+    assert progress.undo()
+    assert progress.position == 1
+    assert progress.undo()
+    assert progress.position == 0
+    assert not progress.undo()
+    assert progress.advance("a")
+    assert progress.advance("b")
+    assert progress.is_done
+    assert progress.undo()
+    assert not progress.is_done
+    assert progress.correct_keys == ("b",)
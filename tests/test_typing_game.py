@@ -10,17 +10,26 @@ from simple_typing_application.models.record_model import RecordModel
 from simple_typing_application.models.typing_target_model import TypingTargetModel  # noqa
 from simple_typing_application.key_monitor.base import BaseKeyMonitor
 from simple_typing_application.sentence_generator.base import BaseSentenceGenerator  # noqa
+from simple_typing_application.typing_automaton import TypingProgress
 from simple_typing_application.typing_game import (
     _input_char_is_correct,
     _typing_is_done,
     TypingGame,
 )
 from simple_typing_application.ui.base import BaseUserInterface
+from simple_typing_application.utils.latency import KeystrokeLatencyTracer
 
 
 FIXED_TIMESTAMP: dt = dt(2021, 1, 1, 0, 0, 0, 0)
 
 
+def _remaining_typing_target(progress: TypingProgress) -> list[list[str]]:
+    # NOTE: reconstruct the typing target which has not been input yet from the progress.  # noqa
+    if progress.is_done:
+        return []
+    return [list(progress.partial_matches)] + progress.typing_target.typing_target[progress.position + 1 :]  # noqa
+
+
 @pytest.fixture(scope="function")
 def typing_game_with_mocks(mocker) -> tuple[TypingGame, dict[str, mock.MagicMock]]:  # type: ignore # noqa
     # create mocks
@@ -33,7 +42,7 @@ def typing_game_with_mocks(mocker) -> tuple[TypingGame, dict[str, mock.MagicMock
         mock_exit=mocker.patch("builtins.exit"),
         mock_record_direc="./dummy",
         mock_open=mocker.patch("builtins.open", mocker.mock_open(read_data="")),  # noqa
-        mock_json_dump=mocker.patch("simple_typing_application.typing_game.json.dump"),  # noqa
+        mock_json_dump=mocker.patch("simple_typing_application.record_writer.json.dump"),  # noqa
     )
     mocks["mock_dt"].now = mocker.Mock(return_value=FIXED_TIMESTAMP)
 
@@ -160,9 +169,16 @@ def test_input_char_is_correct(
     typing_target: TypingTargetModel,
     expected: tuple[bool, TypingTargetModel],
 ):
+    # preparation
+    progress = TypingProgress(typing_target)
+
     # execute
-    actual = _input_char_is_correct(char, typing_target)
-    assert actual == expected
+    actual = _input_char_is_correct(char, progress)
+
+    # assert
+    assert actual == expected[0]
+    assert _remaining_typing_target(progress) == expected[1].typing_target
+    assert progress.typing_target is typing_target
 
 
 @pytest.mark.parametrize(
@@ -191,10 +207,46 @@ def test_typing_is_done(
     expected: bool,
 ):
     # execute
-    actual = _typing_is_done(typing_target)
+    actual = _typing_is_done(TypingProgress(typing_target))
     assert actual == expected
 
 
+@pytest.mark.parametrize(
+    "typing_target, keys, expected",
+    [
+        ([["a"], ["b"], ["c"]], "abc", True),
+        ([["a"], ["b"], ["c"]], "ab", False),
+        ([["ti", "chi"], ["a"]], "chia", True),
+        ([["ti", "chi"], ["a"]], "tia", True),
+        ([["ti", "chi"], ["a"]], "ch", False),
+        # NOTE: the rest of partially matched patterns are carried over to the next chunk.  # noqa
+        ([["a", "ab"], ["c"]], "ab", True),
+        ([["a", "ab"], ["c"]], "ac", True),
+        ([["nn", "n'", "xn"]], "nn", True),
+    ],
+)
+def test_typing_is_done_after_keys(
+    typing_target: list[list[str]],
+    keys: str,
+    expected: bool,
+):
+    # preparation
+    progress = TypingProgress(
+        TypingTargetModel(
+            text="dummy",
+            text_hiragana_alphabet_symbol="dummy",
+            typing_target=typing_target,
+        )
+    )
+
+    # execute
+    for key in keys:
+        assert _input_char_is_correct(key, progress)
+
+    # assert
+    assert _typing_is_done(progress) == expected
+
+
 def test_typing_game_instantiation(typing_game_with_mocks: tuple[TypingGame, dict[str, mock.MagicMock]]):  # type: ignore # noqa
     # unpack
     typing_game, mocks = typing_game_with_mocks
@@ -219,7 +271,7 @@ def test_typing_game__show_typing_target(typing_game_with_mocks: tuple[TypingGam
     )
 
     # execute
-    typing_game._show_typing_target(typing_target)
+    typing_game._show_typing_target(TypingProgress(typing_target))
 
     # assert
     mocks["mock_user_interface"].show_typing_target.assert_any_call(
@@ -254,10 +306,11 @@ def test_typing_game___initialize_typing_step(typing_game_with_mocks: tuple[Typi
     )
 
     # execute
-    typing_game._TypingGame__initialize_typing_step(typing_target)  # type: ignore  # noqa
+    progress = TypingProgress(typing_target)
+    typing_game._TypingGame__initialize_typing_step(progress)  # type: ignore  # noqa
 
     # assert
-    assert typing_game._TypingGame__current_typing_target is typing_target  # type: ignore  # noqa
+    assert typing_game._TypingGame__current_progress is progress  # type: ignore  # noqa
     assert typing_game._TypingGame__current_records == []  # type: ignore
     typing_game._key_monitor.set_on_press_callback.assert_called_once_with(typing_game._TypingGame__on_press_callback)  # type: ignore # noqa
 
@@ -275,7 +328,7 @@ def test_typing_game___clean_up_typing_step(typing_game_with_mocks: tuple[Typing
         text_hiragana_alphabet_symbol="abc",
         typing_target=[["a"], ["b"], ["c"]],
     )
-    typing_game._TypingGame__initialize_typing_step(typing_target)  # type: ignore  # noqa
+    typing_game._TypingGame__initialize_typing_step(TypingProgress(typing_target))  # type: ignore  # noqa
     typing_game._key_monitor.set_on_press_callback.reset_mock()  # type: ignore  # noqa
     typing_game._key_monitor.set_on_release_callback.reset_mock()  # type: ignore  # noqa
 
@@ -283,7 +336,7 @@ def test_typing_game___clean_up_typing_step(typing_game_with_mocks: tuple[Typing
     typing_game._TypingGame__clean_up_typing_step()  # type: ignore
 
     # assert
-    assert typing_game._TypingGame__current_typing_target is None  # type: ignore  # noqa
+    assert typing_game._TypingGame__current_progress is None  # type: ignore  # noqa
     assert typing_game._TypingGame__current_records is None  # type: ignore  # noqa
     typing_game._key_monitor.set_on_press_callback.assert_called_once_with(None)  # type: ignore # noqa
     typing_game._key_monitor.set_on_release_callback.assert_called_once_with(None)  # type: ignore # noqa
@@ -444,15 +497,49 @@ def test_typing_game__on_press_callback(
     typing_game, mocks = typing_game_with_mocks
 
     # execute
-    typing_game._TypingGame__initialize_typing_step(typing_target)  # type: ignore  # noqa
+    typing_game._TypingGame__initialize_typing_step(TypingProgress(typing_target))  # type: ignore  # noqa
     actual = typing_game._TypingGame__on_press_callback(key)  # type: ignore
 
     # assert
-    assert typing_game._TypingGame__current_typing_target == expected___current_typing_target  # type: ignore  # noqa
+    for record in typing_game._TypingGame__current_records:  # type: ignore
+        assert record.correct_keys is typing_game._TypingGame__current_progress.automaton.next_keys[0]  # type: ignore  # noqa
+    actual_remaining_typing_target = _remaining_typing_target(typing_game._TypingGame__current_progress)  # type: ignore  # noqa
+    assert actual_remaining_typing_target == expected___current_typing_target.typing_target  # noqa
     assert typing_game._TypingGame__current_records == expected____current_records  # type: ignore  # noqa
     assert actual == expected
 
 
+def test_typing_game__on_press_callback_backspace(
+    typing_game_with_mocks: tuple[TypingGame, dict[str, mock.MagicMock]],
+):
+    # unpack
+    typing_game, mocks = typing_game_with_mocks
+
+    # preparation
+    typing_target = TypingTargetModel(
+        text="ち",
+        text_hiragana_alphabet_symbol="ち",
+        typing_target=[["ti", "chi"]],
+    )
+    typing_game._TypingGame__initialize_typing_step(TypingProgress(typing_target))  # type: ignore  # noqa
+
+    # execute
+    for key in [EMetaKey.BACKSPACE, "c", "x", EMetaKey.BACKSPACE, EMetaKey.BACKSPACE, "t"]:
+        typing_game._TypingGame__on_press_callback(key)  # type: ignore
+
+    # assert
+    progress: TypingProgress = typing_game._TypingGame__current_progress  # type: ignore  # noqa
+    assert progress.partial_matches == ("i",)
+    assert typing_game._TypingGame__current_records == [  # type: ignore
+        RecordModel(timestamp=FIXED_TIMESTAMP, pressed_key="c", is_correct=True, correct_keys=["c", "t"]),  # noqa
+        RecordModel(timestamp=FIXED_TIMESTAMP, pressed_key="x", is_correct=False, correct_keys=["h"]),  # noqa
+        RecordModel(timestamp=FIXED_TIMESTAMP, pressed_key="BACKSPACE", is_undo=True, correct_keys=["h"]),  # noqa
+        RecordModel(timestamp=FIXED_TIMESTAMP, pressed_key="BACKSPACE", is_undo=True, correct_keys=["h"]),  # noqa
+        RecordModel(timestamp=FIXED_TIMESTAMP, pressed_key="t", is_correct=True, correct_keys=["c", "t"]),  # noqa
+    ]
+    assert mocks["mock_user_interface"].erase_user_input.call_count == 2
+
+
 @pytest.mark.parametrize(
     "key, current_typing_target, expected",
     [
@@ -540,7 +627,7 @@ def test_typing_game__on_release_callback(
     typing_game, mocks = typing_game_with_mocks
 
     # execute
-    typing_game._TypingGame__initialize_typing_step(current_typing_target)  # type: ignore  # noqa
+    typing_game._TypingGame__initialize_typing_step(TypingProgress(current_typing_target))  # type: ignore  # noqa
     actual = typing_game._TypingGame__on_release_callback(key)  # type: ignore
 
     # assert
@@ -603,7 +690,7 @@ def test_typing_game__typing_step(
 ):
     # unpack
     typing_game, mocks = typing_game_with_mocks
-    assert typing_game._TypingGame__current_typing_target is None  # type: ignore  # noqa
+    assert typing_game._TypingGame__current_progress is None  # type: ignore  # noqa
     assert typing_game._TypingGame__current_records is None  # type: ignore  # noqa
 
     # preparation
@@ -616,13 +703,130 @@ def test_typing_game__typing_step(
             typing_game._TypingGame__on_release_callback(record.pressed_key)  # type: ignore  # noqa
             logging.debug(f"current records: {typing_game._TypingGame__current_records}")  # type: ignore  # noqa
 
-    mocks["mock_key_monitor"].start = mocker.Mock(side_effect=emulate_pressing_keys)  # type: ignore  # noqa
+    mocks["mock_key_monitor"].start_async = mocker.AsyncMock(side_effect=emulate_pressing_keys)  # type: ignore  # noqa
 
     # execute
-    asyncio.run(typing_game._typing_step(typing_target))
+    asyncio.run(typing_game._typing_step(TypingProgress(typing_target)))
+    typing_game.record_writer.close()
 
     # assert
-    typing_game._key_monitor.start.assert_called_once_with()  # type: ignore  # noqa
+    typing_game._key_monitor.start_async.assert_awaited_once_with()  # type: ignore  # noqa
     mocks["mock_json_dump"].assert_called_once_with(
         expected_output.model_dump(mode="json"), mocks["mock_open"].return_value, indent=4, ensure_ascii=False
     )
+
+
+def test_typing_game__on_press_callback_with_latency_tracer(mocker):
+    # preparation
+    mock_key_monitor = mocker.MagicMock(spec=BaseKeyMonitor)
+    mock_tracer = mocker.MagicMock(spec=KeystrokeLatencyTracer)
+    mocker.patch("simple_typing_application.typing_game.os.makedirs")
+    typing_game = TypingGame(
+        sentence_generator=mocker.MagicMock(spec=BaseSentenceGenerator),
+        key_monitor=mock_key_monitor,
+        ui=mocker.MagicMock(spec=BaseUserInterface),
+        record_direc="./dummy",
+        latency_tracer=mock_tracer,
+    )
+    typing_game._TypingGame__initialize_typing_step(  # type: ignore
+        TypingProgress(TypingTargetModel(text="a", text_hiragana_alphabet_symbol="a", typing_target=[["a"]]))
+    )
+
+    # execute
+    typing_game._TypingGame__on_press_callback("x")  # type: ignore
+    typing_game._TypingGame__on_press_callback(EMetaKey.TAB)  # type: ignore
+
+    # assert
+    mock_key_monitor.set_latency_tracer.assert_called_once_with(mock_tracer)
+    assert mock_tracer.on_callback_started.call_count == 2
+    mock_tracer.on_echo_started.assert_called_once_with()
+    mock_tracer.on_echo_finished.assert_called_once_with()
+
+
+@pytest.mark.parametrize("keep_samples", [False, True])
+def test_typing_game_start_reports_latency(keep_samples: bool, mocker):
+    # preparation
+    mock_user_interface = mocker.MagicMock(spec=BaseUserInterface)
+    mock_tracer = mocker.MagicMock(spec=KeystrokeLatencyTracer)
+    mock_tracer.keep_samples = keep_samples
+    mock_tracer.format_summary.return_value = "summary"
+    mock_sentence_generator = mocker.MagicMock(spec=BaseSentenceGenerator)
+    mocker.patch("simple_typing_application.typing_game.os.makedirs")
+    typing_game = TypingGame(
+        sentence_generator=mock_sentence_generator,
+        key_monitor=mocker.MagicMock(spec=BaseKeyMonitor),
+        ui=mock_user_interface,
+        record_direc="./dummy",
+        latency_tracer=mock_tracer,
+    )
+    mocker.patch.object(typing_game, "_main_loop", mocker.AsyncMock(side_effect=SystemExit(-1)))
+    mock_close_http_clients = mocker.patch("simple_typing_application.typing_game.close_http_clients")
+
+    # execute
+    with pytest.raises(SystemExit):
+        typing_game.start()
+
+    # assert
+    mock_user_interface.system_anounce.assert_any_call("summary")
+    assert mock_tracer.dump_samples.call_count == int(keep_samples)
+    mock_sentence_generator.close.assert_called_once_with()
+    mock_close_http_clients.assert_called_once_with()
+
+
+def test_typing_game__main_loop(
+    typing_game_with_mocks: tuple[TypingGame, dict[str, mock.MagicMock]],
+    mocker,
+):
+    # unpack
+    typing_game, mocks = typing_game_with_mocks
+
+    # preparation
+    typing_targets = [
+        TypingTargetModel(text=text, text_hiragana_alphabet_symbol=text, typing_target=[[text]])
+        for text in ["a", "b", "c"]
+    ]
+    mocks["mock_sentence_generator"].generate = mocker.AsyncMock(side_effect=typing_targets)
+    typed: list[str] = []
+
+    async def typing_step(progress: TypingProgress):
+        typed.append(progress.typing_target.text)
+        if len(typed) == len(typing_targets):
+            raise SystemExit(-1)
+
+    mocker.patch.object(typing_game, "_typing_step", side_effect=typing_step)
+    mock_aclose_async_client = mocker.patch("simple_typing_application.typing_game.aclose_async_client")
+
+    # execute
+    with pytest.raises(SystemExit):
+        asyncio.run(typing_game._main_loop())
+
+    # assert
+    assert typed == ["a", "b", "c"]
+    assert typing_game.typing_target_queue.metrics.num_gets == 3
+    mock_aclose_async_client.assert_awaited_once_with()
+
+
+def test_typing_game__typing_step_saves_records_and_exits_on_esc(
+    typing_game_with_mocks: tuple[TypingGame, dict[str, mock.MagicMock]],
+    mocker,
+):
+    # unpack
+    typing_game, mocks = typing_game_with_mocks
+
+    # preparation
+    def emulate_pressing_esc():
+        typing_game._TypingGame__on_press_callback("a")  # type: ignore
+        typing_game._TypingGame__on_release_callback(EMetaKey.ESC)  # type: ignore
+
+    mocks["mock_key_monitor"].start_async = mocker.AsyncMock(side_effect=emulate_pressing_esc)  # type: ignore
+    typing_target = TypingTargetModel(text="ab", text_hiragana_alphabet_symbol="ab", typing_target=[["a"], ["b"]])
+
+    # execute
+    asyncio.run(typing_game._typing_step(TypingProgress(typing_target)))
+    typing_game.record_writer.close()
+
+    # assert
+    # NOTE: exit is called from the key monitor and the event loop.
+    assert mocks["mock_exit"].call_args_list == [mocker.call(-1), mocker.call(-1)]
+    mocks["mock_json_dump"].assert_called_once()
+    assert mocks["mock_json_dump"].call_args.args[0]["records"][0]["pressed_key"] == "a"
@@ -0,0 +1,100 @@
+from __future__ import annotations
+import asyncio
+from typing import Callable
+
+import pytest
+
+from simple_typing_application.models.typing_target_model import TypingTargetModel
+from simple_typing_application.sentence_generator.base import BaseSentenceGenerator
+from simple_typing_application.typing_target_queue import TypingTargetQueue
+
+
+class _CountingSentenceGenerator(BaseSentenceGenerator):
+    def __init__(self, delay: float = 0.0, fail_at: int | None = None):
+        self.num_calls = 0
+        self._delay = delay
+        self._fail_at = fail_at
+
+    async def generate(
+        self,
+        callback: Callable[[TypingTargetModel], TypingTargetModel] = lambda x: x,
+    ) -> TypingTargetModel:
+        self.num_calls += 1
+        if self._fail_at is not None and self.num_calls >= self._fail_at:
+            raise RuntimeError("failed to generate")
+        await asyncio.sleep(self._delay)
+        text = str(self.num_calls)
+        return callback(TypingTargetModel(text=text, text_hiragana_alphabet_symbol=text, typing_target=[[text]]))
+
+
+@pytest.mark.parametrize("max_depth", [1, 3])
+def test_typing_target_queue_prefetches_up_to_max_depth(max_depth: int):
+    generator = _CountingSentenceGenerator()
+
+    async def main():
+        queue = TypingTargetQueue(generator, max_depth=max_depth)
+        queue.start()
+        await asyncio.sleep(0.05)
+        num_calls_before_get = generator.num_calls
+        depth_before_get = queue.metrics.depth
+        progress = await queue.get()
+        await asyncio.sleep(0.05)
+        await queue.stop()
+        return num_calls_before_get, depth_before_get, progress, generator.num_calls
+
+    num_calls_before_get, depth_before_get, progress, num_calls_after_get = asyncio.run(main())
+
+    assert num_calls_before_get == max_depth
+    assert depth_before_get == max_depth
+    assert progress.typing_target.text == "1"
+    assert progress.automaton.num_states == 2
+    # NOTE: the producer refills as soon as a typing target has been taken.
+    assert num_calls_after_get == max_depth + 1
+
+
+def test_typing_target_queue_keeps_order_and_metrics():
+    generator = _CountingSentenceGenerator(delay=0.01)
+
+    async def main():
+        queue = TypingTargetQueue(generator, max_depth=2)
+        queue.start()
+        texts = [(await queue.get()).typing_target.text for _ in range(5)]
+        metrics = queue.metrics
+        await queue.stop()
+        return texts, metrics
+
+    texts, metrics = asyncio.run(main())
+
+    assert texts == ["1", "2", "3", "4", "5"]
+    assert metrics.num_gets == 5
+    assert 1 <= metrics.num_waits <= 5
+    assert metrics.total_wait_seconds >= metrics.last_wait_seconds >= 0.0
+    assert metrics.max_depth == 2
+
+
+def test_typing_target_queue_raises_exception_of_generator():
+    generator = _CountingSentenceGenerator(fail_at=2)
+
+    async def main():
+        queue = TypingTargetQueue(generator, max_depth=1)
+        queue.start()
+        first = await queue.get()
+        try:
+            await queue.get()
+        finally:
+            await queue.stop()
+        return first
+
+    with pytest.raises(RuntimeError, match="failed to generate"):
+        asyncio.run(main())
+
+
+def test_typing_target_queue_get_before_start():
+    queue = TypingTargetQueue(_CountingSentenceGenerator())
+    with pytest.raises(RuntimeError):
+        asyncio.run(queue.get())
+
+
+def test_typing_target_queue_invalid_max_depth():
+    with pytest.raises(ValueError):
+        TypingTargetQueue(_CountingSentenceGenerator(), max_depth=0)
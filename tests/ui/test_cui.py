@@ -38,6 +38,20 @@ def test_show_user_input(mocker):
     mock_print.assert_called_once_with(expected, end="", flush=True)
 
 
+def test_erase_user_input(mocker):
+    # mock
+    mock_print = mocker.patch("builtins.print")
+
+    # preparation
+    cui = ConsoleUserInterface()
+
+    # execute
+    cui.erase_user_input()
+
+    # asert
+    mock_print.assert_called_once_with("\b \b", end="", flush=True)
+
+
 def test_system_anounce(mocker):
     # mock
     mock_print = mocker.patch("builtins.print")
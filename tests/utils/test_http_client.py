@@ -0,0 +1,73 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from simple_typing_application.utils.http_client import (
+    aclose_async_client,
+    close_http_clients,
+    configure_http_clients,
+    DEFAULT_TIMEOUT_SEC,
+    get_async_client,
+    get_session,
+    get_timeout_sec,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_http_clients():
+    yield
+    configure_http_clients()
+
+
+def test_get_session_is_shared():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        sessions = list(executor.map(lambda _: get_session(), range(8)))
+    assert all(session is sessions[0] for session in sessions)
+
+    close_http_clients()
+    assert get_session() is not sessions[0]
+
+
+def test_get_session_pools_connections():
+    configure_http_clients(max_connections=3)
+    adapter = get_session().get_adapter("https://api.excelapi.org")
+    assert adapter._pool_maxsize == 3  # type: ignore
+
+
+def test_get_async_client_is_shared_in_event_loop():
+    configure_http_clients(max_connections=3, max_keepalive_connections=2, timeout_sec=5.0)
+
+    async def main():
+        client = get_async_client()
+        assert get_async_client() is client
+        assert client.timeout.read == 5.0
+        await aclose_async_client()
+        assert client.is_closed
+        return client
+
+    client1 = asyncio.run(main())
+    client2 = asyncio.run(main())
+    assert client1 is not client2
+    assert get_timeout_sec() == 5.0
+
+
+def test_get_async_client_requires_event_loop():
+    with pytest.raises(RuntimeError):
+        get_async_client()
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(max_connections=0),
+        dict(max_keepalive_connections=0),
+        dict(keepalive_expiry_sec=0.0),
+        dict(timeout_sec=-1.0),
+    ],
+)
+def test_configure_http_clients_invalid_limits(kwargs: dict):
+    with pytest.raises(ValueError):
+        configure_http_clients(**kwargs)
+    assert get_timeout_sec() == DEFAULT_TIMEOUT_SEC
@@ -1,13 +1,21 @@
+import asyncio
 from functools import partial
+import threading
 
+import httpx
 import pytest
 import requests
 from requests import Response
 from simple_typing_application.utils.japanese_string_utils import (
     is_hiragana,
+    contains_kanji,
     delete_space_between_hiraganas,
     excelapi_kanji2kana,
+    excelapi_kanji2kana_async,
+    katakana_to_hiragana,
 )
+from simple_typing_application.const.hiragana_katakana_map import KATAKANA2HIRAGANA_MAP
+from simple_typing_application.utils.kana_cache import KanaCache
 from simple_typing_application.utils.rerun import MaxRetryError
 
 
@@ -38,6 +46,46 @@ def test_is_hiragana_raise_error():
         is_hiragana("aa")
 
 
+@pytest.mark.parametrize(
+    "s,expected",
+    [
+        ("カタカナ", "かたかな"),
+        ("ヴァイオリン", "ゔぁいおりん"),
+        ("ファーブル", "ふぁーぶる"),  # the long vowel mark is kept
+        ("ﾌｧｰ", "ﾌｧー"),  # only the halfwidth long vowel mark is converted
+        ("ヵヶ", "かけ"),
+        ("ヷヸヹヺ", "ゔぁゔぃゔぇゔぉ"),
+        ("これは日本語デス。ABC abc", "これは日本語です。ABC abc"),
+        ("", ""),
+    ],
+)
+def test_katakana_to_hiragana(s: str, expected: str):
+    assert katakana_to_hiragana(s) == expected
+
+
+def test_katakana_to_hiragana_is_equivalent_to_replace():
+    text = "".join(KATAKANA2HIRAGANA_MAP) + "あいうアイウ漢字ー"
+    expected = text
+    for k, h in KATAKANA2HIRAGANA_MAP.items():
+        if k not in "ヵヶ":
+            expected = expected.replace(k, h)
+    assert katakana_to_hiragana(text) == expected.replace("ヵ", "か").replace("ヶ", "け")
+
+
+@pytest.mark.parametrize(
+    "s,expected",
+    [
+        ("日本語", True),
+        ("ひらがなとカタカナ", False),
+        ("日々", True),
+        ("Hello, world!", False),
+        ("", False),
+    ],
+)
+def test_contains_kanji(s: str, expected: bool):
+    assert contains_kanji(s) == expected
+
+
 @pytest.mark.parametrize(
     "s,expected",
     [
@@ -72,7 +120,7 @@ def test_excelapi_kanji2kana(input_text: str, transform_katakana_to_hiragana: bo
     mock_response.status_code = 200
     mock_response.raise_for_status.return_value = None
     mocker.patch(
-        "simple_typing_application.utils.japanese_string_utils.requests.get",
+        "simple_typing_application.utils.http_client.requests.Session.get",
         return_value=mock_response,
     )
 
@@ -104,7 +152,7 @@ def test_excelapi_kanji2kana_request_get_raises_1error(mocker):
     mock_response.status_code = 200
     mock_response.raise_for_status.return_value = None
     mock_request_get = mocker.patch(
-        "simple_typing_application.utils.japanese_string_utils.requests.get",
+        "simple_typing_application.utils.http_client.requests.Session.get",
         side_effect=mock_requests_get,
     )
 
@@ -124,7 +172,7 @@ def test_excelapi_kanji2kana_request_get_raises_error_always(mocker):
 
     # mock
     mock_request_get = mocker.patch(
-        "simple_typing_application.utils.japanese_string_utils.requests.get",
+        "simple_typing_application.utils.http_client.requests.Session.get",
         side_effect=requests.exceptions.RequestException,
     )
 
@@ -155,7 +203,7 @@ def test_excelapi_kanji2kana_invalid_status_code(
     mock_response.url = "test url"
     mock_response.raise_for_status = partial(Response.raise_for_status, mock_response)  # noqa
     mocker.patch(
-        "simple_typing_application.utils.japanese_string_utils.requests.get",
+        "simple_typing_application.utils.http_client.requests.Session.get",
         return_value=mock_response,
     )
 
@@ -178,3 +226,144 @@ def test_excelapi_kanji2kana_integrate(mocker):
 
     # assert
     assert actual == expected
+
+
+def test_excelapi_kanji2kana_quotes_text(mocker):
+    # mock
+    mock_response = mocker.MagicMock(spec=Response)
+    mock_response.text = "あ&b c?#/"
+    mock_get = mocker.patch(
+        "simple_typing_application.utils.http_client.requests.Session.get",
+        return_value=mock_response,
+    )
+
+    # execute
+    actual = excelapi_kanji2kana("亜&b c?#/", url="https://example.com/kanji2kana")
+
+    # assert
+    assert actual == "あ&b c?#/"
+    assert mock_get.call_args.args[0] == "https://example.com/kanji2kana?text=%E4%BA%9C%26b%20c%3F%23%2F"
+
+
+def test_excelapi_kanji2kana_with_cache(tmp_path, mocker):
+    # mock
+    mock_response = mocker.MagicMock(spec=Response)
+    mock_response.text = "これはにほんごデス。"
+    mock_response.status_code = 200
+    mock_response.raise_for_status.return_value = None
+    mock_get = mocker.patch(
+        "simple_typing_application.utils.http_client.requests.Session.get",
+        return_value=mock_response,
+    )
+    mock_before_request = mocker.MagicMock()
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"))
+
+    # execute
+    actuals = [
+        excelapi_kanji2kana("これは日本語デス。", cache=cache, before_request=mock_before_request),
+        excelapi_kanji2kana("これは日本語デス。", cache=cache, before_request=mock_before_request),
+        excelapi_kanji2kana("これは日本語デス。", False, cache=cache, before_request=mock_before_request),
+    ]
+
+    # assert
+    assert actuals == ["これはにほんごです。", "これはにほんごです。", "これはにほんごデス。"]
+    assert mock_get.call_count == 2
+    assert mock_before_request.call_count == 2
+    assert cache.metrics().hits == 1
+
+
+def _mock_async_client(mocker, handler) -> httpx.AsyncClient:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    mocker.patch("simple_typing_application.utils.japanese_string_utils.get_async_client", return_value=client)
+    return client
+
+
+@pytest.mark.parametrize(
+    "input_text,transform_katakana_to_hiragana,expected",
+    [
+        ("これは日本語デス。", True, "これはにほんごです。"),
+        ("これは日本語デス。", False, "これはにほんごデス。"),
+    ],
+)
+def test_excelapi_kanji2kana_async(input_text: str, transform_katakana_to_hiragana: bool, expected: str, mocker):
+    requested_texts: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested_texts.append(request.url.params["text"])
+        return httpx.Response(200, text="これはにほんごデス。")
+
+    _mock_async_client(mocker, handler)
+
+    actual = asyncio.run(excelapi_kanji2kana_async(input_text, transform_katakana_to_hiragana))
+
+    assert actual == expected
+    assert requested_texts == [input_text]
+
+
+def test_excelapi_kanji2kana_async_retries(mocker):
+    num_requests: int = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal num_requests
+        num_requests += 1
+        if num_requests == 1:
+            raise httpx.ConnectError("test")
+        return httpx.Response(200, text="にほんご")
+
+    _mock_async_client(mocker, handler)
+
+    assert asyncio.run(excelapi_kanji2kana_async("日本語", interval_sec=0.01)) == "にほんご"
+    assert num_requests == 2
+
+
+def test_excelapi_kanji2kana_async_raises_error_always(mocker):
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("test")
+
+    _mock_async_client(mocker, handler)
+
+    with pytest.raises(MaxRetryError):
+        asyncio.run(excelapi_kanji2kana_async("日本語", max_retry=2, interval_sec=0.01))
+
+
+def test_excelapi_kanji2kana_async_invalid_status_code(mocker):
+    _mock_async_client(mocker, lambda request: httpx.Response(500))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(excelapi_kanji2kana_async("日本語"))
+
+
+def test_excelapi_kanji2kana_async_with_cache(tmp_path, mocker):
+    num_requests: int = 0
+    before_request = mocker.AsyncMock()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal num_requests
+        num_requests += 1
+        return httpx.Response(200, text="にほんご")
+
+    _mock_async_client(mocker, handler)
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"))
+
+    async def main() -> list[str]:
+        return [
+            await excelapi_kanji2kana_async("日本語", cache=cache, before_request=before_request),
+            await excelapi_kanji2kana_async("日本語", cache=cache, before_request=before_request),
+        ]
+
+    assert asyncio.run(main()) == ["にほんご", "にほんご"]
+    assert excelapi_kanji2kana("日本語", cache=cache) == "にほんご"
+    assert num_requests == 1
+    assert before_request.await_count == 1
+
+
+def test_excelapi_kanji2kana_async_accesses_cache_off_event_loop(tmp_path, mocker):
+    _mock_async_client(mocker, lambda request: httpx.Response(200, text="にほんご"))
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"))
+    thread_ids: list[int] = []
+    mocker.patch.object(cache, "get", side_effect=lambda *args: thread_ids.append(threading.get_ident()))
+    mocker.patch.object(cache, "put", side_effect=lambda *args: thread_ids.append(threading.get_ident()))
+
+    assert asyncio.run(excelapi_kanji2kana_async("日本語", cache=cache)) == "にほんご"
+    assert len(thread_ids) == 2
+    assert threading.get_ident() not in thread_ids
@@ -0,0 +1,142 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+import os
+import sqlite3
+
+import pytest
+
+from simple_typing_application.utils.kana_cache import get_default_kana_cache_path, KanaCache
+
+
+def test_kana_cache_persists_readings(tmp_path):
+    path = str(tmp_path / "kana.sqlite3")
+    cache = KanaCache(path)
+    assert cache.get("日本") is None
+    cache.put("日本", "にほん")
+    assert cache.get("日本") == "にほん"
+    cache.close()
+
+    cache = KanaCache(path)
+    assert cache.get("日本") == "にほん"
+    assert cache.metrics().hits == 1
+    assert cache.metrics().hit_rate == 1.0
+
+
+def test_kana_cache_is_keyed_by_options(tmp_path):
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"))
+    cache.put("日本", "にほん", options="a")
+    cache.put("日本", "ニホン", options="b")
+    assert cache.get("日本", options="a") == "にほん"
+    assert cache.get("日本", options="b") == "ニホン"
+    assert cache.get("日本") is None
+
+
+def test_kana_cache_does_not_touch_disk_until_first_lookup(tmp_path):
+    path = tmp_path / "direc" / "kana.sqlite3"
+    KanaCache(str(path))
+    assert not path.parent.exists()
+
+
+def test_kana_cache_default_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("SIMPLE_TYPING_APPLICATION_CACHE_DIR", str(tmp_path))
+    assert get_default_kana_cache_path() == os.path.join(str(tmp_path), "kana_cache_v1.sqlite3")
+    assert KanaCache().path == get_default_kana_cache_path()
+
+
+def test_kana_cache_expires_old_readings(tmp_path, mocker):
+    mock_time = mocker.patch("simple_typing_application.utils.kana_cache.time.time", return_value=1000.0)
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"), ttl_sec=10.0)
+    cache.put("日本", "にほん")
+
+    mock_time.return_value = 1010.0
+    assert cache.get("日本") == "にほん"
+    mock_time.return_value = 1010.1
+    assert cache.get("日本") is None
+    mock_time.return_value = 1000.0
+    assert cache.get("日本") is None  # NOTE: the expired reading has been deleted.
+    assert cache.metrics().model_dump() == dict(hits=1, misses=2, expired=1, writes=1, evictions=0)
+
+
+def test_kana_cache_evicts_least_recently_used(tmp_path, mocker):
+    mock_time = mocker.patch("simple_typing_application.utils.kana_cache.time.time", return_value=0.0)
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"), max_entries=2)
+    for i, text in enumerate(["一", "二", "一", "三"]):
+        mock_time.return_value = float(i)
+        if cache.get(text) is None:
+            cache.put(text, text)
+
+    assert cache.get("二") is None
+    assert cache.get("一") == "一"
+    assert cache.get("三") == "三"
+    assert cache.metrics().evictions == 1
+
+
+def test_kana_cache_evicts_in_batches_without_counting_every_write(tmp_path, mocker):
+    mock_time = mocker.patch("simple_typing_application.utils.kana_cache.time.time", return_value=0.0)
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"), max_entries=10)
+    cache.put("0", "0")
+    statements: list[str] = []
+    cache._connection.set_trace_callback(statements.append)  # type: ignore
+    for i in range(1, 30):
+        mock_time.return_value = float(i)
+        cache.put(str(i), str(i))
+        cache.put(str(i), str(i))  # NOTE: overwriting a reading does not add an entry.
+
+    # NOTE: 2 readings are evicted every other write: the excess and 10% of max_entries.
+    assert cache.metrics().evictions == 20
+    assert sum("COUNT(*)" in statement for statement in statements) == 10
+    with sqlite3.connect(cache.path) as connection:
+        assert connection.execute("SELECT MIN(text), COUNT(*) FROM readings").fetchone() == ("20", 10)
+
+
+def test_kana_cache_read_only(tmp_path):
+    path = str(tmp_path / "kana.sqlite3")
+    cache = KanaCache(path, read_only=True)
+    cache.put("日本", "にほん")
+    assert cache.get("日本") is None
+    assert not os.path.exists(path)
+
+    KanaCache(path).put("日本", "にほん")
+    cache = KanaCache(path, read_only=True)
+    cache.put("東京", "とうきょう")
+    assert cache.get("日本") == "にほん"
+    assert cache.get("東京") is None
+    assert cache.metrics().writes == 0
+
+
+def test_kana_cache_is_disabled_if_broken(tmp_path, caplog):
+    path = tmp_path / "kana.sqlite3"
+    path.write_bytes(b"this is not a database" * 100)
+    cache = KanaCache(str(path))
+    assert cache.get_or_compute("日本", lambda text: "にほん") == "にほん"
+    assert cache.get("日本") is None
+    assert "disabled" in caplog.text
+
+
+def test_kana_cache_get_or_compute_does_not_cache_exception(tmp_path):
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"))
+
+    def compute(text: str) -> str:
+        raise ValueError(text)
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute("日本", compute)
+    assert cache.get("日本") is None
+
+
+def test_kana_cache_is_thread_safe(tmp_path):
+    cache = KanaCache(str(tmp_path / "kana.sqlite3"))
+    texts = [str(i % 10) for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        actual = list(executor.map(lambda text: cache.get_or_compute(text, lambda t: t * 2), texts))
+
+    assert actual == [text * 2 for text in texts]
+    metrics = cache.metrics()
+    assert metrics.hits + metrics.misses == len(texts)
+    with sqlite3.connect(cache.path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM readings").fetchone() == (10,)
+
+
+def test_kana_cache_invalid_max_entries(tmp_path):
+    with pytest.raises(ValueError):
+        KanaCache(str(tmp_path / "kana.sqlite3"), max_entries=0)
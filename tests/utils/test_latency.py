@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from simple_typing_application.utils.latency import KeystrokeLatencyTracer, LatencyHistogram
+
+
+@pytest.mark.parametrize(
+    "values, q, expected",
+    [
+        ([], 50, 0),
+        ([5], 50, 5),
+        (list(range(1, 11)), 50, 5),
+        (list(range(1, 11)), 100, 10),
+        ([1000] * 99 + [10**9], 99, 1023),
+        ([1000] * 99 + [10**9], 100, 10**9),
+    ],
+)
+def test_latency_histogram_percentile(values: list[int], q: float, expected: int):
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    assert histogram.percentile(q) == expected
+
+
+@pytest.mark.parametrize("value", [1, 17, 100, 12345, 10**6, 10**9, 2**62])
+def test_latency_histogram_relative_error(value: int):
+    histogram = LatencyHistogram()
+    histogram.record(value)
+    histogram.record(value + 1)
+    assert value <= histogram.percentile(50) <= value * (1 + 1 / 2**LatencyHistogram.SUB_BUCKET_BITS)
+
+
+def test_latency_histogram_keep_samples():
+    assert LatencyHistogram().samples is None
+    histogram = LatencyHistogram(keep_samples=True)
+    histogram.record(3)
+    histogram.record(-1)
+    assert histogram.samples == [3, 0]
+
+
+def test_keystroke_latency_tracer(mocker):
+    mocker.patch(
+        "simple_typing_application.utils.latency.time.monotonic_ns",
+        side_effect=[100, 300, 700, 1500, 2000, 2100, 2200],
+    )
+    tracer = KeystrokeLatencyTracer(keep_samples=True)
+
+    # key event from a key monitor
+    tracer.on_key_received()
+    tracer.on_callback_started()
+    tracer.on_echo_started()
+    tracer.on_echo_finished()
+    # callback without a key event, e.g. called directly
+    tracer.on_callback_started()
+    tracer.on_echo_started()
+    tracer.on_echo_finished()
+
+    assert {stage: histogram.samples for stage, histogram in tracer.histograms.items()} == {
+        "listener_to_callback": [200],
+        "matching": [400, 100],
+        "echo": [800, 100],
+        "total": [1400],
+    }
+    summary = tracer.summary()
+    assert summary["matching"]["count"] == 2
+    assert summary["total"]["max"] == 1400
+    assert tracer.format_summary().splitlines()[0].startswith("stage")
+
+
+def test_keystroke_latency_tracer_echo_without_callback():
+    tracer = KeystrokeLatencyTracer()
+    tracer.on_echo_finished()
+    assert all(histogram.count == 0 for histogram in tracer.histograms.values())
+
+
+def test_keystroke_latency_tracer_dump_samples(tmp_path):
+    tracer = KeystrokeLatencyTracer(keep_samples=True)
+    tracer.on_key_received()
+    tracer.on_callback_started()
+    tracer.on_echo_started()
+    tracer.on_echo_finished()
+
+    path = tmp_path / "latency.jsonl"
+    tracer.dump_samples(str(path))
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["stage"] for line in lines] == list(KeystrokeLatencyTracer.STAGES)
+    assert all(len(line["samples_ns"]) == 1 for line in lines)
+
+
+def test_keystroke_latency_tracer_dump_samples_without_keep_samples(tmp_path):
+    with pytest.raises(ValueError):
+        KeystrokeLatencyTracer().dump_samples(str(tmp_path / "latency.jsonl"))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from simple_typing_application.utils.lru_cache import CacheInfo, LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache: LRUCache[int, int] = LRUCache(maxsize=3)
+    for key in [1, 2, 3, 1, 4]:
+        cache.get_or_compute(key, lambda x: x * 10)
+
+    assert 2 not in cache
+    assert all(key in cache for key in [1, 3, 4])
+    assert cache.info() == CacheInfo(hits=1, misses=4, maxsize=3, currsize=3)
+
+
+def test_lru_cache_does_not_cache_exception():
+    cache: LRUCache[str, int] = LRUCache()
+
+    def compute(key: str) -> int:
+        raise ValueError(key)
+
+    with pytest.raises(ValueError):
+        cache.get_or_compute("a", compute)
+    assert "a" not in cache
+    assert cache.get_or_compute("a", len) == 1
+
+
+def test_lru_cache_clear():
+    cache: LRUCache[str, int] = LRUCache()
+    cache.get_or_compute("a", len)
+    cache.get_or_compute("a", len)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.info() == CacheInfo(hits=0, misses=0, maxsize=4096, currsize=0)
+
+
+def test_lru_cache_thread_safety():
+    cache: LRUCache[int, int] = LRUCache(maxsize=16)
+    keys = [i % 32 for i in range(10000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        values = list(executor.map(lambda key: cache.get_or_compute(key, lambda x: x * 2), keys))
+
+    info = cache.info()
+    assert values == [key * 2 for key in keys]
+    assert info.hits + info.misses == len(keys)
+    assert info.currsize <= 16
+
+
+def test_lru_cache_invalid_maxsize():
+    with pytest.raises(ValueError):
+        LRUCache(maxsize=0)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from simple_typing_application.utils.rate_limiter import RateLimiter
+
+
+def test_rate_limiter_spaces_operations(mocker):
+    mocker.patch("simple_typing_application.utils.rate_limiter.time.monotonic", return_value=100.0)
+    mock_sleep = mocker.patch("simple_typing_application.utils.rate_limiter.time.sleep")
+    limiter = RateLimiter(1.0)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    # NOTE: the first operation starts immediately.
+    assert [args[0] for args, _ in mock_sleep.call_args_list] == [1.0, 2.0]
+
+
+def test_rate_limiter_does_not_wait_after_idle_period(mocker):
+    mock_monotonic = mocker.patch("simple_typing_application.utils.rate_limiter.time.monotonic", return_value=100.0)
+    mock_sleep = mocker.patch("simple_typing_application.utils.rate_limiter.time.sleep")
+    limiter = RateLimiter(1.0)
+
+    limiter.acquire()
+    mock_monotonic.return_value = 100.4
+    limiter.acquire()
+    mock_monotonic.return_value = 105.0
+    limiter.acquire()
+
+    assert [args[0] for args, _ in mock_sleep.call_args_list] == [pytest.approx(0.6)]
+
+
+def test_rate_limiter_is_shared_among_threads_and_event_loops(mocker):
+    mocker.patch("simple_typing_application.utils.rate_limiter.time.monotonic", return_value=100.0)
+    mock_sleep = mocker.patch("simple_typing_application.utils.rate_limiter.time.sleep")
+    mock_asleep = mocker.patch("simple_typing_application.utils.rate_limiter.asyncio.sleep")
+    limiter = RateLimiter(1.0)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: limiter.acquire(), range(4)))
+    asyncio.run(limiter.acquire_async())
+
+    assert sorted(args[0] for args, _ in mock_sleep.call_args_list) == [1.0, 2.0, 3.0]
+    mock_asleep.assert_awaited_once_with(4.0)
+
+
+def test_rate_limiter_stops_waiting_when_cancelled(mocker):
+    mocker.patch("simple_typing_application.utils.rate_limiter.time.monotonic", return_value=100.0)
+    mock_sleep = mocker.patch("simple_typing_application.utils.rate_limiter.time.sleep")
+    cancel_event = mocker.MagicMock(spec=Event)
+    limiter = RateLimiter(1.0)
+
+    limiter.acquire(cancel_event)
+    limiter.acquire(cancel_event)
+
+    # NOTE: the first operation starts immediately, and the second one waits on the event instead of sleeping.
+    cancel_event.wait.assert_called_once_with(1.0)
+    mock_sleep.assert_not_called()
+
+
+def test_rate_limiter_without_interval(mocker):
+    mock_sleep = mocker.patch("simple_typing_application.utils.rate_limiter.time.sleep")
+    limiter = RateLimiter(0.0)
+    for _ in range(3):
+        limiter.acquire()
+    mock_sleep.assert_not_called()
+
+
+def test_rate_limiter_invalid_interval():
+    with pytest.raises(ValueError):
+        RateLimiter(-1.0)